@@ -241,6 +241,10 @@ class ArbBot:
             recovery_config=RecoveryConfig(),
         )
         self.executor.recovery.alerter = self.alerter
+        # Optional: persist replay-protection state across restarts
+        self.replay_state_path = config.get("replay_state_path") or os.getenv(
+            "REPLAY_STATE_PATH"
+        )
 
         # ── Stretch Goal 3: Priority Queue ────────────────────
         pq_cfg = PriorityQueueConfig(
@@ -291,6 +295,16 @@ class ArbBot:
         self.metrics_server.start()
 
         await self._sync_balances()
+        if self.replay_state_path and os.path.exists(self.replay_state_path):
+            try:
+                loaded = self.executor.replay_protection.load(self.replay_state_path)
+                logging.info("Restored %d replay-protection entries", loaded)
+            except Exception as exc:
+                logging.warning("Replay state restore failed: %s", exc)
+        try:
+            await self.executor.warmup()
+        except Exception as exc:
+            logging.warning("Executor warmup failed: %s", exc)
 
         kill_logged = False
 
@@ -547,6 +561,11 @@ class ArbBot:
 
     def stop(self):
         self.running = False
+        if self.replay_state_path:
+            try:
+                self.executor.replay_protection.save(self.replay_state_path)
+            except Exception as exc:
+                logging.warning("Replay state save failed: %s", exc)
         self.alerter.stop()
         self.metrics_server.stop()
 
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Compare FailureClassifier strategies on uncached error strings.
+
+Prints the per-message cost of the per-pattern loop used by
+``executor.recovery`` against two single-regex alternatives:
+
+* ``lookahead``: one ``(?=.*?(p))`` alternative per pattern, tried in order
+* ``alternation``: ``(p0)|(p1)|...`` scanned with ``finditer``, keeping the
+  highest-priority group seen
+
+All three return the same category for every sample.
+"""
+
+import re
+import sys
+import timeit
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from executor.recovery import _PATTERNS, FailureCategory  # noqa: E402
+
+_CATEGORIES = tuple(category for _, category in _PATTERNS)
+_LOOKAHEAD = re.compile(
+    "|".join(f"(?=.*?({pattern.pattern}))" for pattern, _ in _PATTERNS), re.I | re.S
+)
+_ALTERNATION = re.compile(
+    "|".join(f"({pattern.pattern})" for pattern, _ in _PATTERNS), re.I
+)
+
+_PAD = "x" * 200
+_SAMPLES = [
+    "Request timeout after 5s",
+    "HTTP 429 Too Many Requests",
+    "execution reverted: insufficient output amount",
+    "ECONNREFUSED 127.0.0.1:8545",
+    "something odd happened " + _PAD,
+    _PAD + " network unreachable " + _PAD,
+    "nonce too low: rate limit " + _PAD,
+]
+
+
+def per_pattern(error: str) -> FailureCategory:
+    for pattern, category in _PATTERNS:
+        if pattern.search(error):
+            return category
+    return FailureCategory.UNKNOWN
+
+
+def lookahead(error: str) -> FailureCategory:
+    match = _LOOKAHEAD.match(error)
+    if match is None:
+        return FailureCategory.UNKNOWN
+    return _CATEGORIES[match.lastindex - 1]
+
+
+def alternation(error: str) -> FailureCategory:
+    best = None
+    for match in _ALTERNATION.finditer(error):
+        if best is None or match.lastindex < best:
+            best = match.lastindex
+    return FailureCategory.UNKNOWN if best is None else _CATEGORIES[best - 1]
+
+
+def main() -> None:
+    strategies = (per_pattern, lookahead, alternation)
+    for error in _SAMPLES:
+        assert len({strategy(error) for strategy in strategies}) == 1, error
+    for strategy in strategies:
+        best = min(
+            timeit.repeat(
+                lambda: [strategy(error) for error in _SAMPLES], number=2000, repeat=5
+            )
+        )
+        per_call_us = best / 2000 / len(_SAMPLES) * 1e6
+        print(f"{strategy.__name__:12s} {per_call_us:6.2f} us/message")
+
+
+if __name__ == "__main__":
+    main()
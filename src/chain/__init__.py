@@ -7,10 +7,12 @@ from .errors import (
     RPCError,
     TransactionFailed,
 )
+from .flashbots import FlashbotsRelay
 from .transaction_builder import TransactionBuilder
 
 __all__ = [
     "ChainClient",
+    "FlashbotsRelay",
     "GasPrice",
     "TransactionBuilder",
     "ChainError",
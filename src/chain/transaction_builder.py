@@ -9,7 +9,7 @@ from eth_account.datastructures import SignedTransaction
 from core.base_types import Address, TokenAmount, TransactionReceipt, TransactionRequest
 from core.wallet_manager import WalletManager
 
-from .client import ChainClient
+from .client import ChainClient, GasPrice
 
 
 @dataclass
@@ -79,9 +79,16 @@ class TransactionBuilder:
         self._state.gas_limit = int(estimate * buffer)
         return self
 
-    def with_gas_price(self, priority: str = "medium") -> "TransactionBuilder":
-        """Set gas price based on current network conditions."""
-        gas = self._client.get_gas_price()
+    def with_gas_price(
+        self, priority: str = "medium", gas: GasPrice | None = None
+    ) -> "TransactionBuilder":
+        """
+        Set gas price based on current network conditions.
+
+        Pass a recently fetched *gas* snapshot to skip the RPC round-trip.
+        """
+        if gas is None:
+            gas = self._client.get_gas_price()
         self._state.max_priority_fee = {
             "low": gas.priority_fee_low,
             "medium": gas.priority_fee_medium,
@@ -8,6 +8,9 @@ from typing import Optional
 
 from eth_utils.address import is_address, to_checksum_address
 
+# Largest uint256; the "unlimited" ERC-20 approval amount.
+MAX_UINT256 = 2**256 - 1
+
 
 @dataclass(frozen=True)
 class Address:
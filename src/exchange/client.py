@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+import threading
 import time
 from collections import deque
 from decimal import Decimal
@@ -24,16 +25,20 @@ class RateLimiter:
         self._events: deque[tuple[float, int]] = deque()
         self._time_fn = time_fn or time.monotonic
         self._sleep_fn = sleep_fn or time.sleep
+        # Guards _events: callers share one client across threads.  The wait
+        # happens outside the lock so other threads can still take budget.
+        self._lock = threading.Lock()
 
     def acquire(self, weight: int) -> None:
         while True:
-            now = self._time_fn()
-            self._expire_old(now)
-            current_weight = sum(event_weight for _, event_weight in self._events)
-            if current_weight + weight <= self._max_weight:
-                self._events.append((now, weight))
-                return
-            sleep_for = (self._events[0][0] + self._window_seconds) - now
+            with self._lock:
+                now = self._time_fn()
+                self._expire_old(now)
+                current_weight = sum(event_weight for _, event_weight in self._events)
+                if current_weight + weight <= self._max_weight:
+                    self._events.append((now, weight))
+                    return
+                sleep_for = (self._events[0][0] + self._window_seconds) - now
             if sleep_for > 0:
                 self._sleep_fn(sleep_for)
 
@@ -22,7 +22,7 @@ from eth_utils import keccak
 
 from chain import ChainClient
 from chain.transaction_builder import TransactionBuilder
-from core.base_types import Address, TokenAmount, TransactionRequest
+from core.base_types import MAX_UINT256, Address, TokenAmount, TransactionRequest
 from core.wallet_manager import WalletManager
 from pricing.odos_client import OdosClient
 
@@ -32,6 +32,16 @@ ARBITRUM_CHAIN_ID = 42161
 UNISWAP_V3_SWAP_ROUTER = "0xE592427A0AEce92De3Edee1F18E0157C05861564"
 V3_DIRECT_GAS_LIMIT = 200_000
 
+# 4-byte selectors, hashed once at import rather than on every swap.
+_EXACT_INPUT_SINGLE_SELECTOR = keccak(
+    text=(
+        "exactInputSingle((address,address,uint24,address,"
+        "uint256,uint256,uint256,uint160))"
+    )
+)[:4]
+_ALLOWANCE_SELECTOR = keccak(text="allowance(address,address)")[:4]
+_APPROVE_SELECTOR = keccak(text="approve(address,uint256)")[:4]
+
 
 class V3FailReason(Enum):
     """Why a V3 direct swap failed — determines whether ODOS fallback is safe."""
@@ -181,13 +191,6 @@ class DexSwapManager:
         amount_out_minimum = 1  # Minimal check; fallback to ODOS if V3 fails
         sqrt_price_limit_x96 = 0  # No price limit
 
-        selector = keccak(
-            text=(
-                "exactInputSingle((address,address,uint24,address,"
-                "uint256,uint256,uint256,uint160))"
-            )
-        )[:4]
-
         params = abi_encode(
             ["(address,address,uint24,address,uint256,uint256,uint256,uint160)"],
             [
@@ -203,7 +206,7 @@ class DexSwapManager:
                 )
             ],
         )
-        calldata = selector + params
+        calldata = _EXACT_INPUT_SINGLE_SELECTOR + params
 
         # 3. Send transaction
         try:
@@ -395,8 +398,7 @@ class DexSwapManager:
         min_amount: int,
     ) -> None:
         """Approve spender if current allowance is below min_amount."""
-        selector = keccak(text="allowance(address,address)")[:4]
-        calldata = selector + abi_encode(
+        calldata = _ALLOWANCE_SELECTOR + abi_encode(
             ["address", "address"], [owner.checksum, spender.checksum]
         )
         call = TransactionRequest(
@@ -411,10 +413,8 @@ class DexSwapManager:
         if current >= min_amount:
             return
 
-        max_uint256 = 2**256 - 1
-        approve_sel = keccak(text="approve(address,uint256)")[:4]
-        approve_data = approve_sel + abi_encode(
-            ["address", "uint256"], [spender.checksum, max_uint256]
+        approve_data = _APPROVE_SELECTOR + abi_encode(
+            ["address", "uint256"], [spender.checksum, MAX_UINT256]
         )
         receipt = (
             TransactionBuilder(self._client, self._wallet)
@@ -11,12 +11,33 @@ from eth_utils import keccak
 
 from chain import ChainClient, TransactionBuilder
 from config import get_env
-from core.base_types import Address, TokenAmount, TransactionRequest
+from core.base_types import MAX_UINT256, Address, TokenAmount, TransactionRequest
 from core.wallet_manager import WalletManager
 from pricing.uniswap_v3_math import TickRange, single_tick_range
 
 logger = logging.getLogger(__name__)
 
+# 4-byte selectors, hashed once at import rather than on every call.
+_POSITIONS_SELECTOR = keccak(text="positions(uint256)")[:4]
+_DECREASE_LIQUIDITY_SELECTOR = keccak(
+    text="decreaseLiquidity((uint256,uint128,uint256,uint256,uint256))"
+)[:4]
+_COLLECT_SELECTOR = keccak(text="collect((uint256,address,uint128,uint128))")[:4]
+_MINT_SELECTOR = keccak(
+    text=(
+        "mint((address,address,uint24,int24,int24,uint256,uint256,"
+        "uint256,uint256,address,uint256))"
+    )
+)[:4]
+_GET_POOL_SELECTOR = keccak(text="getPool(address,address,uint24)")[:4]
+_TOKEN0_SELECTOR = keccak(text="token0()")[:4]
+_TOKEN1_SELECTOR = keccak(text="token1()")[:4]
+_FEE_SELECTOR = keccak(text="fee()")[:4]
+_SLOT0_SELECTOR = keccak(text="slot0()")[:4]
+_ALLOWANCE_SELECTOR = keccak(text="allowance(address,address)")[:4]
+_APPROVE_SELECTOR = keccak(text="approve(address,uint256)")[:4]
+_TRANSFER_TOPIC0 = f"0x{keccak(text='Transfer(address,address,uint256)').hex()}"
+
 
 @dataclass
 class V3PoolConfig:
@@ -129,7 +150,7 @@ class UniswapV3RangeOrderManager:
         Inspect position via NonfungiblePositionManager.positions(tokenId).
         """
         data = self._encode_call(
-            "positions(uint256)",
+            _POSITIONS_SELECTOR,
             ["uint256"],
             [token_id],
         )
@@ -208,7 +229,7 @@ class UniswapV3RangeOrderManager:
             deadline,
         )
         dec_calldata = self._encode_call(
-            "decreaseLiquidity((uint256,uint128,uint256,uint256,uint256))",
+            _DECREASE_LIQUIDITY_SELECTOR,
             ["(uint256,uint128,uint256,uint256,uint256)"],
             [dec_params],
         )
@@ -231,7 +252,7 @@ class UniswapV3RangeOrderManager:
             max_uint128,
         )
         collect_calldata = self._encode_call(
-            "collect((uint256,address,uint128,uint128))",
+            _COLLECT_SELECTOR,
             ["(uint256,address,uint128,uint128)"],
             [collect_params],
         )
@@ -332,15 +353,11 @@ class UniswapV3RangeOrderManager:
             deadline,
         )
 
-        mint_sig = (
-            "mint((address,address,uint24,int24,int24,uint256,uint256,"
-            "uint256,uint256,address,uint256))"
-        )
         mint_type = (
             "(address,address,uint24,int24,int24,uint256,uint256,"
             "uint256,uint256,address,uint256)"
         )
-        calldata = self._encode_call(mint_sig, [mint_type], [mint_params])
+        calldata = self._encode_call(_MINT_SELECTOR, [mint_type], [mint_params])
 
         receipt = (
             TransactionBuilder(self._client, self._wallet)
@@ -371,8 +388,6 @@ class UniswapV3RangeOrderManager:
         zero_address_topic = (
             "0x0000000000000000000000000000000000000000000000000000000000000000"
         )
-        transfer_sig = keccak(text="Transfer(address,address,uint256)").hex()
-        transfer_topic0 = f"0x{transfer_sig}"
 
         for log in getattr(receipt, "logs", []):
             try:
@@ -380,7 +395,7 @@ class UniswapV3RangeOrderManager:
                 if address != self._position_manager.checksum.lower():
                     continue
                 topics = [str(t) for t in (log.get("topics") or [])]
-                if not topics or topics[0].lower() != transfer_topic0.lower():
+                if not topics or topics[0].lower() != _TRANSFER_TOPIC0:
                     continue
                 if len(topics) < 3:
                     continue
@@ -425,7 +440,7 @@ class UniswapV3RangeOrderManager:
         b = token1.checksum
         t0, t1 = (a, b) if a.lower() < b.lower() else (b, a)
         data = self._encode_call(
-            "getPool(address,address,uint24)",
+            _GET_POOL_SELECTOR,
             ["address", "address", "uint24"],
             [t0, t1, fee_tier],
         )
@@ -442,11 +457,11 @@ class UniswapV3RangeOrderManager:
         self, pool: Address, token0: Address, token1: Address, fee_tier: int
     ) -> bool:
         try:
-            raw0 = self._eth_call(pool, keccak(text="token0()")[:4])
+            raw0 = self._eth_call(pool, _TOKEN0_SELECTOR)
             (p0,) = abi_decode(["address"], raw0)
-            raw1 = self._eth_call(pool, keccak(text="token1()")[:4])
+            raw1 = self._eth_call(pool, _TOKEN1_SELECTOR)
             (p1,) = abi_decode(["address"], raw1)
-            raw_fee = self._eth_call(pool, keccak(text="fee()")[:4])
+            raw_fee = self._eth_call(pool, _FEE_SELECTOR)
             (pfee,) = abi_decode(["uint24"], raw_fee)
             pool_tokens = {Address.from_string(p0).lower, Address.from_string(p1).lower}
             wanted_tokens = {token0.lower, token1.lower}
@@ -458,11 +473,10 @@ class UniswapV3RangeOrderManager:
         """
         Read slot0() from a V3 pool and return the current tick.
         """
-        selector = keccak(text="slot0()")[:4]
         tx = TransactionRequest(
             to=pool,
             value=TokenAmount(raw=0, decimals=18, symbol="ETH"),
-            data=selector,
+            data=_SLOT0_SELECTOR,
             chain_id=self._chain_id,
         )
         raw = self._client.call(tx)
@@ -488,8 +502,7 @@ class UniswapV3RangeOrderManager:
         spender: Address,
         min_amount: int,
     ) -> None:
-        selector = keccak(text="allowance(address,address)")[:4]
-        calldata = selector + abi_encode(
+        calldata = _ALLOWANCE_SELECTOR + abi_encode(
             ["address", "address"], [owner.checksum, spender.checksum]
         )
         call = TransactionRequest(
@@ -503,11 +516,10 @@ class UniswapV3RangeOrderManager:
         if current_allowance >= min_amount:
             return
 
-        max_uint256 = 2**256 - 1
         approve_data = self._encode_call(
-            "approve(address,uint256)",
+            _APPROVE_SELECTOR,
             ["address", "uint256"],
-            [spender.checksum, max_uint256],
+            [spender.checksum, MAX_UINT256],
         )
         receipt = (
             TransactionBuilder(self._client, self._wallet)
@@ -523,6 +535,5 @@ class UniswapV3RangeOrderManager:
             raise RuntimeError("Token approve transaction failed")
 
     @staticmethod
-    def _encode_call(signature: str, arg_types: list[str], args: list[Any]) -> bytes:
-        selector = keccak(text=signature)[:4]
+    def _encode_call(selector: bytes, arg_types: list[str], args: list[Any]) -> bytes:
         return selector + abi_encode(arg_types, args)
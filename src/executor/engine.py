@@ -22,82 +22,193 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import operator
 import os
+import struct
 import time
 from dataclasses import dataclass, field
 from decimal import Decimal
-from enum import Enum, auto
+from enum import IntEnum
+from functools import lru_cache
 from typing import Any, Optional
 
 from eth_abi import encode as abi_encode
 from eth_utils import keccak
 
-from chain import ChainClient, TransactionBuilder
-from core.base_types import Address, TokenAmount, TransactionRequest
+from chain import ChainClient, FlashbotsRelay, GasPrice, TransactionBuilder
+from chain.flashbots import RELAY_URLS
+from core.base_types import (
+    MAX_UINT256,
+    Address,
+    TokenAmount,
+    TransactionReceipt,
+    TransactionRequest,
+)
 from core.wallet_manager import WalletManager
 from executor.recovery import RecoveryConfig, RecoveryManager
 from strategy.signal import Direction, Signal
 
 logger = logging.getLogger(__name__)
 
+# ── ABI ──────────────────────────────────────────────────────────
+
+_SIG_SWAP_ETH_FOR_TOKENS = "swapExactETHForTokens(uint256,address[],address,uint256)"
+_TYPES_SWAP_ETH_FOR_TOKENS = ("uint256", "address[]", "address", "uint256")
+_SIG_SWAP_TOKENS_FOR_ETH = (
+    "swapTokensForExactETH(uint256,uint256,address[],address,uint256)"
+)
+_TYPES_SWAP_TOKENS_FOR_ETH = ("uint256", "uint256", "address[]", "address", "uint256")
+_SIG_ALLOWANCE = "allowance(address,address)"
+_TYPES_ALLOWANCE = ("address", "address")
+_SIG_APPROVE = "approve(address,uint256)"
+_TYPES_APPROVE = ("address", "uint256")
+
+# 4-byte selectors, hashed once at import; unknown signatures are added lazily.
+_SELECTORS: dict[str, bytes] = {
+    sig: keccak(text=sig)[:4]
+    for sig in (
+        _SIG_SWAP_ETH_FOR_TOKENS,
+        _SIG_SWAP_TOKENS_FOR_ETH,
+        _SIG_ALLOWANCE,
+        _SIG_APPROVE,
+    )
+}
+
+
+@lru_cache(maxsize=64)
+def _allowance_calldata(owner_checksum: str, spender_checksum: str) -> bytes:
+    """``allowance(owner, spender)`` calldata; fixed per address pair."""
+    return _SELECTORS[_SIG_ALLOWANCE] + abi_encode(
+        _TYPES_ALLOWANCE, [owner_checksum, spender_checksum]
+    )
+
+
+@lru_cache(maxsize=64)
+def _approve_calldata(spender_checksum: str) -> bytes:
+    """``approve(spender, MAX_UINT256)`` calldata; fixed per spender."""
+    return _SELECTORS[_SIG_APPROVE] + abi_encode(
+        _TYPES_APPROVE, [spender_checksum, MAX_UINT256]
+    )
+
+
+_ZERO_HIGH_WORD = bytes(24)
+
+
+def _decode_uint256(raw: bytes) -> int:
+    """Decode an ABI ``uint256`` return; small values skip the bignum path."""
+    if len(raw) == 32 and raw[:24] == _ZERO_HIGH_WORD:
+        return struct.unpack_from(">Q", raw, 24)[0]
+    return int.from_bytes(raw, "big") if raw else 0
+
+
+# Fixed gas limits for bundled swaps; eth_callBundle catches out-of-gas
+# before anything is sent, so the per-swap eth_estimateGas can be skipped.
+_SWAP_GAS_LIMIT = 250_000
+_GAS_PRICE_TTL_NS = 3_000_000_000  # ~one block on L1 / Sepolia
+
+
+# ── Unit scaling ─────────────────────────────────────────────────
+
+_POW10 = tuple(10**i for i in range(37))
+_FLOAT_EXACT_LIMIT = float(1 << 53)
+
+
+def _scale_float(value: float, decimals: int) -> int:
+    """Scale *value* to integer base units (``value * 10**decimals``).
+
+    Uses float arithmetic while the scaled result stays within the range
+    where doubles represent integers exactly, and falls back to ``Decimal``
+    beyond it (e.g. most wei amounts).  Both paths round to the nearest
+    unit, ties to even, so the result does not depend on which one ran.
+    """
+    scaled = value * _POW10[decimals]
+    if -_FLOAT_EXACT_LIMIT < scaled < _FLOAT_EXACT_LIMIT:
+        return round(scaled)
+    return round(Decimal(str(value)) * _POW10[decimals])
+
+
 # ── States & Transitions ─────────────────────────────────────────
 
 
-class ExecutorState(Enum):
-    IDLE = auto()
-    VALIDATING = auto()
-    LEG1_PENDING = auto()
-    LEG1_CONFIRMING = auto()
-    LEG1_FILLED = auto()
-    LEG2_PENDING = auto()
-    LEG2_CONFIRMING = auto()
-    LEG2_FILLED = auto()
-    DONE = auto()
-    FAILED = auto()
-    UNWINDING = auto()
+class ExecutorState(IntEnum):
+    # Explicit values keep serialized states stable across code changes.
+    IDLE = 0
+    VALIDATING = 1
+    LEG1_PENDING = 2
+    LEG1_CONFIRMING = 3
+    LEG1_FILLED = 4
+    LEG2_PENDING = 5
+    LEG2_CONFIRMING = 6
+    LEG2_FILLED = 7
+    DONE = 8
+    FAILED = 9
+    UNWINDING = 10
 
 
 # Allowed edges — any transition not listed here will raise.
-_VALID_TRANSITIONS: dict[ExecutorState, set[ExecutorState]] = {
-    ExecutorState.IDLE: {ExecutorState.VALIDATING, ExecutorState.FAILED},
-    ExecutorState.VALIDATING: {ExecutorState.LEG1_PENDING, ExecutorState.FAILED},
-    ExecutorState.LEG1_PENDING: {
-        ExecutorState.LEG1_CONFIRMING,
-        ExecutorState.LEG1_FILLED,
-        ExecutorState.FAILED,
-    },
-    ExecutorState.LEG1_CONFIRMING: {
-        ExecutorState.LEG1_FILLED,
-        ExecutorState.LEG1_PENDING,  # retry
-        ExecutorState.FAILED,
-    },
-    ExecutorState.LEG1_FILLED: {ExecutorState.LEG2_PENDING},
-    ExecutorState.LEG2_PENDING: {
-        ExecutorState.LEG2_CONFIRMING,
-        ExecutorState.LEG2_FILLED,
-        ExecutorState.UNWINDING,
-        ExecutorState.FAILED,
-    },
-    ExecutorState.LEG2_CONFIRMING: {
-        ExecutorState.LEG2_FILLED,
-        ExecutorState.LEG2_PENDING,  # retry
-        ExecutorState.UNWINDING,
-    },
-    ExecutorState.LEG2_FILLED: {ExecutorState.DONE},
-    ExecutorState.UNWINDING: {ExecutorState.FAILED},
-    ExecutorState.DONE: set(),
-    ExecutorState.FAILED: set(),
+_VALID_TRANSITIONS: dict[ExecutorState, frozenset[ExecutorState]] = {
+    ExecutorState.IDLE: frozenset({ExecutorState.VALIDATING, ExecutorState.FAILED}),
+    ExecutorState.VALIDATING: frozenset(
+        {ExecutorState.LEG1_PENDING, ExecutorState.FAILED}
+    ),
+    ExecutorState.LEG1_PENDING: frozenset(
+        {
+            ExecutorState.LEG1_CONFIRMING,
+            ExecutorState.LEG1_FILLED,
+            ExecutorState.FAILED,
+        }
+    ),
+    ExecutorState.LEG1_CONFIRMING: frozenset(
+        {
+            ExecutorState.LEG1_FILLED,
+            ExecutorState.LEG1_PENDING,  # retry
+            ExecutorState.FAILED,
+        }
+    ),
+    ExecutorState.LEG1_FILLED: frozenset({ExecutorState.LEG2_PENDING}),
+    ExecutorState.LEG2_PENDING: frozenset(
+        {
+            ExecutorState.LEG2_CONFIRMING,
+            ExecutorState.LEG2_FILLED,
+            ExecutorState.UNWINDING,
+            ExecutorState.FAILED,
+        }
+    ),
+    ExecutorState.LEG2_CONFIRMING: frozenset(
+        {
+            ExecutorState.LEG2_FILLED,
+            ExecutorState.LEG2_PENDING,  # retry
+            ExecutorState.UNWINDING,
+        }
+    ),
+    ExecutorState.LEG2_FILLED: frozenset({ExecutorState.DONE}),
+    ExecutorState.UNWINDING: frozenset({ExecutorState.FAILED}),
+    ExecutorState.DONE: frozenset(),
+    ExecutorState.FAILED: frozenset(),
 }
 
 
+_AUDIT_LEVELS = frozenset({"full", "errors_only", "off"})
+
+# States still audited when ``audit_level == "errors_only"``.
+_ERROR_STATES = frozenset({ExecutorState.UNWINDING, ExecutorState.FAILED})
+
+
 class InvalidTransition(Exception):
     """Raised when a state transition is not allowed."""
 
 
+def _check_audit_level(audit_level: str) -> None:
+    if audit_level not in _AUDIT_LEVELS:
+        raise ValueError(
+            f"audit_level must be one of {sorted(_AUDIT_LEVELS)}, got {audit_level!r}"
+        )
+
+
 # ── Event Log Entry ──────────────────────────────────────────────
 
 
-@dataclass
+@dataclass(slots=True)
 class StateEvent:
     """One row in the execution audit trail."""
 
@@ -118,7 +229,7 @@ class StateEvent:
 # ── Execution Metrics ────────────────────────────────────────────
 
 
-@dataclass
+@dataclass(slots=True)
 class ExecutionMetrics:
     """Latency and quality measurements for one execution."""
 
@@ -135,13 +246,46 @@ class ExecutionMetrics:
     unwind_success: Optional[bool] = None
 
     def to_dict(self) -> dict:
-        return {k: v for k, v in self.__dict__.items() if v is not None}
+        # Straight-line on purpose: called for every summary(), and the
+        # field set is small and fixed.  Counters/flags are never None.
+        d: dict = {}
+        if self.leg1_latency_ms is not None:
+            d["leg1_latency_ms"] = self.leg1_latency_ms
+        if self.leg2_latency_ms is not None:
+            d["leg2_latency_ms"] = self.leg2_latency_ms
+        if self.total_latency_ms is not None:
+            d["total_latency_ms"] = self.total_latency_ms
+        if self.leg1_slippage_bps is not None:
+            d["leg1_slippage_bps"] = self.leg1_slippage_bps
+        if self.leg2_slippage_bps is not None:
+            d["leg2_slippage_bps"] = self.leg2_slippage_bps
+        if self.leg1_fill_ratio is not None:
+            d["leg1_fill_ratio"] = self.leg1_fill_ratio
+        if self.leg2_fill_ratio is not None:
+            d["leg2_fill_ratio"] = self.leg2_fill_ratio
+        d["leg1_retries"] = self.leg1_retries
+        d["leg2_retries"] = self.leg2_retries
+        d["unwind_attempted"] = self.unwind_attempted
+        if self.unwind_success is not None:
+            d["unwind_success"] = self.unwind_success
+        return d
+
+
+# Leg 2 minus leg 1 price is profit when buying on the CEX, loss otherwise.
+_DIRECTION_SIGN = {Direction.BUY_CEX_SELL_DEX: 1.0, Direction.BUY_DEX_SELL_CEX: -1.0}
+
+
+def _slippage_bps(expected: float, actual: float) -> float:
+    """Slippage in basis points (positive = worse than expected)."""
+    if expected == 0:
+        return 0.0
+    return round(abs(actual - expected) / expected * 10_000, 2)
 
 
 # ── Execution Context ────────────────────────────────────────────
 
 
-@dataclass
+@dataclass(slots=True)
 class ExecutionContext:
     """Full context for a single execution attempt."""
 
@@ -153,18 +297,19 @@ class ExecutionContext:
     leg1_order_id: Optional[str] = None
     leg1_fill_price: Optional[float] = None
     leg1_fill_size: Optional[float] = None
-    leg1_started_at: Optional[float] = None
+    leg1_started_ns: Optional[int] = None  # monotonic
 
     # Leg 2
     leg2_venue: str = ""
     leg2_tx_hash: Optional[str] = None
     leg2_fill_price: Optional[float] = None
     leg2_fill_size: Optional[float] = None
-    leg2_started_at: Optional[float] = None
+    leg2_started_ns: Optional[int] = None  # monotonic
 
-    # Timing
+    # Timing — wall-clock for the audit trail, monotonic ns for latency
     started_at: float = field(default_factory=time.time)
     finished_at: Optional[float] = None
+    started_ns: int = field(default_factory=time.monotonic_ns)
 
     # Results
     actual_pnl: Optional[float] = None
@@ -175,26 +320,76 @@ class ExecutionContext:
     # Audit trail
     events: list[StateEvent] = field(default_factory=list)
     metrics: ExecutionMetrics = field(default_factory=ExecutionMetrics)
+    audit_level: str = "full"  # "full" | "errors_only" | "off"
+
+    def __post_init__(self) -> None:
+        _check_audit_level(self.audit_level)
 
     # ── transition helper ─────────────────────────────────────
 
-    def transition(self, new_state: ExecutorState, detail: str = "") -> None:
+    def transition(
+        self,
+        new_state: ExecutorState,
+        detail: str = "",
+        ts: Optional[float] = None,
+    ) -> None:
         """
         Move to *new_state* if the edge is allowed; raise otherwise.
 
-        Every transition is appended to ``self.events``.
+        Transitions are appended to ``self.events`` according to
+        ``audit_level``: ``"full"`` records every edge, ``"errors_only"``
+        only UNWINDING / FAILED, ``"off"`` none.  The edge is validated
+        in every mode.  Callers that already hold a fresh timestamp can
+        pass it as *ts* to avoid an extra clock read.
         """
-        allowed = _VALID_TRANSITIONS.get(self.state, set())
-        if new_state not in allowed:
+        # Every state has an entry (terminal states map to an empty set).
+        if new_state not in _VALID_TRANSITIONS[self.state]:
             raise InvalidTransition(f"{self.state.name} → {new_state.name} not allowed")
-        event = StateEvent(
-            from_state=self.state,
-            to_state=new_state,
-            detail=detail,
-        )
-        self.events.append(event)
+        audit_level = self.audit_level
+        if audit_level == "full" or (
+            audit_level == "errors_only" and new_state in _ERROR_STATES
+        ):
+            self.events.append(
+                StateEvent(
+                    from_state=self.state,
+                    to_state=new_state,
+                    timestamp=time.time() if ts is None else ts,
+                    detail=detail,
+                )
+            )
         self.state = new_state
 
+    def wall_time(self, now_ns: int) -> float:
+        """Wall-clock timestamp for monotonic *now_ns*, anchored at start."""
+        return self.started_at + (now_ns - self.started_ns) / 1_000_000_000
+
+    def record_fill(
+        self, leg: int, result: dict, expected_price: float, now_ns: int
+    ) -> None:
+        """
+        Store a successful leg result (fill, latency, slippage) on the context.
+
+        *leg* is 1 or 2; leg 1 keeps the venue order id, leg 2 the tx
+        hash and its fill ratio against the leg-1 size.
+        """
+        price = result["price"]
+        filled = result["filled"]
+        metrics = self.metrics
+        slippage = _slippage_bps(expected_price, price)
+        if leg == 1:
+            self.leg1_fill_price = price
+            self.leg1_fill_size = filled
+            self.leg1_order_id = result.get("order_id")
+            metrics.leg1_latency_ms = (now_ns - self.leg1_started_ns) / 1_000_000
+            metrics.leg1_slippage_bps = slippage
+        else:
+            self.leg2_fill_price = price
+            self.leg2_fill_size = filled
+            self.leg2_tx_hash = result.get("tx_hash")
+            metrics.leg2_latency_ms = (now_ns - self.leg2_started_ns) / 1_000_000
+            metrics.leg2_fill_ratio = filled / self.leg1_fill_size
+            metrics.leg2_slippage_bps = slippage
+
     @property
     def duration_ms(self) -> Optional[float]:
         if self.finished_at is None:
@@ -203,30 +398,84 @@ class ExecutionContext:
 
     def summary(self) -> dict:
         """Compact dict for logging / persistence."""
-        return {
-            "signal_id": self.signal.signal_id,
-            "pair": self.signal.pair,
-            "direction": self.signal.direction.value,
-            "state": self.state.name,
-            "leg1_venue": self.leg1_venue,
-            "leg1_fill_price": self.leg1_fill_price,
-            "leg1_fill_size": self.leg1_fill_size,
-            "leg2_venue": self.leg2_venue,
-            "leg2_fill_price": self.leg2_fill_price,
-            "leg2_fill_size": self.leg2_fill_size,
-            "leg2_tx_hash": self.leg2_tx_hash,
-            "actual_net_pnl": self.actual_net_pnl,
-            "error": self.error,
-            "duration_ms": self.duration_ms,
-            "metrics": self.metrics.to_dict(),
-            "events": [e.to_dict() for e in self.events],
-        }
+        d = dict(zip(_SUMMARY_KEYS, _SUMMARY_GETTER(self)))
+        d["metrics"] = self.metrics.to_dict()
+        d["events"] = [e.to_dict() for e in self.events]
+        return d
+
+
+# summary() key → attribute path; read in one C-level attrgetter call.
+_SUMMARY_FIELDS: tuple[tuple[str, str], ...] = (
+    ("signal_id", "signal.signal_id"),
+    ("pair", "signal.pair"),
+    ("direction", "signal.direction.value"),
+    ("state", "state.name"),
+    ("leg1_venue", "leg1_venue"),
+    ("leg1_fill_price", "leg1_fill_price"),
+    ("leg1_fill_size", "leg1_fill_size"),
+    ("leg2_venue", "leg2_venue"),
+    ("leg2_fill_price", "leg2_fill_price"),
+    ("leg2_fill_size", "leg2_fill_size"),
+    ("leg2_tx_hash", "leg2_tx_hash"),
+    ("actual_net_pnl", "actual_net_pnl"),
+    ("error", "error"),
+    ("duration_ms", "duration_ms"),
+)
+_SUMMARY_KEYS = tuple(key for key, _ in _SUMMARY_FIELDS)
+_SUMMARY_GETTER = operator.attrgetter(*(path for _, path in _SUMMARY_FIELDS))
+
+
+# ── Leg Specs ────────────────────────────────────────────────────
+
+
+@dataclass(frozen=True, slots=True)
+class _LegSpec:
+    """Static per-venue parameters for one leg of an execution flow."""
+
+    venue: str
+    label: str
+    method: str  # Executor coroutine: (signal, size) -> result dict
+    price_attr: str  # Signal field holding the expected price
+    timeout_attr: str  # ExecutorConfig timeout field
+    retries_attr: str  # ExecutorConfig max-retries field
+    check_fill_ratio: bool  # enforce min_fill_ratio when this venue goes first
+    first_fail_prefix: str  # ctx.error prefix when this venue fails as leg 1
+    start_detail: str
+    filled_detail: str
+
+
+_CEX_LEG = _LegSpec(
+    venue="cex",
+    label="CEX",
+    method="_execute_cex_leg",
+    price_attr="cex_price",
+    timeout_attr="leg1_timeout",
+    retries_attr="max_leg1_retries",
+    check_fill_ratio=True,
+    first_fail_prefix="",
+    start_detail="Starting CEX leg",
+    filled_detail="CEX leg filled",
+)
+_DEX_LEG = _LegSpec(
+    venue="dex",
+    label="DEX",
+    method="_execute_dex_leg",
+    price_attr="dex_price",
+    timeout_attr="leg2_timeout",
+    retries_attr="max_leg2_retries",
+    check_fill_ratio=False,
+    first_fail_prefix="DEX failed (no cost via Flashbots): ",
+    start_detail="Starting DEX leg",
+    filled_detail="DEX leg filled",
+)
+_CEX_FIRST = (_CEX_LEG, _DEX_LEG)
+_DEX_FIRST = (_DEX_LEG, _CEX_LEG)
 
 
 # ── Executor Config ──────────────────────────────────────────────
 
 
-@dataclass
+@dataclass(slots=True)
 class ExecutorConfig:
     # Timeouts
     leg1_timeout: float = 5.0
@@ -245,6 +494,10 @@ class ExecutorConfig:
 
     # Simulation
     simulation_mode: bool = True
+    fast_simulation: bool = False  # skip simulated latency + timeout wrapper
+
+    # Audit trail: "full" | "errors_only" | "off" (backtests/replays)
+    audit_level: str = "full"
 
     # DEX on-chain parameters
     dex_chain_id: int = 11155111
@@ -256,6 +509,10 @@ class ExecutorConfig:
     dex_weth_address: Optional[str] = None
     dex_quote_token_address: Optional[str] = None
     dex_private_key: Optional[str] = None
+    flashbots_relay_url: Optional[str] = None  # default: public relay for chain
+
+    def __post_init__(self) -> None:
+        _check_audit_level(self.audit_level)
 
 
 # ── Executor ─────────────────────────────────────────────────────
@@ -282,6 +539,11 @@ class Executor:
         self.pricing = pricing_module
         self.inventory = inventory_tracker
         self.config = config or ExecutorConfig()
+        # Fast-simulated legs return immediately, so they skip the per-leg
+        # timeout scope (and its timer handle) entirely.
+        self._needs_timeout = not (
+            self.config.simulation_mode and self.config.fast_simulation
+        )
 
         self.recovery = RecoveryManager(recovery_config)
         # Convenience aliases so existing code keeps working
@@ -289,6 +551,23 @@ class Executor:
         self.replay_protection = self.recovery.replay
         self._dex_client: Optional[ChainClient] = None
         self._dex_wallet: Optional[WalletManager] = None
+        self._flashbots: Optional[FlashbotsRelay] = None
+        self._gas_price: Optional[GasPrice] = None
+        self._gas_price_ns: int = 0
+        self._wallet_addr: Optional[Address] = None
+        self._router_addr: Optional[Address] = None
+        # Router swap paths, fixed once the DEX config is resolved
+        self._sell_path: tuple[str, ...] = ()  # WETH -> quote token
+        self._buy_path: tuple[str, ...] = ()  # quote token -> WETH
+        self._quote_token_addr: Optional[Address] = None
+        # Per-swap constants derived from config once the DEX is ready
+        self._deadline_secs: int = 0
+        self._sell_keep_bps: int = 10_000
+        self._buy_pay_bps: int = 10_000
+        # signal_id -> result of the execution currently running for it
+        self._inflight: dict[str, asyncio.Future[ExecutionContext]] = {}
+        # (token, owner, spender) -> last known allowance, in token units
+        self._allowance_cache: dict[tuple[str, str, str], int] = {}
 
         # Aggregate metrics
         self._total_executions: int = 0
@@ -304,37 +583,62 @@ class Executor:
 
         Returns an ``ExecutionContext`` with final state, metrics,
         and a full event log regardless of outcome.
+
+        Concurrent calls for the same ``signal_id`` share one execution:
+        later callers await the in-flight result instead of trading again.
         """
-        ctx = ExecutionContext(signal=signal)
-        self._total_executions += 1
+        key = signal.signal_id
+        pending = self._inflight.get(key)
+        if pending is not None:
+            return await asyncio.shield(pending)
 
-        # ── pre-flight gates (delegated to RecoveryManager) ──
-        allowed, reason = self.recovery.pre_flight(signal)
-        if not allowed:
-            ctx.transition(ExecutorState.FAILED, reason)
-            ctx.error = reason
-            ctx.finished_at = time.time()
-            self._failed += 1
+        fut: asyncio.Future[ExecutionContext] = (
+            asyncio.get_running_loop().create_future()
+        )
+        self._inflight[key] = fut
+        try:
+            ctx = await self._execute_signal(signal)
+        except BaseException as exc:
+            if isinstance(exc, Exception):
+                fut.set_exception(exc)
+                fut.exception()  # retrieved here; waiters re-raise it
+            else:
+                fut.cancel()
+            raise
+        else:
+            fut.set_result(ctx)
             return ctx
+        finally:
+            del self._inflight[key]
+
+    async def _execute_signal(self, signal: Signal) -> ExecutionContext:
+        now = time.time()
+        ctx = ExecutionContext(
+            signal=signal,
+            started_at=now,
+            started_ns=time.monotonic_ns(),
+            audit_level=self.config.audit_level,
+        )
+        self._total_executions += 1
 
-        ctx.transition(ExecutorState.VALIDATING, "Pre-flight checks")
-
-        if not signal.is_valid():
-            ctx.transition(ExecutorState.FAILED, "Signal invalid")
-            ctx.error = "Signal invalid"
-            ctx.finished_at = time.time()
+        # ── pre-flight gates ──────────────────────────────────
+        error = self._preflight(ctx, signal, now)
+        if error is not None:
+            ctx.transition(ExecutorState.FAILED, error, ts=now)
+            ctx.error = error
+            ctx.finished_at = now
             self._failed += 1
             return ctx
 
         # ── execute legs ──────────────────────────────────────
-        if self.config.use_flashbots:
-            ctx = await self._execute_dex_first(ctx)
-        else:
-            ctx = await self._execute_cex_first(ctx)
+        order = _DEX_FIRST if self.config.use_flashbots else _CEX_FIRST
+        ctx = await self._execute_flow(ctx, order)
 
         # ── record result ─────────────────────────────────────
-        ctx.finished_at = time.time()
-        ctx.metrics.total_latency_ms = ctx.duration_ms
+        now_ns = time.monotonic_ns()
+        ctx.finished_at = ctx.wall_time(now_ns)
+        duration_ms = (now_ns - ctx.started_ns) / 1_000_000
+        ctx.metrics.total_latency_ms = duration_ms
         net_pnl = ctx.actual_net_pnl or 0.0
 
         if ctx.state == ExecutorState.DONE:
@@ -345,15 +649,67 @@ class Executor:
             self.recovery.record_outcome(signal, False, ctx.error, pnl=net_pnl)
             self._failed += 1
 
-        logger.info(
-            "Execution %s  state=%s  pnl=%s  duration=%.0fms",
-            signal.signal_id,
-            ctx.state.name,
-            ctx.actual_net_pnl,
-            ctx.duration_ms or 0,
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Execution %s  state=%s  pnl=%s  duration=%.0fms",
+                signal.signal_id,
+                ctx.state.name,
+                ctx.actual_net_pnl,
+                duration_ms,
+            )
         return ctx
 
+    def _preflight(
+        self, ctx: ExecutionContext, signal: Signal, now: float
+    ) -> Optional[str]:
+        """
+        Run breaker/replay gates (via RecoveryManager) and signal validation.
+
+        Returns the rejection reason, or ``None`` when the signal may trade.
+        On success *ctx* is left in VALIDATING.
+        """
+        allowed, reason = self.recovery.pre_flight(signal)
+        if not allowed:
+            return reason
+        ctx.transition(ExecutorState.VALIDATING, "Pre-flight checks", ts=now)
+        if not signal.is_valid():
+            return "Signal invalid"
+        return None
+
+    async def warmup(self) -> None:
+        """
+        Connect the on-chain client before the first trade.
+
+        Creates the chain client / wallet, does a chain-id and nonce
+        round-trip and primes the ABI encoders, so the first live DEX
+        leg doesn't pay connection setup.  No-op in simulation mode.
+        """
+        if self.config.simulation_mode:
+            return
+        await asyncio.to_thread(self._warmup_dex)
+
+    def _warmup_dex(self) -> None:
+        self._ensure_dex_ready()
+        assert self._dex_client is not None
+        assert self._wallet_addr is not None
+        assert self._router_addr is not None
+        self._dex_client.get_chain_id()
+        self._dex_client.get_nonce(self._wallet_addr)
+        owner = self._wallet_addr.checksum
+        router = self._router_addr.checksum
+        _allowance_calldata(owner, router)
+        _approve_calldata(router)
+        self._encode_call(
+            _SIG_SWAP_ETH_FOR_TOKENS,
+            _TYPES_SWAP_ETH_FOR_TOKENS,
+            [0, self._sell_path, owner, 0],
+        )
+        self._encode_call(
+            _SIG_SWAP_TOKENS_FOR_ETH,
+            _TYPES_SWAP_TOKENS_FOR_ETH,
+            [0, 0, self._buy_path, owner, 0],
+        )
+
     @property
     def stats(self) -> dict:
         """Aggregate executor statistics."""
@@ -371,159 +727,103 @@ class Executor:
             "recovery": self.recovery.snapshot(),
         }
 
-    # ── CEX-first flow ────────────────────────────────────────
+    # ── leg flow ──────────────────────────────────────────────
+
+    async def _execute_flow(
+        self, ctx: ExecutionContext, order: tuple[_LegSpec, _LegSpec]
+    ) -> ExecutionContext:
+        """
+        Run both legs in *order*, unwinding leg 1 if leg 2 fails.
 
-    async def _execute_cex_first(self, ctx: ExecutionContext) -> ExecutionContext:
-        """CEX leg first (default for non-Flashbots)."""
+        CEX-first is the default for non-Flashbots; DEX-first is used
+        with Flashbots, where a failed tx costs nothing.
+        """
         signal = ctx.signal
+        cfg = self.config
+        first, second = order
 
-        # ── Leg 1: CEX ────────────────────────────────────────
-        ctx.transition(ExecutorState.LEG1_PENDING, "Starting CEX leg")
-        ctx.leg1_venue = "cex"
-        ctx.leg1_started_at = time.time()
+        # ── Leg 1 ─────────────────────────────────────────────
+        now_ns = time.monotonic_ns()
+        now = ctx.wall_time(now_ns)
+        ctx.transition(ExecutorState.LEG1_PENDING, first.start_detail, ts=now)
+        ctx.leg1_venue = first.venue
+        ctx.leg1_started_ns = now_ns
 
+        leg1_fn = getattr(self, first.method)
         leg1 = await self._execute_leg_with_retry(
-            coro_factory=lambda: self._execute_cex_leg(signal),
-            timeout=self.config.leg1_timeout,
-            max_retries=self.config.max_leg1_retries,
+            coro_factory=lambda: leg1_fn(signal, signal.size),
+            timeout=getattr(cfg, first.timeout_attr),
+            max_retries=getattr(cfg, first.retries_attr),
             ctx=ctx,
             leg_name="leg1",
         )
 
         if leg1 is None or not leg1["success"]:
-            ctx.transition(
-                ExecutorState.FAILED,
-                leg1.get("error", "CEX rejected") if leg1 else "CEX timeout",
+            error_detail = (
+                leg1.get("error", f"{first.label} failed")
+                if leg1
+                else f"{first.label} timeout"
             )
-            ctx.error = leg1.get("error", "CEX timeout") if leg1 else "CEX timeout"
+            ctx.error = first.first_fail_prefix + error_detail
+            ctx.transition(ExecutorState.FAILED, ctx.error)
             return ctx
 
-        fill_ratio = leg1["filled"] / signal.size
-        ctx.metrics.leg1_fill_ratio = fill_ratio
-        if fill_ratio < self.config.min_fill_ratio:
-            ctx.transition(
-                ExecutorState.FAILED,
-                f"Partial fill {fill_ratio:.1%} < {self.config.min_fill_ratio:.0%}",
-            )
-            ctx.error = "Partial fill below threshold"
-            return ctx
+        if first.check_fill_ratio:
+            fill_ratio = leg1["filled"] / signal.size
+            ctx.metrics.leg1_fill_ratio = fill_ratio
+            if fill_ratio < cfg.min_fill_ratio:
+                ctx.transition(
+                    ExecutorState.FAILED,
+                    f"Partial fill {fill_ratio:.1%} < {cfg.min_fill_ratio:.0%}",
+                )
+                ctx.error = "Partial fill below threshold"
+                return ctx
 
-        ctx.leg1_fill_price = leg1["price"]
-        ctx.leg1_fill_size = leg1["filled"]
-        ctx.leg1_order_id = leg1.get("order_id")
-        ctx.metrics.leg1_latency_ms = (time.time() - ctx.leg1_started_at) * 1_000
-        ctx.metrics.leg1_slippage_bps = self._calc_slippage_bps(
-            expected=signal.cex_price, actual=leg1["price"]
-        )
-        ctx.transition(ExecutorState.LEG1_FILLED, "CEX leg filled")
+        now_ns = time.monotonic_ns()
+        now = ctx.wall_time(now_ns)
+        ctx.record_fill(1, leg1, getattr(signal, first.price_attr), now_ns)
+        ctx.transition(ExecutorState.LEG1_FILLED, first.filled_detail, ts=now)
 
-        # ── Leg 2: DEX ────────────────────────────────────────
-        ctx.transition(ExecutorState.LEG2_PENDING, "Starting DEX leg")
-        ctx.leg2_venue = "dex"
-        ctx.leg2_started_at = time.time()
+        # ── Leg 2 ─────────────────────────────────────────────
+        ctx.transition(ExecutorState.LEG2_PENDING, second.start_detail, ts=now)
+        ctx.leg2_venue = second.venue
+        ctx.leg2_started_ns = now_ns
 
+        leg2_fn = getattr(self, second.method)
         leg2 = await self._execute_leg_with_retry(
-            coro_factory=lambda: self._execute_dex_leg(signal, ctx.leg1_fill_size),
-            timeout=self.config.leg2_timeout,
-            max_retries=self.config.max_leg2_retries,
+            coro_factory=lambda: leg2_fn(signal, ctx.leg1_fill_size),
+            timeout=getattr(cfg, second.timeout_attr),
+            max_retries=getattr(cfg, second.retries_attr),
             ctx=ctx,
             leg_name="leg2",
         )
 
         if leg2 is None or not leg2["success"]:
-            error_detail = leg2.get("error", "DEX failed") if leg2 else "DEX timeout"
-            ctx.transition(ExecutorState.UNWINDING, f"DEX failed: {error_detail}")
-            ctx.metrics.unwind_attempted = True
-            await self._unwind(ctx)
-            ctx.transition(ExecutorState.FAILED, "Unwound after DEX failure")
-            ctx.error = f"DEX failed - unwound: {error_detail}"
-            return ctx
-
-        ctx.leg2_fill_price = leg2["price"]
-        ctx.leg2_fill_size = leg2["filled"]
-        ctx.leg2_tx_hash = leg2.get("tx_hash")
-        ctx.metrics.leg2_latency_ms = (time.time() - ctx.leg2_started_at) * 1_000
-        ctx.metrics.leg2_fill_ratio = leg2["filled"] / ctx.leg1_fill_size
-        ctx.metrics.leg2_slippage_bps = self._calc_slippage_bps(
-            expected=signal.dex_price, actual=leg2["price"]
-        )
-        ctx.transition(ExecutorState.LEG2_FILLED, "DEX leg filled")
-
-        self._compute_pnl(ctx)
-        ctx.transition(ExecutorState.DONE, "Execution complete")
-        return ctx
-
-    # ── DEX-first flow ────────────────────────────────────────
-
-    async def _execute_dex_first(self, ctx: ExecutionContext) -> ExecutionContext:
-        """DEX leg first (when using Flashbots — failed tx = no cost)."""
-        signal = ctx.signal
-
-        # ── Leg 1: DEX ────────────────────────────────────────
-        ctx.transition(ExecutorState.LEG1_PENDING, "Starting DEX leg")
-        ctx.leg1_venue = "dex"
-        ctx.leg1_started_at = time.time()
-
-        leg1 = await self._execute_leg_with_retry(
-            coro_factory=lambda: self._execute_dex_leg(signal, signal.size),
-            timeout=self.config.leg2_timeout,
-            max_retries=self.config.max_leg2_retries,
-            ctx=ctx,
-            leg_name="leg1",
-        )
-
-        if leg1 is None or not leg1["success"]:
-            error_detail = leg1.get("error", "DEX failed") if leg1 else "DEX timeout"
+            error_detail = (
+                leg2.get("error", f"{second.label} failed")
+                if leg2
+                else f"{second.label} timeout"
+            )
             ctx.transition(
-                ExecutorState.FAILED,
-                f"DEX failed (no cost via Flashbots): {error_detail}",
+                ExecutorState.UNWINDING, f"{second.label} failed: {error_detail}"
             )
-            ctx.error = f"DEX failed (no cost via Flashbots): {error_detail}"
-            return ctx
-
-        ctx.leg1_fill_price = leg1["price"]
-        ctx.leg1_fill_size = leg1["filled"]
-        ctx.leg1_order_id = leg1.get("order_id")
-        ctx.metrics.leg1_latency_ms = (time.time() - ctx.leg1_started_at) * 1_000
-        ctx.metrics.leg1_slippage_bps = self._calc_slippage_bps(
-            expected=signal.dex_price, actual=leg1["price"]
-        )
-        ctx.transition(ExecutorState.LEG1_FILLED, "DEX leg filled")
-
-        # ── Leg 2: CEX ────────────────────────────────────────
-        ctx.transition(ExecutorState.LEG2_PENDING, "Starting CEX leg")
-        ctx.leg2_venue = "cex"
-        ctx.leg2_started_at = time.time()
-
-        leg2 = await self._execute_leg_with_retry(
-            coro_factory=lambda: self._execute_cex_leg(signal, ctx.leg1_fill_size),
-            timeout=self.config.leg1_timeout,
-            max_retries=self.config.max_leg1_retries,
-            ctx=ctx,
-            leg_name="leg2",
-        )
-
-        if leg2 is None or not leg2["success"]:
-            error_detail = leg2.get("error", "CEX failed") if leg2 else "CEX timeout"
-            ctx.transition(ExecutorState.UNWINDING, f"CEX failed: {error_detail}")
             ctx.metrics.unwind_attempted = True
             await self._unwind(ctx)
-            ctx.transition(ExecutorState.FAILED, "Unwound after CEX failure")
-            ctx.error = f"CEX failed after DEX - unwound: {error_detail}"
+            ctx.transition(
+                ExecutorState.FAILED, f"Unwound after {second.label} failure"
+            )
+            ctx.error = (
+                f"{second.label} failed after {first.label} - unwound: {error_detail}"
+            )
             return ctx
 
-        ctx.leg2_fill_price = leg2["price"]
-        ctx.leg2_fill_size = leg2["filled"]
-        ctx.leg2_tx_hash = leg2.get("tx_hash")
-        ctx.metrics.leg2_latency_ms = (time.time() - ctx.leg2_started_at) * 1_000
-        ctx.metrics.leg2_fill_ratio = leg2["filled"] / ctx.leg1_fill_size
-        ctx.metrics.leg2_slippage_bps = self._calc_slippage_bps(
-            expected=signal.cex_price, actual=leg2["price"]
-        )
-        ctx.transition(ExecutorState.LEG2_FILLED, "CEX leg filled")
+        now_ns = time.monotonic_ns()
+        now = ctx.wall_time(now_ns)
+        ctx.record_fill(2, leg2, getattr(signal, second.price_attr), now_ns)
+        ctx.transition(ExecutorState.LEG2_FILLED, second.filled_detail, ts=now)
 
         self._compute_pnl(ctx)
-        ctx.transition(ExecutorState.DONE, "Execution complete")
+        ctx.transition(ExecutorState.DONE, "Execution complete", ts=now)
         return ctx
 
     # ── retry wrapper ─────────────────────────────────────────
@@ -541,22 +841,28 @@ class Executor:
 
         Returns the leg result dict, or ``None`` on total failure.
         """
-        retries_attr = f"{leg_name}_retries"
         last_result: Optional[dict] = None
+        needs_timeout = self._needs_timeout
 
         for attempt in range(1 + max_retries):
             try:
-                last_result = await asyncio.wait_for(coro_factory(), timeout=timeout)
+                if not needs_timeout:
+                    last_result = await coro_factory()
+                else:
+                    # asyncio.timeout() cancels in place instead of wrapping
+                    # the leg in an extra Task like wait_for() does.
+                    async with asyncio.timeout(timeout):
+                        last_result = await coro_factory()
                 if last_result and last_result.get("success"):
                     return last_result
-            except asyncio.TimeoutError:
+            except TimeoutError:
                 last_result = {"success": False, "error": "timeout"}
             except Exception as exc:
                 last_result = {"success": False, "error": str(exc)}
 
             # Record retry metric
             if attempt < max_retries:
-                setattr(ctx.metrics, retries_attr, attempt + 1)
+                setattr(ctx.metrics, leg_name + "_retries", attempt + 1)
                 delay = self.config.retry_base_delay * (2**attempt)
                 logger.warning(
                     "%s attempt %d failed, retrying in %.1fs: %s",
@@ -574,7 +880,8 @@ class Executor:
     async def _execute_cex_leg(self, signal: Signal, size: float = None) -> dict:
         actual_size = size or signal.size
         if self.config.simulation_mode:
-            await asyncio.sleep(0.1)
+            if not self.config.fast_simulation:
+                await asyncio.sleep(0.1)
             return {
                 "success": True,
                 "price": signal.cex_price * 1.0001,
@@ -599,7 +906,8 @@ class Executor:
 
     async def _execute_dex_leg(self, signal: Signal, size: float) -> dict:
         if self.config.simulation_mode:
-            await asyncio.sleep(0.5)
+            if not self.config.fast_simulation:
+                await asyncio.sleep(0.5)
             return {
                 "success": True,
                 "price": signal.dex_price * 0.9998,
@@ -622,7 +930,8 @@ class Executor:
         filled.
         """
         if self.config.simulation_mode:
-            await asyncio.sleep(0.1)
+            if not self.config.fast_simulation:
+                await asyncio.sleep(0.1)
             ctx.metrics.unwind_success = True
             logger.info("Simulated unwind for %s", ctx.signal.signal_id)
             return
@@ -644,28 +953,15 @@ class Executor:
                 ctx.metrics.unwind_success = result.get("status") == "filled"
             elif ctx.leg1_venue == "dex" and ctx.leg1_fill_size:
                 # Reverse the DEX swap
-                reverse_signal = Signal.create(
-                    pair=signal.pair,
-                    direction=(
-                        Direction.BUY_DEX_SELL_CEX
-                        if signal.direction == Direction.BUY_CEX_SELL_DEX
-                        else Direction.BUY_CEX_SELL_DEX
-                    ),
-                    cex_price=signal.cex_price,
-                    dex_price=signal.dex_price,
-                    spread_bps=0,
-                    size=ctx.leg1_fill_size,
-                    expected_gross_pnl=0,
-                    expected_fees=0,
-                    expected_net_pnl=0,
-                    score=100,
-                    expiry=time.time() + 120,
-                    inventory_ok=True,
-                    within_limits=True,
+                reverse_direction = (
+                    Direction.BUY_DEX_SELL_CEX
+                    if signal.direction == Direction.BUY_CEX_SELL_DEX
+                    else Direction.BUY_CEX_SELL_DEX
                 )
                 result = await asyncio.to_thread(
-                    self._execute_real_dex_leg,
-                    reverse_signal,
+                    self._execute_dex_swap,
+                    reverse_direction,
+                    signal.dex_price,
                     ctx.leg1_fill_size,
                 )
                 ctx.metrics.unwind_success = result.get("success", False)
@@ -690,10 +986,7 @@ class Executor:
         p2 = ctx.leg2_fill_price or 0.0
         size = ctx.leg1_fill_size or 0.0
 
-        if signal.direction == Direction.BUY_CEX_SELL_DEX:
-            gross = (p2 - p1) * size
-        else:
-            gross = (p1 - p2) * size
+        gross = _DIRECTION_SIGN[signal.direction] * (p2 - p1) * size
 
         # Use actual fee data when available
         breakeven_bps = signal.meta.get("breakeven_bps", 40.0)
@@ -709,52 +1002,41 @@ class Executor:
     @staticmethod
     def _calc_slippage_bps(expected: float, actual: float) -> float:
         """Slippage in basis points (positive = worse than expected)."""
-        if expected == 0:
-            return 0.0
-        return round(abs(actual - expected) / expected * 10_000, 2)
+        return _slippage_bps(expected, actual)
 
     # ── real DEX execution (unchanged from previous impl) ─────
 
     def _execute_real_dex_leg(self, signal: Signal, size: float) -> dict:
+        return self._execute_dex_swap(signal.direction, signal.dex_price, size)
+
+    def _execute_dex_swap(
+        self, direction: Direction, dex_price: float, size: float
+    ) -> dict:
+        """
+        Swap *size* ETH on the router in *direction* at ~*dex_price*.
+
+        Takes plain values rather than a ``Signal`` so the unwind path
+        can reverse a fill without building a throwaway signal.
+        """
         self._ensure_dex_ready()
         assert self._dex_client is not None
         assert self._dex_wallet is not None
-        wallet_addr = Address.from_string(self._dex_wallet.address)
-
-        router = Address.from_string(
-            self._resolve_dex_config("DEX_ROUTER_ADDRESS", "dex_router_address")
-        )
-        weth = self._resolve_dex_config("DEX_WETH_ADDRESS", "dex_weth_address")
-        quote = self._resolve_dex_config(
-            "DEX_QUOTE_TOKEN_ADDRESS", "dex_quote_token_address"
-        )
-        deadline = int(time.time()) + self.config.dex_deadline_seconds
+        wallet_addr = self._wallet_addr
+        router = self._router_addr
+        deadline = int(time.time()) + self._deadline_secs
 
-        if signal.direction == Direction.BUY_CEX_SELL_DEX:
+        if direction == Direction.BUY_CEX_SELL_DEX:
             eth_in_wei = self._to_wei(size)
-            min_quote_out = int(
-                self._to_token_units(size * signal.dex_price, 6)
-                * (10_000 - self.config.dex_slippage_bps)
-                / 10_000
-            )
+            min_quote_out = (
+                self._to_token_units(size * dex_price, 6) * self._sell_keep_bps
+            ) // 10_000
             calldata = self._encode_call(
-                "swapExactETHForTokens(uint256,address[],address,uint256)",
-                ["uint256", "address[]", "address", "uint256"],
-                [min_quote_out, [weth, quote], wallet_addr.checksum, deadline],
-            )
-            receipt = (
-                TransactionBuilder(self._dex_client, self._dex_wallet)
-                .to(router)
-                .value(TokenAmount(raw=eth_in_wei, decimals=18, symbol="ETH"))
-                .data(calldata)
-                .chain_id(self.config.dex_chain_id)
-                .with_gas_estimate()
-                .with_gas_price(self.config.dex_gas_priority)
-                .send_and_wait(timeout=int(self.config.leg2_timeout))
-            )
-            executed_price = signal.dex_price * (
-                (10_000 - self.config.dex_slippage_bps) / 10_000
+                _SIG_SWAP_ETH_FOR_TOKENS,
+                _TYPES_SWAP_ETH_FOR_TOKENS,
+                [min_quote_out, self._sell_path, wallet_addr.checksum, deadline],
             )
+            receipt = self._send_swap(self._swap_tx(router, eth_in_wei, calldata))
+            executed_price = dex_price * self._sell_keep_bps / 10_000
             return {
                 "success": receipt.status,
                 "price": executed_price,
@@ -764,36 +1046,32 @@ class Executor:
 
         # Buy exact ETH on DEX: quote token -> ETH
         eth_out_wei = self._to_wei(size)
-        max_quote_in = int(
-            self._to_token_units(size * signal.dex_price, 6)
-            * (10_000 + self.config.dex_slippage_bps)
-            / 10_000
-        )
-        quote_token = Address.from_string(quote)
+        max_quote_in = (
+            self._to_token_units(size * dex_price, 6) * self._buy_pay_bps
+        ) // 10_000
         self._ensure_allowance(
-            token=quote_token,
+            token=self._quote_token_addr,
             owner=wallet_addr,
             spender=router,
             min_amount=max_quote_in,
         )
         calldata = self._encode_call(
-            "swapTokensForExactETH(uint256,uint256,address[],address,uint256)",
-            ["uint256", "uint256", "address[]", "address", "uint256"],
-            [eth_out_wei, max_quote_in, [quote, weth], wallet_addr.checksum, deadline],
-        )
-        receipt = (
-            TransactionBuilder(self._dex_client, self._dex_wallet)
-            .to(router)
-            .value(TokenAmount(raw=0, decimals=18, symbol="ETH"))
-            .data(calldata)
-            .chain_id(self.config.dex_chain_id)
-            .with_gas_estimate()
-            .with_gas_price(self.config.dex_gas_priority)
-            .send_and_wait(timeout=int(self.config.leg2_timeout))
-        )
-        executed_price = signal.dex_price * (
-            (10_000 + self.config.dex_slippage_bps) / 10_000
+            _SIG_SWAP_TOKENS_FOR_ETH,
+            _TYPES_SWAP_TOKENS_FOR_ETH,
+            [eth_out_wei, max_quote_in, self._buy_path, wallet_addr.checksum, deadline],
         )
+        try:
+            receipt = self._send_swap(self._swap_tx(router, 0, calldata))
+        except Exception:
+            self._forget_allowance(self._quote_token_addr, wallet_addr, router)
+            raise
+        if receipt.status:
+            self._spend_allowance(
+                self._quote_token_addr, wallet_addr, router, max_quote_in
+            )
+        else:
+            self._forget_allowance(self._quote_token_addr, wallet_addr, router)
+        executed_price = dex_price * self._buy_pay_bps / 10_000
         return {
             "success": receipt.status,
             "price": executed_price,
@@ -801,13 +1079,97 @@ class Executor:
             "tx_hash": receipt.tx_hash,
         }
 
+    def _swap_tx(
+        self, router: Address, value_wei: int, data: bytes
+    ) -> TransactionBuilder:
+        """Builder for a router swap, reusing the cached gas-price snapshot."""
+        builder = (
+            TransactionBuilder(self._dex_client, self._dex_wallet)
+            .to(router)
+            .value(TokenAmount(raw=value_wei, decimals=18, symbol="ETH"))
+            .data(data)
+            .chain_id(self.config.dex_chain_id)
+        )
+        if self._flashbots is not None:
+            builder.gas_limit(_SWAP_GAS_LIMIT)
+        else:
+            builder.with_gas_estimate()
+        return builder.with_gas_price(
+            self.config.dex_gas_priority, gas=self._cached_gas_price()
+        )
+
+    def _cached_gas_price(self) -> GasPrice:
+        """Network gas price, refreshed at most once per ``_GAS_PRICE_TTL_NS``."""
+        assert self._dex_client is not None
+        now_ns = time.monotonic_ns()
+        if self._gas_price is None or now_ns - self._gas_price_ns > _GAS_PRICE_TTL_NS:
+            self._gas_price = self._dex_client.get_gas_price()
+            self._gas_price_ns = now_ns
+        return self._gas_price
+
+    def _send_swap(self, builder: TransactionBuilder) -> TransactionReceipt:
+        """
+        Sign and submit a swap — as a Flashbots bundle for the next block
+        (simulated first with ``eth_callBundle``) when a relay is
+        configured, otherwise via the public mempool.
+        """
+        timeout = int(self.config.leg2_timeout)
+        if self._flashbots is None:
+            return builder.send_and_wait(timeout=timeout)
+        assert self._dex_client is not None
+        signed = builder.build_and_sign()
+        target = int(self._dex_client.get_block("latest")["number"], 16) + 1
+        bundle = [signed.raw_transaction]
+        # Simulate first: a doomed swap fails in one RPC, not a missed block.
+        sim = self._flashbots.call_bundle(bundle, target)
+        for result in sim.get("results", ()):
+            if "error" in result or "revert" in result:
+                reason = result.get("revert") or result.get("error")
+                raise RuntimeError(f"sim revert: {reason}")
+        self._flashbots.send_bundle(bundle, target)
+        receipt = self._flashbots.wait_for_inclusion(
+            self._dex_client, "0x" + bytes(signed.hash).hex(), target, timeout=timeout
+        )
+        if receipt is None:
+            raise RuntimeError(f"Flashbots bundle not included in block {target}")
+        return receipt
+
     def _ensure_dex_ready(self) -> None:
         if self._dex_client is not None and self._dex_wallet is not None:
             return
         rpc_url = self._resolve_dex_config("SEPOLIA_RPC_URL", "dex_rpc_url")
         private_key = self._resolve_dex_config("PRIVATE_KEY", "dex_private_key")
+        router = self._resolve_dex_config("DEX_ROUTER_ADDRESS", "dex_router_address")
+        weth = self._resolve_dex_config("DEX_WETH_ADDRESS", "dex_weth_address")
+        quote = self._resolve_dex_config(
+            "DEX_QUOTE_TOKEN_ADDRESS", "dex_quote_token_address"
+        )
+        wallet = WalletManager(private_key)
+
+        # Addresses are fixed for the executor's lifetime — parse them once.
+        self._wallet_addr = Address.from_string(wallet.address)
+        self._router_addr = Address.from_string(router)
+        self._sell_path = (weth, quote)
+        self._buy_path = (quote, weth)
+        self._quote_token_addr = Address.from_string(quote)
+        self._deadline_secs = int(self.config.dex_deadline_seconds)
+        self._sell_keep_bps = 10_000 - self.config.dex_slippage_bps
+        self._buy_pay_bps = 10_000 + self.config.dex_slippage_bps
+        if self.config.use_flashbots:
+            relay_url = (
+                self.config.flashbots_relay_url
+                or os.getenv("FLASHBOTS_RELAY_URL")
+                or RELAY_URLS.get(self.config.dex_chain_id)
+            )
+            if relay_url:
+                self._flashbots = FlashbotsRelay(relay_url, wallet)
+            else:
+                logger.warning(
+                    "No Flashbots relay for chain %d; DEX swaps use public mempool",
+                    self.config.dex_chain_id,
+                )
         self._dex_client = ChainClient([rpc_url])
-        self._dex_wallet = WalletManager(private_key)
+        self._dex_wallet = wallet
 
     def _resolve_dex_config(self, env_key: str, config_attr: str) -> str:
         value = getattr(self.config, config_attr) or os.getenv(env_key)
@@ -824,11 +1186,12 @@ class Executor:
     ) -> None:
         assert self._dex_client is not None
         assert self._dex_wallet is not None
-        allowance_data = self._encode_call(
-            "allowance(address,address)",
-            ["address", "address"],
-            [owner.checksum, spender.checksum],
-        )
+        key = (token.checksum, owner.checksum, spender.checksum)
+        cached = self._allowance_cache.get(key)
+        if cached is not None and cached >= min_amount:
+            return
+
+        allowance_data = _allowance_calldata(owner.checksum, spender.checksum)
         allowance_call = TransactionRequest(
             to=token,
             value=TokenAmount(raw=0, decimals=18, symbol="ETH"),
@@ -836,16 +1199,12 @@ class Executor:
             chain_id=self.config.dex_chain_id,
         )
         allowance_raw = self._dex_client.call(allowance_call)
-        current_allowance = int.from_bytes(allowance_raw, "big") if allowance_raw else 0
+        current_allowance = _decode_uint256(allowance_raw)
+        self._allowance_cache[key] = current_allowance
         if current_allowance >= min_amount:
             return
 
-        max_uint256 = 2**256 - 1
-        approve_data = self._encode_call(
-            "approve(address,uint256)",
-            ["address", "uint256"],
-            [spender.checksum, max_uint256],
-        )
+        approve_data = _approve_calldata(spender.checksum)
         receipt = (
             TransactionBuilder(self._dex_client, self._dex_wallet)
             .to(token)
@@ -853,21 +1212,42 @@ class Executor:
             .data(approve_data)
             .chain_id(self.config.dex_chain_id)
             .with_gas_estimate()
-            .with_gas_price(self.config.dex_gas_priority)
+            .with_gas_price(self.config.dex_gas_priority, gas=self._cached_gas_price())
             .send_and_wait(timeout=int(self.config.leg2_timeout))
         )
         if not receipt.status:
             raise RuntimeError("Token approve transaction failed")
+        self._allowance_cache[key] = MAX_UINT256
+
+    def _spend_allowance(
+        self, token: Address, owner: Address, spender: Address, amount: int
+    ) -> None:
+        """Charge a swap against the cached allowance (unlimited stays unlimited)."""
+        key = (token.checksum, owner.checksum, spender.checksum)
+        cached = self._allowance_cache.get(key)
+        if cached is not None and cached != MAX_UINT256:
+            self._allowance_cache[key] = max(cached - amount, 0)
+
+    def _forget_allowance(
+        self, token: Address, owner: Address, spender: Address
+    ) -> None:
+        """Drop the cached allowance after a failed swap; the next one re-reads it."""
+        key = (token.checksum, owner.checksum, spender.checksum)
+        self._allowance_cache.pop(key, None)
 
     @staticmethod
-    def _encode_call(signature: str, arg_types: list[str], args: list[Any]) -> bytes:
-        selector = keccak(text=signature)[:4]
+    def _encode_call(
+        signature: str, arg_types: tuple[str, ...], args: list[Any]
+    ) -> bytes:
+        selector = _SELECTORS.get(signature)
+        if selector is None:
+            selector = _SELECTORS[signature] = keccak(text=signature)[:4]
         return selector + abi_encode(arg_types, args)
 
     @staticmethod
     def _to_wei(value_eth: float) -> int:
-        return int(Decimal(str(value_eth)) * Decimal(10**18))
+        return _scale_float(value_eth, 18)
 
     @staticmethod
     def _to_token_units(amount: float, decimals: int) -> int:
-        return int(Decimal(str(amount)) * Decimal(10**decimals))
+        return _scale_float(amount, decimals)
@@ -18,7 +18,7 @@ Replay Protection
 * Per-pair + global dedup with configurable TTL.
 * Nonce-monotonic check: rejects signals whose nonce is ≤ the last
   executed nonce for that pair (prevents stale / re-ordered signals).
-* Bounded size with LRU eviction so memory stays constant.
+* Bounded size with hit-count eviction so memory stays constant.
 * Full audit log of every accept / reject decision.
 
 Failure Classifier
@@ -37,15 +37,28 @@ together and exposes a single ``pre_flight(signal)`` gate plus
 from __future__ import annotations
 
 import logging
+import os
 import re
+import struct
+import sys
+import threading
 import time
-from collections import OrderedDict
+from array import array
+from collections import deque
 from dataclasses import dataclass, field
 from enum import Enum, auto
+from functools import lru_cache
+from itertools import islice
+from pathlib import Path
 from typing import Optional
 
 from strategy.signal import Signal
 
+try:  # optional: google-re2 guarantees linear-time matching
+    import re2
+except ImportError:
+    re2 = None
+
 logger = logging.getLogger(__name__)
 
 # ╔══════════════════════════════════════════════════════════════════╗
@@ -83,6 +96,26 @@ _PATTERNS: list[tuple[re.Pattern, FailureCategory]] = [
     (re.compile(r"network", re.I), FailureCategory.NETWORK),
 ]
 
+# With google-re2 installed the same patterns run on RE2 (linear time in the
+# input whatever the pattern), tried one by one in the same priority order.
+_RE2_PATTERNS: tuple = (
+    tuple((re2.compile(f"(?i){p.pattern}"), c) for p, c in _PATTERNS)
+    if re2 is not None
+    else ()
+)
+
+
+@lru_cache(maxsize=1024)
+def _classify_cached(error: str) -> FailureCategory:
+    # A failing endpoint repeats the same message, so most lookups hit.  On
+    # a miss, one search per pattern beats a single combined regex: each is
+    # a fast literal scan, while a combined pattern has to try every
+    # alternative at every position (see scripts/bench_failure_classifier.py).
+    for pattern, category in _RE2_PATTERNS or _PATTERNS:
+        if pattern.search(error):
+            return category
+    return FailureCategory.UNKNOWN
+
 
 class FailureClassifier:
     """Classify an error string into a :class:`FailureCategory`."""
@@ -91,10 +124,7 @@ class FailureClassifier:
     def classify(error: Optional[str]) -> FailureCategory:
         if not error:
             return FailureCategory.UNKNOWN
-        for pattern, category in _PATTERNS:
-            if pattern.search(error):
-                return category
-        return FailureCategory.UNKNOWN
+        return _classify_cached(error)
 
     @staticmethod
     def is_retriable(category: FailureCategory) -> bool:
@@ -116,7 +146,7 @@ class BreakerState(Enum):
     HALF_OPEN = "half_open"  # Probing — one trade allowed
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CircuitBreakerConfig:
     # ── failure-count trip ───────────────────────────────────
     failure_threshold: int = 3
@@ -135,8 +165,22 @@ class CircuitBreakerConfig:
     # ── per-pair isolation ──────────────────────────────────
     per_pair: bool = True  # track per-pair; global is always tracked too
 
+    # ── derived (hot-path thresholds, computed once) ────────
+    _drawdown_trip: float = field(init=False, repr=False, compare=False)
+    _cooldown_ns: int = field(init=False, repr=False, compare=False)
+    _half_open_ns: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_drawdown_trip", -self.max_drawdown_usd)
+        object.__setattr__(self, "_cooldown_ns", _to_ns(self.cooldown_seconds))
+        object.__setattr__(
+            self,
+            "_half_open_ns",
+            _to_ns(self.cooldown_seconds * self.half_open_after_pct),
+        )
+
 
-@dataclass
+@dataclass(slots=True)
 class BreakerSnapshot:
     """Read-only view of breaker state for logging / dashboards."""
 
@@ -158,15 +202,51 @@ class BreakerSnapshot:
         }
 
 
+# The failure window is a ring of this many time buckets, so counting and
+# expiring failures is constant work however many failures are recorded.
+# Failures expire with bucket granularity (window_seconds / _WINDOW_BUCKETS).
+_WINDOW_BUCKETS = 10
+
+_NS = 1_000_000_000
+
+# Internal timekeeping is monotonic integer nanoseconds, immune to wall-clock
+# steps; wall-clock time is only used where it leaves the process (signal
+# timestamps, snapshots, persisted state, audit entries).
+_now_ns = time.monotonic_ns
+
+
+def _to_ns(seconds: float) -> int:
+    return int(seconds * _NS)
+
+
+# Number of lock shards for per-pair breakers (power of two)
+_LOCK_SHARDS = 64
+
+
 class _SingleBreaker:
     """State machine for one circuit breaker (global or per-pair)."""
 
+    __slots__ = (
+        "_cfg",
+        "_label",
+        "_bucket_width",
+        "_buckets",
+        "_head",
+        "_state",
+        "_tripped_at",
+        "_cumulative_pnl",
+    )
+
     def __init__(self, config: CircuitBreakerConfig, label: str = "global"):
         self._cfg = config
         self._label = label
-        self._failures: list[float] = []
+        # Failure counts per time bucket; ``_head`` is the absolute index
+        # (``now // width``) of the newest bucket.
+        self._bucket_width = max(1, _to_ns(config.window_seconds) // _WINDOW_BUCKETS)
+        self._buckets = array("q", bytes(8 * _WINDOW_BUCKETS))
+        self._head: Optional[int] = None
         self._state: BreakerState = BreakerState.CLOSED
-        self._tripped_at: Optional[float] = None
+        self._tripped_at: Optional[int] = None  # monotonic ns
         self._cumulative_pnl: float = 0.0
 
     # ── recording ─────────────────────────────────────────────
@@ -176,22 +256,30 @@ class _SingleBreaker:
         category: FailureCategory = FailureCategory.UNKNOWN,
         pnl: float = 0.0,
     ) -> None:
-        now = time.time()
+        now = _now_ns()
         # Permanent errors count double; transient count once
         weight = 2 if category == FailureCategory.PERMANENT else 1
-        for _ in range(weight):
-            self._failures.append(now)
+        self._advance(now)
+        self._buckets[self._head % _WINDOW_BUCKETS] += weight
         self._cumulative_pnl += pnl
-        self._prune()
 
-        if self._should_trip():
-            self._trip()
+        if self._should_trip(now):
+            self._trip(now)
 
     def record_success(self, pnl: float = 0.0) -> None:
         self._cumulative_pnl += pnl
         # Decay: remove oldest N failure records
-        decay = min(self._cfg.success_decay, len(self._failures))
-        self._failures = self._failures[decay:]
+        self._advance(_now_ns())
+        remaining = self._cfg.success_decay
+        buckets = self._buckets
+        head = self._head
+        for offset in range(1, _WINDOW_BUCKETS + 1):
+            if remaining <= 0:
+                break
+            idx = (head + offset) % _WINDOW_BUCKETS  # oldest bucket first
+            taken = min(remaining, buckets[idx])
+            buckets[idx] -= taken
+            remaining -= taken
 
         # If we were half-open and the probe succeeded → close
         if self._state == BreakerState.HALF_OPEN:
@@ -202,63 +290,78 @@ class _SingleBreaker:
 
     def is_open(self) -> bool:
         """Return True if trading is blocked."""
-        self._maybe_transition()
+        self._maybe_transition(_now_ns())
         return self._state == BreakerState.OPEN
 
     def allows_probe(self) -> bool:
         """Return True if exactly one probe trade is allowed."""
-        self._maybe_transition()
+        self._maybe_transition(_now_ns())
         return self._state == BreakerState.HALF_OPEN
 
     def allows_trade(self) -> bool:
         """Return True if a trade can go through (CLOSED or HALF_OPEN)."""
-        self._maybe_transition()
+        self._maybe_transition(_now_ns())
         return self._state in (BreakerState.CLOSED, BreakerState.HALF_OPEN)
 
     @property
     def state(self) -> BreakerState:
-        self._maybe_transition()
+        self._maybe_transition(_now_ns())
         return self._state
 
-    def time_until_reset(self) -> float:
+    def time_until_reset(self, now: Optional[int] = None) -> float:
         if self._tripped_at is None:
             return 0.0
-        elapsed = time.time() - self._tripped_at
-        return max(0.0, self._cfg.cooldown_seconds - elapsed)
+        elapsed = (_now_ns() if now is None else now) - self._tripped_at
+        return max(0, self._cfg._cooldown_ns - elapsed) / _NS
 
     def snapshot(self, pair: Optional[str] = None) -> BreakerSnapshot:
-        self._maybe_transition()
+        now = _now_ns()
+        self._maybe_transition(now)
+        tripped_at = None
+        if self._tripped_at is not None:  # report as wall-clock time
+            tripped_at = time.time() - (now - self._tripped_at) / _NS
         return BreakerSnapshot(
             state=self._state,
-            failures_in_window=self._failures_in_window(),
+            failures_in_window=self._failures_in_window(now),
             cumulative_pnl=self._cumulative_pnl,
-            tripped_at=self._tripped_at,
-            time_until_reset=self.time_until_reset(),
+            tripped_at=tripped_at,
+            time_until_reset=self.time_until_reset(now),
             pair=pair,
         )
 
     # ── internals ─────────────────────────────────────────────
 
-    def _prune(self) -> None:
-        cutoff = time.time() - self._cfg.window_seconds
-        self._failures = [t for t in self._failures if t > cutoff]
+    def _advance(self, now: int) -> None:
+        """Rotate the ring to *now*, zeroing buckets that left the window."""
+        current = now // self._bucket_width
+        head = self._head
+        if head is not None and current <= head:
+            return  # still in the newest bucket
+        buckets = self._buckets
+        if head is None or current - head >= _WINDOW_BUCKETS:
+            for idx in range(_WINDOW_BUCKETS):
+                buckets[idx] = 0
+        else:
+            for absolute in range(head + 1, current + 1):
+                buckets[absolute % _WINDOW_BUCKETS] = 0
+        self._head = current
 
-    def _failures_in_window(self) -> int:
-        self._prune()
-        return len(self._failures)
+    def _failures_in_window(self, now: int) -> int:
+        self._advance(now)
+        return sum(self._buckets)
 
-    def _should_trip(self) -> bool:
-        if self._failures_in_window() >= self._cfg.failure_threshold:
+    def _should_trip(self, now: int) -> bool:
+        if self._failures_in_window(now) >= self._cfg.failure_threshold:
             return True
-        if self._cumulative_pnl <= -self._cfg.max_drawdown_usd:
+        if self._cumulative_pnl <= self._cfg._drawdown_trip:
             return True
         return False
 
-    def _trip(self) -> None:
+    def _trip(self, now: Optional[int] = None) -> None:
         if self._state in (BreakerState.OPEN, BreakerState.HALF_OPEN):
             return  # already tripped
         self._state = BreakerState.OPEN
-        self._tripped_at = time.time()
+        self._tripped_at = _now_ns() if now is None else now
         logger.critical(
             "CIRCUIT BREAKER [%s] TRIPPED  pnl=%.4f", self._label, self._cumulative_pnl
         )
@@ -266,17 +369,19 @@ class _SingleBreaker:
     def _reset(self) -> None:
         self._state = BreakerState.CLOSED
         self._tripped_at = None
-        self._failures.clear()
+        for idx in range(_WINDOW_BUCKETS):
+            self._buckets[idx] = 0
         logger.info("CB [%s] reset to CLOSED", self._label)
 
-    def _maybe_transition(self) -> None:
+    def _maybe_transition(self, now: int) -> None:
         """Auto-transition OPEN → HALF_OPEN → CLOSED based on elapsed time."""
         if self._tripped_at is None:
             return
-        elapsed = time.time() - self._tripped_at
-        if elapsed >= self._cfg.cooldown_seconds:
+        cfg = self._cfg
+        elapsed = now - self._tripped_at
+        if elapsed >= cfg._cooldown_ns:
             self._reset()
-        elif elapsed >= self._cfg.cooldown_seconds * self._cfg.half_open_after_pct:
+        elif elapsed >= cfg._half_open_ns:
             if self._state == BreakerState.OPEN:
                 self._state = BreakerState.HALF_OPEN
                 logger.info("CB [%s] entering HALF_OPEN (probe allowed)", self._label)
@@ -295,11 +400,20 @@ class CircuitBreaker:
         self.config = config or CircuitBreakerConfig()
         self._global = _SingleBreaker(self.config, label="global")
         self._per_pair: dict[str, _SingleBreaker] = {}
+        # Pair breakers are guarded by a fixed set of sharded locks, so
+        # threads recording outcomes for different pairs rarely contend.
+        self._global_lock = threading.Lock()
+        self._pair_locks = [threading.Lock() for _ in range(_LOCK_SHARDS)]
+
+    def _pair_lock(self, pair: str) -> threading.Lock:
+        return self._pair_locks[hash(pair) & (_LOCK_SHARDS - 1)]
 
     def _pair_breaker(self, pair: str) -> _SingleBreaker:
-        if pair not in self._per_pair:
-            self._per_pair[pair] = _SingleBreaker(self.config, label=pair)
-        return self._per_pair[pair]
+        """Return the breaker for *pair*; call with its shard lock held."""
+        breaker = self._per_pair.get(pair)
+        if breaker is None:
+            breaker = self._per_pair[pair] = _SingleBreaker(self.config, label=pair)
+        return breaker
 
     # ── recording ─────────────────────────────────────────────
 
@@ -309,52 +423,67 @@ class CircuitBreaker:
         category: FailureCategory = FailureCategory.UNKNOWN,
         pnl: float = 0.0,
     ) -> None:
-        self._global.record_failure(category, pnl)
+        with self._global_lock:
+            self._global.record_failure(category, pnl)
         if pair and self.config.per_pair:
-            self._pair_breaker(pair).record_failure(category, pnl)
+            with self._pair_lock(pair):
+                self._pair_breaker(pair).record_failure(category, pnl)
 
     def record_success(self, pair: Optional[str] = None, pnl: float = 0.0) -> None:
-        self._global.record_success(pnl)
+        with self._global_lock:
+            self._global.record_success(pnl)
         if pair and self.config.per_pair:
-            self._pair_breaker(pair).record_success(pnl)
+            with self._pair_lock(pair):
+                self._pair_breaker(pair).record_success(pnl)
 
     # ── queries ───────────────────────────────────────────────
 
     def is_open(self, pair: Optional[str] = None) -> bool:
         """True if trading is blocked globally **or** for *pair*."""
-        if self._global.is_open():
-            return True
+        with self._global_lock:
+            if self._global.is_open():
+                return True
         if pair and self.config.per_pair:
-            return self._pair_breaker(pair).is_open()
+            with self._pair_lock(pair):
+                return self._pair_breaker(pair).is_open()
         return False
 
     def allows_trade(self, pair: Optional[str] = None) -> bool:
         """True if a trade (or probe) can go through."""
-        if not self._global.allows_trade():
-            return False
+        with self._global_lock:
+            if not self._global.allows_trade():
+                return False
         if pair and self.config.per_pair:
-            return self._pair_breaker(pair).allows_trade()
+            with self._pair_lock(pair):
+                return self._pair_breaker(pair).allows_trade()
         return True
 
     def trip(self, pair: Optional[str] = None) -> None:
         """Manual trip — useful for emergency stop."""
-        self._global._trip()
+        with self._global_lock:
+            self._global._trip()
         if pair and self.config.per_pair:
-            self._pair_breaker(pair)._trip()
+            with self._pair_lock(pair):
+                self._pair_breaker(pair)._trip()
 
     def time_until_reset(self, pair: Optional[str] = None) -> float:
-        g = self._global.time_until_reset()
+        with self._global_lock:
+            g = self._global.time_until_reset()
         if pair and self.config.per_pair:
-            return max(g, self._pair_breaker(pair).time_until_reset())
+            with self._pair_lock(pair):
+                return max(g, self._pair_breaker(pair).time_until_reset())
         return g
 
     def snapshot(self, pair: Optional[str] = None) -> dict:
         """Full observability snapshot."""
-        result: dict = {"global": self._global.snapshot().to_dict()}
-        if pair and pair in self._per_pair:
-            result["pair"] = self._per_pair[pair].snapshot(pair).to_dict()
-        elif pair:
-            result["pair"] = _SingleBreaker(self.config, pair).snapshot(pair).to_dict()
+        with self._global_lock:
+            result: dict = {"global": self._global.snapshot().to_dict()}
+        if pair:
+            with self._pair_lock(pair):
+                breaker = self._per_pair.get(pair)
+                if breaker is None:
+                    breaker = _SingleBreaker(self.config, pair)
+                result["pair"] = breaker.snapshot(pair).to_dict()
         return result
 
 
@@ -363,7 +492,7 @@ class CircuitBreaker:
 # ╚══════════════════════════════════════════════════════════════════╝
 
 
-@dataclass
+@dataclass(slots=True)
 class ReplayEvent:
     """One row in the replay audit log."""
 
@@ -383,15 +512,27 @@ class ReplayEvent:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class ReplayConfig:
     ttl_seconds: float = 60.0  # how long a signal_id is remembered
-    max_entries: int = 10_000  # bounded size (LRU eviction)
+    max_entries: int = 10_000  # bounded size (evicts fewest-hit of the oldest)
     nonce_check: bool = True  # enforce monotonic nonces per pair
     max_age_seconds: float = 30.0  # reject signals older than this
     audit_log_size: int = 500  # keep last N accept/reject decisions
 
 
+# Eviction samples this many of the oldest entries; hit counts saturate at
+# _MAX_HITS (then all counts are halved so recent hits still matter).
+_EVICTION_SAMPLE = 8
+_MAX_HITS = 0xFFFF
+
+# On-disk state: magic, then two tables (executed IDs, pair nonces), each a
+# u32 count followed by (f64 timestamp, u16 length, utf-8 key) entries.
+_STATE_MAGIC = b"RPL1"
+_STATE_COUNT = struct.Struct(">I")
+_STATE_ENTRY = struct.Struct(">dH")
+
+
 class ReplayProtection:
     """
     Deduplication + nonce + staleness guard.
@@ -399,16 +540,23 @@ class ReplayProtection:
     * **Dedup**: remembers ``signal_id`` for ``ttl_seconds``.
     * **Nonce**: per-pair monotonic timestamp — rejects out-of-order signals.
     * **Max-age**: rejects signals whose ``timestamp`` is too old.
-    * **LRU cap**: evicts oldest entries when ``max_entries`` is reached.
+    * **Bounded size**: when ``max_entries`` is reached, evicts the
+      least-hit of the oldest few entries.
     * **Audit log**: ring-buffer of accept/reject decisions.
     """
 
     def __init__(self, config: ReplayConfig = None):
         self.config = config or ReplayConfig()
-        # OrderedDict gives us LRU semantics
-        self._executed: OrderedDict[str, float] = OrderedDict()
+        # signal_id → (first executed at, monotonic ns; hit count).  Entries
+        # are never reordered, so the dict stays sorted by execution time.
+        self._executed: dict[str, tuple[int, int]] = {}
         self._pair_nonces: dict[str, float] = {}
-        self._audit: list[ReplayEvent] = []
+        self._ttl_ns = _to_ns(self.config.ttl_seconds)
+        self._last_cleanup = _now_ns()
+        self._audit: deque[ReplayEvent] = deque(maxlen=self.config.audit_log_size)
+        # Accept/reject counts over the events currently in ``_audit``
+        self._accepted = 0
+        self._rejected = 0
 
     # ── public API ────────────────────────────────────────────
 
@@ -419,52 +567,88 @@ class ReplayProtection:
         ``allowed=True`` means the signal may proceed.
         Every call is recorded in the audit log.
         """
-        self._cleanup()
+        now = time.time()  # wall clock: compared with signal timestamps
+        mono = _now_ns()
+        self._cleanup(mono)
+        return self._check(signal, now, mono)
+
+    def check_batch(self, signals: list[Signal]) -> list[tuple[bool, str]]:
+        """
+        :meth:`check` for several signals at once, sharing one clock read
+        and one cleanup sweep.  Checks don't mark anything executed, so the
+        results match calling :meth:`check` on each signal in turn.
+        """
+        now = time.time()
+        mono = _now_ns()
+        self._cleanup(mono)
+        check = self._check
+        return [check(signal, now, mono) for signal in signals]
+
+    def is_duplicate(self, signal: Signal) -> bool:
+        """Backward-compatible: True if signal should be rejected."""
+        allowed, _ = self.check(signal)
+        return not allowed
+
+    def _check(self, signal: Signal, now: float, mono: int) -> tuple[bool, str]:
+        cfg = self.config
+        timestamp = signal.timestamp
 
         # 1. Max-age check
-        age = time.time() - signal.timestamp
-        if age > self.config.max_age_seconds:
-            reason = f"stale: age {age:.1f}s > max {self.config.max_age_seconds}s"
-            self._log(signal, False, reason)
+        age = now - timestamp
+        if age > cfg.max_age_seconds:
+            reason = f"stale: age {age:.1f}s > max {cfg.max_age_seconds}s"
+            self._log(signal, False, reason, now)
             return False, reason
 
-        # 2. Duplicate ID check
-        if signal.signal_id in self._executed:
+        # 2. Duplicate ID check (the TTL test covers entries the rate-limited
+        # sweep hasn't reached yet).  One dict probe is already the cheap
+        # path: a Python-level Bloom filter in front of it costs ~10x more.
+        entry = self._executed.get(signal.signal_id)
+        if entry is not None and mono - entry[0] < self._ttl_ns:
+            self._hit(signal.signal_id, entry)
             reason = "duplicate signal_id"
-            self._log(signal, False, reason)
+            self._log(signal, False, reason, now)
             return False, reason
 
         # 3. Nonce monotonic check
-        if self.config.nonce_check:
+        if cfg.nonce_check:
             last_nonce = self._pair_nonces.get(signal.pair, 0.0)
-            if signal.timestamp <= last_nonce:
-                reason = (
-                    f"nonce stale: ts {signal.timestamp:.3f} <= last {last_nonce:.3f}"
-                )
-                self._log(signal, False, reason)
+            if timestamp <= last_nonce:
+                reason = f"nonce stale: ts {timestamp:.3f} <= last {last_nonce:.3f}"
+                self._log(signal, False, reason, now)
                 return False, reason
 
-        self._log(signal, True, "ok")
+        self._log(signal, True, "ok", now)
         return True, "ok"
 
-    def is_duplicate(self, signal: Signal) -> bool:
-        """Backward-compatible: True if signal should be rejected."""
-        allowed, _ = self.check(signal)
-        return not allowed
-
     def mark_executed(self, signal: Signal) -> None:
         """Record that *signal* was executed (or attempted)."""
-        self._executed[signal.signal_id] = time.time()
-        # Move to end (most recent)
-        self._executed.move_to_end(signal.signal_id)
-        # Update pair nonce
-        self._pair_nonces[signal.pair] = max(
-            self._pair_nonces.get(signal.pair, 0.0),
-            signal.timestamp,
-        )
-        # LRU eviction
-        while len(self._executed) > self.config.max_entries:
-            self._executed.popitem(last=False)
+        executed = self._executed
+        signal_id = signal.signal_id
+        entry = executed.get(signal_id)
+        now = _now_ns()
+        if entry is None:
+            executed[signal_id] = (now, 0)
+        elif now - entry[0] >= self._ttl_ns:
+            # Expired but not swept yet: start a fresh TTL.  Re-inserting
+            # moves the key to the end, keeping the dict in time order.
+            del executed[signal_id]
+            executed[signal_id] = (now, 0)
+        else:
+            self._hit(signal_id, entry)
+        # Update pair nonce (pair keys are interned: a handful of strings
+        # looked up on every check)
+        nonces = self._pair_nonces
+        if signal.timestamp > nonces.get(signal.pair, 0.0):
+            nonces[sys.intern(signal.pair)] = signal.timestamp
+        # Counter-based eviction: drop the least-hit of the oldest few
+        # entries (ties go to the oldest)
+        max_entries = self.config.max_entries
+        while len(executed) > max_entries:
+            victim = min(
+                islice(executed, _EVICTION_SAMPLE), key=lambda k: executed[k][1]
+            )
+            del executed[victim]
 
     @property
     def audit_log(self) -> list[dict]:
@@ -472,36 +656,116 @@ class ReplayProtection:
 
     @property
     def stats(self) -> dict:
-        accepted = sum(1 for e in self._audit if e.accepted)
-        rejected = len(self._audit) - accepted
         return {
             "tracked_ids": len(self._executed),
             "tracked_pairs": len(self._pair_nonces),
-            "audit_accepted": accepted,
-            "audit_rejected": rejected,
+            "audit_accepted": self._accepted,
+            "audit_rejected": self._rejected,
         }
 
-    # ── internals ─────────────────────────────────────────────
+    # ── persistence ───────────────────────────────────────────
+
+    def save(self, path: str | os.PathLike) -> None:
+        """
+        Write the dedup table and pair nonces to *path* in a compact
+        binary format, so a restarted bot keeps rejecting replays.
+        """
+        # Monotonic time is meaningless after a restart; store wall clock.
+        wall, mono = time.time(), _now_ns()
+        executed = {
+            signal_id: wall - (mono - executed_at) / _NS
+            for signal_id, (executed_at, _) in self._executed.items()
+        }
+        buf = bytearray(_STATE_MAGIC)
+        for table in (executed, self._pair_nonces):
+            buf += _STATE_COUNT.pack(len(table))
+            for key, ts in table.items():
+                raw = key.encode()
+                buf += _STATE_ENTRY.pack(ts, len(raw))
+                buf += raw
+        tmp = Path(f"{path}.tmp")
+        tmp.write_bytes(buf)
+        tmp.replace(path)
+
+    def load(self, path: str | os.PathLike) -> int:
+        """
+        Restore state written by :meth:`save`.  Entries older than
+        ``ttl_seconds`` are dropped.  Returns the number of signal IDs loaded.
+        """
+        data = Path(path).read_bytes()
+        if data[: len(_STATE_MAGIC)] != _STATE_MAGIC:
+            raise ValueError(f"{path}: not a replay-protection state file")
+        offset = len(_STATE_MAGIC)
+        tables: list[list[tuple[str, float]]] = []
+        for _ in range(2):
+            (count,) = _STATE_COUNT.unpack_from(data, offset)
+            offset += _STATE_COUNT.size
+            entries = []
+            for _ in range(count):
+                ts, size = _STATE_ENTRY.unpack_from(data, offset)
+                offset += _STATE_ENTRY.size
+                entries.append((data[offset : offset + size].decode(), ts))
+                offset += size
+            tables.append(entries)
+
+        executed, nonces = tables
+        wall, mono = time.time(), _now_ns()
+        cutoff = wall - self.config.ttl_seconds
+        for signal_id, ts in executed[-self.config.max_entries :]:
+            if ts > cutoff:
+                self._executed[signal_id] = (mono - _to_ns(wall - ts), 0)
+        for pair, ts in nonces:
+            self._pair_nonces[pair] = max(self._pair_nonces.get(pair, 0.0), ts)
+        return len(self._executed)
 
-    def _cleanup(self) -> None:
-        cutoff = time.time() - self.config.ttl_seconds
-        # Remove expired entries (oldest first thanks to OrderedDict)
-        expired = [k for k, v in self._executed.items() if v <= cutoff]
-        for k in expired:
-            del self._executed[k]
+    # ── internals ─────────────────────────────────────────────
 
-    def _log(self, signal: Signal, accepted: bool, reason: str) -> None:
+    def _cleanup(self, now: int) -> None:
+        # Sweep at most every ttl/16; check() applies the TTL exactly anyway.
+        if now - self._last_cleanup < self._ttl_ns >> 4:
+            return
+        self._last_cleanup = now
+        cutoff = now - self._ttl_ns
+        # Entries are kept in execution order, so the expired ones are all at
+        # the head: pop until the first live entry.
+        executed = self._executed
+        while executed:
+            oldest = next(iter(executed))
+            if executed[oldest][0] > cutoff:
+                break
+            del executed[oldest]
+
+    def _hit(self, signal_id: str, entry: tuple[int, int]) -> None:
+        """Bump *signal_id*'s hit count; halve every count on saturation."""
+        executed_at, hits = entry
+        if hits >= _MAX_HITS:
+            executed = self._executed
+            for key, (ts, count) in executed.items():
+                executed[key] = (ts, count >> 1)
+            hits >>= 1
+        self._executed[signal_id] = (executed_at, hits + 1)
+
+    def _log(self, signal: Signal, accepted: bool, reason: str, now: float) -> None:
         event = ReplayEvent(
             signal_id=signal.signal_id,
             pair=signal.pair,
-            timestamp=time.time(),
+            timestamp=now,
             accepted=accepted,
             reason=reason,
         )
-        self._audit.append(event)
-        # Ring-buffer cap
-        if len(self._audit) > self.config.audit_log_size:
-            self._audit = self._audit[-self.config.audit_log_size :]
+        audit = self._audit
+        if audit and len(audit) == audit.maxlen:
+            # deque(maxlen) is about to drop the oldest event
+            if audit[0].accepted:
+                self._accepted -= 1
+            else:
+                self._rejected -= 1
+        if audit.maxlen:
+            audit.append(event)
+            if accepted:
+                self._accepted += 1
+            else:
+                self._rejected += 1
         if not accepted:
             logger.debug("Replay REJECT %s: %s", signal.signal_id, reason)
 
@@ -511,6 +775,10 @@ class ReplayProtection:
 # ╚══════════════════════════════════════════════════════════════════╝
 
 
+# Outcome records kept for ``snapshot`` (which shows the last 20)
+_OUTCOME_HISTORY = 200
+
+
 @dataclass
 class RecoveryConfig:
     circuit_breaker: CircuitBreakerConfig = field(default_factory=CircuitBreakerConfig)
@@ -536,7 +804,7 @@ class RecoveryManager:
         self.replay = ReplayProtection(cfg.replay)
         self.classifier = FailureClassifier()
         self.alerter = alerter  # Optional WebhookAlerter
-        self._outcomes: list[dict] = []
+        self._outcomes: deque[dict] = deque(maxlen=_OUTCOME_HISTORY)
 
     # ── pre-flight gate ───────────────────────────────────────
 
@@ -564,6 +832,25 @@ class RecoveryManager:
 
         return True, "ok"
 
+    def pre_flight_batch(self, signals: list[Signal]) -> list[tuple[bool, str]]:
+        """
+        :meth:`pre_flight` for a batch of signals (e.g. one tick's worth).
+
+        The breaker is consulted once per distinct pair and the replay
+        checks share one clock read and cleanup sweep.
+        """
+        breaker_ok: dict[str, bool] = {}
+        for signal in signals:
+            if signal.pair not in breaker_ok:
+                breaker_ok[signal.pair] = self.circuit_breaker.allows_trade(signal.pair)
+        blocked = (False, "circuit breaker open")
+        results: list[tuple[bool, str]] = [blocked] * len(signals)
+        passed = [i for i, signal in enumerate(signals) if breaker_ok[signal.pair]]
+        replay = self.replay.check_batch([signals[i] for i in passed])
+        for i, result in zip(passed, replay):
+            results[i] = result
+        return results
+
     # ── outcome recording ─────────────────────────────────────
 
     def record_outcome(
@@ -576,20 +863,23 @@ class RecoveryManager:
         """Record the result of an execution attempt."""
         self.replay.mark_executed(signal)
 
+        category = self.classifier.classify(error)
+
         # Capture breaker state *before* recording
         was_open = self.circuit_breaker.is_open(signal.pair)
 
         if success:
             self.circuit_breaker.record_success(signal.pair, pnl)
         else:
-            category = self.classifier.classify(error)
             self.circuit_breaker.record_failure(signal.pair, category, pnl)
-
-        # Fire webhook if breaker just tripped
-        is_open_now = self.circuit_breaker.is_open(signal.pair)
-        if not was_open and is_open_now and self.alerter:
-            snap = self.circuit_breaker.snapshot(signal.pair)
-            self.alerter.on_circuit_breaker_trip(signal.pair, snap)
+            # Fire webhook if breaker just tripped (a success never trips it)
+            if (
+                not was_open
+                and self.alerter
+                and self.circuit_breaker.is_open(signal.pair)
+            ):
+                snap = self.circuit_breaker.snapshot(signal.pair)
+                self.alerter.on_circuit_breaker_trip(signal.pair, snap)
 
         self._outcomes.append(
             {
@@ -597,7 +887,7 @@ class RecoveryManager:
                 "pair": signal.pair,
                 "success": success,
                 "error": error,
-                "category": self.classifier.classify(error).name if error else None,
+                "category": category.name if error else None,
                 "pnl": pnl,
                 "ts": time.time(),
             }
@@ -609,5 +899,7 @@ class RecoveryManager:
         return {
             "circuit_breaker": self.circuit_breaker.snapshot(pair),
             "replay": self.replay.stats,
-            "recent_outcomes": self._outcomes[-20:],
+            "recent_outcomes": list(
+                islice(self._outcomes, max(0, len(self._outcomes) - 20), None)
+            ),
         }
@@ -3,28 +3,53 @@ from __future__ import annotations
 import argparse
 import csv
 import json
+import sys
+import time
+from bisect import bisect_left
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from decimal import ROUND_HALF_UP, Decimal
+from decimal import ROUND_HALF_UP, Decimal, InvalidOperation
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
-from typing import List
+from typing import List, TextIO
 
 import config
 from chain.client import ChainClient
 from core.base_types import Address
 from exchange.client import ExchangeClient
-from exchange.orderbook import OrderBookAnalyzer
 from inventory.pnl import PnLEngine
 from inventory.tracker import InventoryTracker, Venue
 from pricing.uniswap_v2_pair import Token, UniswapV2Pair
 
-PAIR_POOLS = {
-    "ETH/USDT": "0x0d4a11d5eeaac28ec3f61d100daf4d40471f1852",
-    "ETH/USDC": "0xB4e16d0168e52d35CaCD2c6185b44281Ec28C9Dc",
+try:  # optional: faster JSON parsing for balance snapshots
+    import orjson
+except ImportError:
+    orjson = None
+
+PAIR_POOLS: dict[str, Address] = {
+    "ETH/USDT": Address.from_string("0x0d4a11d5eeaac28ec3f61d100daf4d40471f1852"),
+    "ETH/USDC": Address.from_string("0xB4e16d0168e52d35CaCD2c6185b44281Ec28C9Dc"),
 }
 
+_UTC = timezone.utc
 
-@dataclass
+# Decimal constants used on every check; parsed once here.
+_BPS_MULT = Decimal(10000)
+_ZERO = Decimal(0)
+_DEFAULT_CEX_FEE_BPS = Decimal(10)  # fallback when the fee lookup fails
+_DEFAULT_DEX_FEE_BPS = Decimal(30)  # Uniswap V2 0.30% swap fee
+
+# Fee tiers change on the order of days; re-fetch hourly at most.
+_FEE_TTL_NS = 3600 * 1_000_000_000
+
+# Shared by every checker: the order book and fee lookups are independent
+# exchange round-trips, so check() issues them side by side.
+_CEX_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="arb-cex")
+
+
+@dataclass(slots=True)
 class SliceResult:
     """One incremental slice of the order."""
 
@@ -56,7 +81,22 @@ class OptimalSizeResult:
     total_slices: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
+class DirectionMetrics:
+    """Flat (single-size) economics for one arb direction."""
+
+    direction: str
+    buy_price: Decimal
+    sell_price: Decimal
+    gap_bps: Decimal
+    estimated_costs_bps: Decimal
+    estimated_net_pnl_bps: Decimal
+    dex_impact_bps: Decimal
+    cex_slippage_bps: Decimal
+    gas_cost_bps: Decimal
+
+
+@dataclass(slots=True)
 class ArbResult:
     pair: str
     timestamp: datetime
@@ -85,12 +125,28 @@ class ArbChecker:
         inventory_tracker: InventoryTracker,
         pnl_engine: PnLEngine,
         gas_cost_usd: Decimal = Decimal("5"),
+        book_ttl_s: float = 0.0,
     ):
         self._pricing_engine = pricing_engine
         self._exchange_client = exchange_client
         self._inventory = inventory_tracker
         self._pnl = pnl_engine
         self._gas_cost_usd = gas_cost_usd
+        # pair → (pool address, base token, quote token, base, quote).  The
+        # pool itself is re-read from the engine each check, since
+        # refresh_pool() replaces pool objects when reserves change.
+        self._resolution_cache: dict[
+            str, tuple[Address | None, Token, Token, str, str]
+        ] = {}
+        # {normalized base, quote} → pool address, built from engine.pools on
+        # the first lookup and rebuilt whenever a lookup misses.
+        self._pair_index: dict[frozenset[str], Address] = {}
+        # pair → (taker fee bps, monotonic ns when fetched)
+        self._fee_cache: dict[str, tuple[Decimal, int]] = {}
+        # pair → (order book, monotonic ns when fetched).  Books are only
+        # reused when book_ttl_s > 0, for callers polling faster than that.
+        self._book_ttl_ns = int(book_ttl_s * 1_000_000_000)
+        self._book_cache: dict[str, tuple[dict, int]] = {}
 
     def check(
         self,
@@ -109,31 +165,46 @@ class ArbChecker:
 
         `step` controls the granularity of each slice (default: size / 20).
         """
-        base_symbol, quote_symbol = _split_pair(pair)
-        pool = _resolve_pool(self._pricing_engine, base_symbol, quote_symbol)
-        base_token, quote_token = _resolve_tokens(pool, base_symbol, quote_symbol)
+        pool, base_token, quote_token, base_symbol, quote_symbol = self._resolve(pair)
 
-        orderbook = self._exchange_client.fetch_order_book(pair, limit=50)
-        analyzer = OrderBookAnalyzer(orderbook)
+        cex_fee = self._cached_fee_bps(pair)
+        fee_future = (
+            _CEX_POOL.submit(self._fetch_fee_bps, pair) if cex_fee is None else None
+        )
+        orderbook = self._cached_order_book(pair)
+        book_future = (
+            _CEX_POOL.submit(self._fetch_order_book, pair)
+            if orderbook is None
+            else None
+        )
+
+        # DEX pricing is pure CPU on in-memory reserves, so it runs while the
+        # exchange round-trips are in flight.
+        (
+            dex_buy_price,
+            dex_buy_impact_bps,
+            dex_sell_price,
+            dex_sell_impact_bps,
+        ) = _dex_prices(pool, base_token, quote_token, size)
+
+        if book_future is not None:
+            orderbook = book_future.result()
         best_bid = orderbook.get("best_bid")
         best_ask = orderbook.get("best_ask")
         if not best_bid or not best_ask:
             raise RuntimeError("Order book missing best bid/ask")
         cex_bid = best_bid[0]
         cex_ask = best_ask[0]
+        bid_levels = orderbook.get("bids", [])
+        ask_levels = orderbook.get("asks", [])
 
-        cex_fee = _cex_fee_bps(self._exchange_client, pair)
-        dex_fee_bps = Decimal("30")
+        if fee_future is not None:
+            cex_fee = fee_future.result()
+        dex_fee_bps = _DEFAULT_DEX_FEE_BPS
 
         # --- flat (legacy) metrics for both directions ---
-        dex_buy_price, dex_buy_impact_bps = _dex_buy_price(
-            pool, base_token, quote_token, size
-        )
-        dex_sell_price, dex_sell_impact_bps = _dex_sell_price(
-            pool, base_token, quote_token, size
-        )
-        cex_sell_slippage = analyzer.walk_the_book("sell", float(size))["slippage_bps"]
-        cex_buy_slippage = analyzer.walk_the_book("buy", float(size))["slippage_bps"]
+        cex_sell_slippage = _walk_slippage_bps(bid_levels, cex_bid, size, buy=False)
+        cex_buy_slippage = _walk_slippage_bps(ask_levels, cex_ask, size, buy=True)
 
         buy_dex_sell_cex = _direction_metrics(
             direction="buy_dex_sell_cex",
@@ -158,80 +229,100 @@ class ArbChecker:
             size=size,
         )
 
-        chosen_flat = max(
-            [buy_dex_sell_cex, buy_cex_sell_dex],
-            key=lambda item: item["estimated_net_pnl_bps"],
+        # Ties go to buy_dex_sell_cex, as max() over the pair would.
+        chosen_flat = (
+            buy_dex_sell_cex
+            if buy_dex_sell_cex.estimated_net_pnl_bps
+            >= buy_cex_sell_dex.estimated_net_pnl_bps
+            else buy_cex_sell_dex
         )
 
         # --- optimal-size via marginal pricing ---
         optimal_result: OptimalSizeResult | None = None
         effective_size = size
-        effective_direction = chosen_flat["direction"]
+        effective_direction = chosen_flat.direction
 
         if optimize:
             if step is None:
                 step = size / Decimal("20")
                 if step <= 0:
                     step = size
+            # No slice can beat the touch against the DEX spot price (AMM fills
+            # are never better than spot, book fills never better than the
+            # best bid/ask).  A direction whose touch gap does not clear the
+            # CEX fee would only walk one losing slice, so it is not run; its
+            # empty result still takes part in the tie-break below.
+            spot = _dex_spot_price(pool, base_token, quote_token)
+            if (cex_bid - spot) / spot * _BPS_MULT > cex_fee:
+                opt_buy_dex = find_optimal_size(
+                    pool=pool,
+                    base_token=base_token,
+                    quote_token=quote_token,
+                    direction="buy_dex_sell_cex",
+                    # The optimizer never takes more than `size` from the book.
+                    cex_levels=_trim_book(bid_levels, size),
+                    max_size=size,
+                    step=step,
+                    cex_fee_bps=cex_fee,
+                    dex_fee_bps=dex_fee_bps,
+                    gas_cost_usd=self._gas_cost_usd,
+                )
+            else:
+                opt_buy_dex = _empty_optimal_size("buy_dex_sell_cex", size)
+            if (spot - cex_ask) / cex_ask * _BPS_MULT > cex_fee:
+                opt_buy_cex = find_optimal_size(
+                    pool=pool,
+                    base_token=base_token,
+                    quote_token=quote_token,
+                    direction="buy_cex_sell_dex",
+                    cex_levels=_trim_book(ask_levels, size),
+                    max_size=size,
+                    step=step,
+                    cex_fee_bps=cex_fee,
+                    dex_fee_bps=dex_fee_bps,
+                    gas_cost_usd=self._gas_cost_usd,
+                )
+            else:
+                opt_buy_cex = _empty_optimal_size("buy_cex_sell_dex", size)
 
-            bid_levels = orderbook.get("bids", [])
-            ask_levels = orderbook.get("asks", [])
-
-            opt_buy_dex = find_optimal_size(
-                pool=pool,
-                base_token=base_token,
-                quote_token=quote_token,
-                direction="buy_dex_sell_cex",
-                cex_levels=bid_levels,
-                max_size=size,
-                step=step,
-                cex_fee_bps=cex_fee,
-                dex_fee_bps=dex_fee_bps,
-                gas_cost_usd=self._gas_cost_usd,
-            )
-            opt_buy_cex = find_optimal_size(
-                pool=pool,
-                base_token=base_token,
-                quote_token=quote_token,
-                direction="buy_cex_sell_dex",
-                cex_levels=ask_levels,
-                max_size=size,
-                step=step,
-                cex_fee_bps=cex_fee,
-                dex_fee_bps=dex_fee_bps,
-                gas_cost_usd=self._gas_cost_usd,
-            )
-
-            optimal_result = max(
-                [opt_buy_dex, opt_buy_cex],
-                key=lambda r: r.total_net_pnl_usd,
+            optimal_result = (
+                opt_buy_dex
+                if opt_buy_dex.total_net_pnl_usd >= opt_buy_cex.total_net_pnl_usd
+                else opt_buy_cex
             )
             effective_size = optimal_result.optimal_size
             effective_direction = optimal_result.direction
 
-        # Recompute flat metrics at effective_size for the report
-        if optimize and effective_size > 0 and effective_size != size:
-            dex_buy_price, dex_buy_impact_bps = _dex_buy_price(
-                pool, base_token, quote_token, effective_size
-            )
-            dex_sell_price, dex_sell_impact_bps = _dex_sell_price(
-                pool, base_token, quote_token, effective_size
-            )
-            cex_sell_slippage = analyzer.walk_the_book("sell", float(effective_size))[
-                "slippage_bps"
-            ]
-            cex_buy_slippage = analyzer.walk_the_book("buy", float(effective_size))[
-                "slippage_bps"
-            ]
-
+        # Recompute flat metrics at effective_size for the report.  Both DEX
+        # prices are reported and come from one reserve read, but only the
+        # chosen direction's side of the book needs walking again.
+        resized = optimize and effective_size > 0 and effective_size != size
+        if resized:
+            (
+                dex_buy_price,
+                dex_buy_impact_bps,
+                dex_sell_price,
+                dex_sell_impact_bps,
+            ) = _dex_prices(pool, base_token, quote_token, effective_size)
+
+        # The optimizer can settle on zero; report the requested size then.
+        trade_size = effective_size if effective_size > 0 else size
         if effective_direction == "buy_dex_sell_cex":
             chosen_impact = dex_buy_impact_bps
-            chosen_slippage = cex_sell_slippage
+            chosen_slippage = (
+                _walk_slippage_bps(bid_levels, cex_bid, effective_size, buy=False)
+                if resized
+                else cex_sell_slippage
+            )
             chosen_buy = dex_buy_price
             chosen_sell = cex_bid
         else:
             chosen_impact = dex_sell_impact_bps
-            chosen_slippage = cex_buy_slippage
+            chosen_slippage = (
+                _walk_slippage_bps(ask_levels, cex_ask, effective_size, buy=True)
+                if resized
+                else cex_buy_slippage
+            )
             chosen_buy = cex_ask
             chosen_sell = dex_sell_price
 
@@ -244,16 +335,16 @@ class ArbChecker:
             cex_fee_bps=cex_fee,
             dex_fee_bps=dex_fee_bps,
             gas_cost_usd=self._gas_cost_usd,
-            size=effective_size if effective_size > 0 else size,
+            size=trade_size,
         )
 
         inventory_ok, inventory_details = _inventory_check(
             self._inventory,
-            chosen["direction"],
+            chosen.direction,
             base_symbol,
             quote_symbol,
-            effective_size if effective_size > 0 else size,
-            chosen["buy_price"],
+            trade_size,
+            chosen.buy_price,
         )
 
         # When optimization is active, use the optimizer's USD PnL (which
@@ -262,34 +353,34 @@ class ArbChecker:
         if optimize and optimal_result is not None:
             is_profitable = optimal_result.total_net_pnl_usd > 0
         else:
-            is_profitable = chosen["estimated_net_pnl_bps"] > 0
+            is_profitable = chosen.estimated_net_pnl_bps > 0
 
         executable = inventory_ok and is_profitable and effective_size > 0
 
         result = {
             "pair": pair,
-            "timestamp": datetime.now(timezone.utc),
+            "timestamp": datetime.now(_UTC),
             "dex_buy_price": dex_buy_price,
             "dex_sell_price": dex_sell_price,
             "cex_bid": cex_bid,
             "cex_ask": cex_ask,
-            "gap_bps": chosen["gap_bps"],
-            "direction": chosen["direction"],
-            "estimated_costs_bps": chosen["estimated_costs_bps"],
-            "estimated_net_pnl_bps": chosen["estimated_net_pnl_bps"],
+            "gap_bps": chosen.gap_bps,
+            "direction": chosen.direction,
+            "estimated_costs_bps": chosen.estimated_costs_bps,
+            "estimated_net_pnl_bps": chosen.estimated_net_pnl_bps,
             "inventory_ok": inventory_ok,
             "executable": executable,
             "requested_size": size,
             "effective_size": effective_size,
             "details": {
-                "dex_price_impact_bps": chosen["dex_impact_bps"],
-                "cex_slippage_bps": chosen["cex_slippage_bps"],
+                "dex_price_impact_bps": chosen.dex_impact_bps,
+                "cex_slippage_bps": chosen.cex_slippage_bps,
                 "cex_fee_bps": cex_fee,
                 "dex_fee_bps": dex_fee_bps,
                 "gas_cost_usd": self._gas_cost_usd,
-                "gas_cost_bps": chosen["gas_cost_bps"],
-                "buy_price": chosen["buy_price"],
-                "sell_price": chosen["sell_price"],
+                "gas_cost_bps": chosen.gas_cost_bps,
+                "buy_price": chosen.buy_price,
+                "sell_price": chosen.sell_price,
                 **inventory_details,
             },
             "directions": {
@@ -313,6 +404,97 @@ class ArbChecker:
 
         return result
 
+    def scan(
+        self,
+        requests: list[tuple[str, Decimal]],
+        optimize: bool = True,
+        step: Decimal | None = None,
+    ) -> list[dict]:
+        """
+        Run check() for each (pair, size) concurrently, reusing this
+        checker's clients.  Results come back in request order.
+
+        The exchange client is shared by every worker, so it must be safe
+        to call from several threads (ExchangeClient's RateLimiter is).
+        """
+        if not requests:
+            return []
+        with ThreadPoolExecutor(max_workers=min(len(requests), 8)) as executor:
+            futures = [
+                executor.submit(self.check, pair, size, optimize, step)
+                for pair, size in requests
+            ]
+            return [future.result() for future in futures]
+
+    def _cached_fee_bps(self, pair: str) -> Decimal | None:
+        """Taker fee in bps for *pair* if fetched within ``_FEE_TTL_NS``."""
+        cached = self._fee_cache.get(pair.upper())
+        if cached is not None and time.monotonic_ns() - cached[1] <= _FEE_TTL_NS:
+            return cached[0]
+        return None
+
+    def _fetch_fee_bps(self, pair: str) -> Decimal:
+        """Fetch and cache the taker fee; the fallback on error is not cached."""
+        try:
+            fees = self._exchange_client.get_trading_fees(pair)
+            fee = fees.get("taker", _ZERO) * _BPS_MULT
+        except Exception:
+            return _DEFAULT_CEX_FEE_BPS
+        self._fee_cache[pair.upper()] = (fee, time.monotonic_ns())
+        return fee
+
+    def _cached_order_book(self, pair: str) -> dict | None:
+        """Order book for *pair* if fetched within ``book_ttl_s``."""
+        if not self._book_ttl_ns:
+            return None
+        cached = self._book_cache.get(pair.upper())
+        if cached is not None and time.monotonic_ns() - cached[1] <= self._book_ttl_ns:
+            return cached[0]
+        return None
+
+    def _fetch_order_book(self, pair: str) -> dict:
+        orderbook = self._exchange_client.fetch_order_book(pair, limit=50)
+        if self._book_ttl_ns:
+            self._book_cache[pair.upper()] = (orderbook, time.monotonic_ns())
+        return orderbook
+
+    def _resolve(self, pair: str) -> tuple[UniswapV2Pair, Token, Token, str, str]:
+        """Pool, base/quote tokens and symbols for *pair* (cached per pair)."""
+        key = pair.upper()
+        engine = self._pricing_engine
+        cached = self._resolution_cache.get(key)
+        if cached is not None:
+            address, base_token, quote_token, base_symbol, quote_symbol = cached
+            pool = engine if address is None else engine.pools.get(address)
+            if pool is not None:
+                return pool, base_token, quote_token, base_symbol, quote_symbol
+
+        base_symbol, quote_symbol = _split_pair(pair)
+        pool = self._lookup_pool(base_symbol, quote_symbol)
+        base_token, quote_token = _resolve_tokens(pool, base_symbol, quote_symbol)
+        address = None if pool is engine else pool.address
+        self._resolution_cache[key] = (
+            address,
+            base_token,
+            quote_token,
+            base_symbol,
+            quote_symbol,
+        )
+        return pool, base_token, quote_token, base_symbol, quote_symbol
+
+    def _lookup_pool(self, base: str, quote: str) -> UniswapV2Pair:
+        engine = self._pricing_engine
+        if isinstance(engine, UniswapV2Pair) or not hasattr(engine, "pools"):
+            return _resolve_pool(engine, base, quote)
+        key = frozenset((_normalize_symbol(base), _normalize_symbol(quote)))
+        address = self._pair_index.get(key)
+        if address is None or address not in engine.pools:
+            self._pair_index = _index_pairs(engine.pools)
+            address = self._pair_index.get(key)
+        if address is None:
+            raise ValueError("No matching DEX pool found for pair")
+        return engine.pools[address]
+
 
 def _split_pair(pair: str) -> tuple[str, str]:
     parts = pair.split("/")
@@ -331,6 +513,16 @@ def _resolve_pool(pricing_engine, base: str, quote: str) -> UniswapV2Pair:
     raise ValueError("No matching DEX pool found for pair")
 
 
+def _index_pairs(pools: dict[Address, UniswapV2Pair]) -> dict[frozenset[str], Address]:
+    index: dict[frozenset[str], Address] = {}
+    for address, pool in pools.items():
+        symbols = (pool.token0.symbol, pool.token1.symbol)
+        key = frozenset(map(_normalize_symbol, symbols))
+        # first pool wins, as in the linear scan of _resolve_pool()
+        index.setdefault(key, address)
+    return index
+
+
 def _matches_pair(pool: UniswapV2Pair, base: str, quote: str) -> bool:
     symbols = {
         _normalize_symbol(pool.token0.symbol),
@@ -339,6 +531,7 @@ def _matches_pair(pool: UniswapV2Pair, base: str, quote: str) -> bool:
     return _normalize_symbol(base) in symbols and _normalize_symbol(quote) in symbols
 
 
+@lru_cache(maxsize=64)
 def _normalize_symbol(symbol: str) -> str:
     symbol = symbol.upper()
     if symbol == "ETH":
@@ -359,35 +552,110 @@ def _resolve_tokens(pool: UniswapV2Pair, base: str, quote: str) -> tuple[Token,
     return base_token, quote_token
 
 
+# 10**decimals for every ERC-20 decimals value in use; Decimal * int is exact
+# for these, so _to_raw/_from_raw skip building a Decimal power per call.
+_POW10: tuple[int, ...] = tuple(10**i for i in range(40))
+
+
 def _to_raw(amount: Decimal, decimals: int) -> int:
-    scale = Decimal(10) ** decimals
-    return int((amount * scale).to_integral_value(rounding=ROUND_HALF_UP))
+    return int((amount * _POW10[decimals]).to_integral_value(rounding=ROUND_HALF_UP))
 
 
 def _from_raw(amount: int, decimals: int) -> Decimal:
-    return Decimal(amount) / (Decimal(10) ** decimals)
+    return Decimal(amount) / _POW10[decimals]
 
 
-def _dex_buy_price(
+def _dex_prices(
     pool: UniswapV2Pair, base: Token, quote: Token, size: Decimal
-) -> tuple[Decimal, Decimal]:
-    base_raw = _to_raw(size, base.decimals)
-    quote_raw = pool.get_amount_in(base_raw, token_out=base)
-    quote_amount = _from_raw(quote_raw, quote.decimals)
-    price = quote_amount / size
-    impact = pool.get_price_impact(quote_raw, token_in=quote) * Decimal("10000")
-    return price, impact
+) -> tuple[Decimal, Decimal, Decimal, Decimal]:
+    """
+    DEX buy and sell prices for `size` base, with their price impacts in bps,
+    from a single read of the pool reserves.  The integer math mirrors
+    UniswapV2Pair.get_amount_in/get_amount_out/get_price_impact exactly.
 
+    Returns (buy_price, buy_impact_bps, sell_price, sell_impact_bps).
+    """
+    if base.address == pool.token0.address:
+        reserve_base, reserve_quote = pool.reserve0, pool.reserve1
+    elif base.address == pool.token1.address:
+        reserve_base, reserve_quote = pool.reserve1, pool.reserve0
+    else:
+        raise ValueError("token not in pair")
+    if reserve_base <= 0 or reserve_quote <= 0:
+        raise ValueError("reserves must be positive")
 
-def _dex_sell_price(
-    pool: UniswapV2Pair, base: Token, quote: Token, size: Decimal
-) -> tuple[Decimal, Decimal]:
     base_raw = _to_raw(size, base.decimals)
-    quote_raw = pool.get_amount_out(base_raw, token_in=base)
-    quote_amount = _from_raw(quote_raw, quote.decimals)
-    price = quote_amount / size
-    impact = pool.get_price_impact(base_raw, token_in=base) * Decimal("10000")
-    return price, impact
+    if base_raw <= 0:
+        raise ValueError("amount must be positive")
+    if base_raw >= reserve_base:
+        raise ValueError("amount_out must be less than reserve_out")
+    fee_mult = 10000 - pool.fee_bps
+
+    # buy: quote in for exactly base_raw out, then quote_in back through the
+    # untouched pool for the execution price used by the impact
+    quote_in = (
+        base_raw * reserve_quote * 10000 // ((reserve_base - base_raw) * fee_mult) + 1
+    )
+    quote_in_with_fee = quote_in * fee_mult
+    base_out = (
+        quote_in_with_fee * reserve_base // (reserve_quote * 10000 + quote_in_with_fee)
+    )
+    # sell: base_raw in for quote out
+    base_in_with_fee = base_raw * fee_mult
+    quote_out = (
+        base_in_with_fee * reserve_quote // (reserve_base * 10000 + base_in_with_fee)
+    )
+
+    buy_spot = Decimal(reserve_base) / Decimal(reserve_quote)
+    buy_execution = Decimal(base_out) / Decimal(quote_in)
+    buy_impact = (buy_spot - buy_execution) / buy_spot * _BPS_MULT
+    sell_spot = Decimal(reserve_quote) / Decimal(reserve_base)
+    sell_execution = Decimal(quote_out) / Decimal(base_raw)
+    sell_impact = (sell_spot - sell_execution) / sell_spot * _BPS_MULT
+
+    buy_price = _from_raw(quote_in, quote.decimals) / size
+    sell_price = _from_raw(quote_out, quote.decimals) / size
+    return buy_price, buy_impact, sell_price, sell_impact
+
+
+def _dex_spot_price(pool: UniswapV2Pair, base: Token, quote: Token) -> Decimal:
+    """DEX spot price in quote per base, before fee and price impact."""
+    raw_spot = pool.get_spot_price(base)
+    return raw_spot * _POW10[base.decimals] / _POW10[quote.decimals]
+
+
+def _walk_slippage_bps(
+    levels: list[tuple[Decimal, Decimal]],
+    best_price: Decimal,
+    size: Decimal,
+    buy: bool,
+) -> Decimal:
+    """
+    Slippage in bps vs `best_price` for filling `size` against `levels`.
+
+    Same walk as OrderBookAnalyzer.walk_the_book, but it only accumulates
+    the totals instead of building per-level fills and a result dict.
+    """
+    if size <= 0:
+        raise ValueError("qty must be positive")
+    remaining = size
+    total_cost = _ZERO
+    total_filled = _ZERO
+    for price, level_qty in levels:
+        if level_qty >= remaining:
+            total_cost += remaining * price
+            total_filled += remaining
+            break
+        total_cost += level_qty * price
+        total_filled += level_qty
+        remaining -= level_qty
+
+    if not best_price or total_filled <= 0:
+        return _ZERO
+    avg_price = total_cost / total_filled
+    if buy:
+        return (avg_price - best_price) / best_price * _BPS_MULT
+    return (best_price - avg_price) / best_price * _BPS_MULT
 
 
 def _marginal_dex_buy_price(
@@ -396,16 +664,17 @@ def _marginal_dex_buy_price(
     """
     Marginal DEX buy price: how much quote we pay for `step_size` base
     on the CURRENT pool state. Returns (price_per_base, updated_pool).
+
+    Reference implementation on UniswapV2Pair; find_optimal_size uses the
+    raw-integer _dex_slice instead and is tested against this.
     """
     base_raw = _to_raw(step_size, base.decimals)
     if base_raw <= 0:
-        return Decimal("0"), pool
-    quote_raw = pool.get_amount_in(base_raw, token_out=base)
+        return _ZERO, pool
+    # we pay quote_raw in to receive base_raw out
+    quote_raw, updated_pool = pool.quote_and_swap_in(base_raw, token_out=base)
     quote_amount = _from_raw(quote_raw, quote.decimals)
     price = quote_amount / step_size
-    # simulate the swap: we send quote_raw in, get base_raw out
-    # For get_amount_in, the "token_in" is quote (we pay quote to receive base)
-    updated_pool = pool.simulate_swap(quote_raw, token_in=quote)
     return price, updated_pool
 
 
@@ -415,17 +684,114 @@ def _marginal_dex_sell_price(
     """
     Marginal DEX sell price: how much quote we receive for `step_size` base
     on the CURRENT pool state. Returns (price_per_base, updated_pool).
+
+    Reference implementation on UniswapV2Pair; find_optimal_size uses the
+    raw-integer _dex_slice instead and is tested against this.
     """
     base_raw = _to_raw(step_size, base.decimals)
     if base_raw <= 0:
-        return Decimal("0"), pool
-    quote_raw = pool.get_amount_out(base_raw, token_in=base)
+        return _ZERO, pool
+    quote_raw, updated_pool = pool.quote_and_swap_out(base_raw, token_in=base)
     quote_amount = _from_raw(quote_raw, quote.decimals)
     price = quote_amount / step_size
-    updated_pool = pool.simulate_swap(base_raw, token_in=base)
     return price, updated_pool
 
 
+def _dex_slice(
+    reserve_base: int, reserve_quote: int, base_raw: int, fee_mult: int, buy: bool
+) -> tuple[int, int, int]:
+    """
+    One optimizer slice against raw (base, quote) reserves: the quote paid
+    (buy) or received (sell) for `base_raw`, and the reserves after the swap.
+    Mirrors UniswapV2Pair.get_amount_in/get_amount_out + simulate_swap.
+    """
+    if reserve_base <= 0 or reserve_quote <= 0:
+        raise ValueError("reserves must be positive")
+    if buy:
+        if base_raw >= reserve_base:
+            raise ValueError("amount_out must be less than reserve_out")
+        quote_raw = (
+            base_raw * reserve_quote * 10000 // ((reserve_base - base_raw) * fee_mult)
+            + 1
+        )
+        # simulate_swap pushes quote_raw back in, which may release a little
+        # more than base_raw because of the +1 rounding above
+        quote_with_fee = quote_raw * fee_mult
+        base_out = (
+            quote_with_fee * reserve_base // (reserve_quote * 10000 + quote_with_fee)
+        )
+        return quote_raw, reserve_base - base_out, reserve_quote + quote_raw
+    base_with_fee = base_raw * fee_mult
+    quote_raw = base_with_fee * reserve_quote // (reserve_base * 10000 + base_with_fee)
+    return quote_raw, reserve_base + base_raw, reserve_quote - quote_raw
+
+
+def _trim_book(
+    levels: list[tuple[Decimal, Decimal]], max_qty: Decimal
+) -> list[tuple[Decimal, Decimal]]:
+    """Shortest top-of-book prefix holding at least `max_qty` base."""
+    depth = _ZERO
+    for k, (_, level_qty) in enumerate(levels):
+        depth += level_qty
+        if depth >= max_qty:
+            return levels[: k + 1]
+    return levels
+
+
+# (prices, cum_qty, cum_cost) for one side of the book; see _prepare_book().
+_PrefixBook = tuple[list[Decimal], list[Decimal], list[Decimal]]
+
+
+def _prepare_book(levels: list[tuple[Decimal, Decimal]]) -> _PrefixBook:
+    """
+    Prefix sums over an order book side: (prices, cum_qty, cum_cost), where
+    cum_qty[i] / cum_cost[i] are the base quantity / quote cost of taking
+    every level up to and including level i.  Empty levels are dropped so
+    cum_qty is strictly increasing.
+    """
+    prices: list[Decimal] = []
+    cum_qty: list[Decimal] = []
+    cum_cost: list[Decimal] = []
+    qty_total = _ZERO
+    cost_total = _ZERO
+    for price, level_qty in levels:
+        if level_qty <= 0:
+            continue
+        qty_total += level_qty
+        cost_total += price * level_qty
+        prices.append(price)
+        cum_qty.append(qty_total)
+        cum_cost.append(cost_total)
+    return prices, cum_qty, cum_cost
+
+
+def _book_cost_to(book: _PrefixBook, qty: Decimal) -> Decimal:
+    """Quote cost of taking the first `qty` base (qty <= book depth)."""
+    prices, cum_qty, cum_cost = book
+    k = bisect_left(cum_qty, qty)
+    if cum_qty[k] == qty:
+        return cum_cost[k]
+    if k == 0:
+        return prices[0] * qty
+    return cum_cost[k - 1] + prices[k] * (qty - cum_qty[k - 1])
+
+
+def _marginal_cex_price_prefixed(
+    book: _PrefixBook,
+    already_consumed: Decimal,
+    step_size: Decimal,
+) -> Decimal:
+    """_marginal_cex_price over a _prepare_book() result: O(log L) per slice."""
+    cum_qty = book[1]
+    if not cum_qty:
+        return _ZERO
+    low = already_consumed if already_consumed > 0 else _ZERO
+    high = min(low + step_size, cum_qty[-1])
+    if high <= low:
+        return _ZERO
+    return (_book_cost_to(book, high) - _book_cost_to(book, low)) / (high - low)
+
+
 def _marginal_cex_price(
     levels: list[tuple[Decimal, Decimal]],
     already_consumed: Decimal,
@@ -436,27 +802,9 @@ def _marginal_cex_price(
     `already_consumed` base has already been eaten from the book.
     Returns volume-weighted avg price for this slice.
     """
-    skipped = Decimal("0")
-    remaining = step_size
-    total_cost = Decimal("0")
-    total_filled = Decimal("0")
-
-    for price, level_qty in levels:
-        if remaining <= 0:
-            break
-        # skip already consumed volume
-        available = level_qty - max(Decimal("0"), already_consumed - skipped)
-        skipped += level_qty
-        if available <= 0:
-            continue
-        take = min(remaining, available)
-        total_cost += take * price
-        total_filled += take
-        remaining -= take
-
-    if total_filled <= 0:
-        return Decimal("0")
-    return total_cost / total_filled
+    return _marginal_cex_price_prefixed(
+        _prepare_book(levels), already_consumed, step_size
+    )
 
 
 def find_optimal_size(
@@ -467,8 +815,8 @@ def find_optimal_size(
     cex_levels: list[tuple[Decimal, Decimal]],
     max_size: Decimal,
     step: Decimal,
-    cex_fee_bps: Decimal = Decimal("10"),
-    dex_fee_bps: Decimal = Decimal("30"),
+    cex_fee_bps: Decimal = _DEFAULT_CEX_FEE_BPS,
+    dex_fee_bps: Decimal = _DEFAULT_DEX_FEE_BPS,
     gas_cost_usd: Decimal = Decimal("5"),
 ) -> OptimalSizeResult:
     """
@@ -493,61 +841,80 @@ def find_optimal_size(
         raise ValueError("max_size must be positive")
 
     slices: list[SliceResult] = []
-    current_pool = pool
-    consumed_cex = Decimal("0")
-    cumulative_size = Decimal("0")
-    cumulative_pnl_usd = Decimal("0")
-    best_pnl_usd = Decimal("0")
-    best_size = Decimal("0")
-    total_buy_cost = Decimal("0")
-    total_sell_revenue = Decimal("0")
-    best_buy_cost = Decimal("0")
-    best_sell_revenue = Decimal("0")
+    consumed_cex = _ZERO
+    cumulative_size = _ZERO
+    cumulative_pnl_usd = _ZERO
+    best_pnl_usd = _ZERO
+    best_size = _ZERO
+    total_buy_cost = _ZERO
+    total_sell_revenue = _ZERO
+    best_buy_cost = _ZERO
+    best_sell_revenue = _ZERO
 
     # Gas is a FIXED cost — it does not depend on trade size.
     # We evaluate each marginal slice WITHOUT gas, then subtract gas
     # from the cumulative PnL.  The optimal size is where
     # cumulative_gross_pnl - gas is maximised and > 0.
 
+    if direction == "buy_dex_sell_cex":
+        buy_on_dex = True
+    elif direction == "buy_cex_sell_dex":
+        buy_on_dex = False
+    else:
+        raise ValueError(f"Unknown direction: {direction}")
+
+    # Loop invariants.  Marginal costs are only the CEX fee: the DEX fee is
+    # already baked into the AMM price, and gas is NOT per-slice — it is
+    # subtracted from the cumulative total.
+    slice_cost_bps = cex_fee_bps
+    slice_cost_frac = slice_cost_bps / _BPS_MULT
+    cex_book = _prepare_book(cex_levels)
+
+    # The DEX side walks the pool as a series of raw integer reserves:
+    # orient them once instead of building a UniswapV2Pair per slice.
+    if base_token.address == pool.token0.address:
+        reserve_base, reserve_quote = pool.reserve0, pool.reserve1
+    elif base_token.address == pool.token1.address:
+        reserve_base, reserve_quote = pool.reserve1, pool.reserve0
+    else:
+        raise ValueError("token not in pair")
+    fee_mult = 10000 - pool.fee_bps
+    base_decimals = base_token.decimals
+    quote_decimals = quote_token.decimals
+    size_limit = max_size + step / 2
+    profitable_count = 0
+
     slice_index = 0
-    while cumulative_size + step <= max_size + step / 2:
+    while cumulative_size + step <= size_limit:
         actual_step = min(step, max_size - cumulative_size)
         if actual_step <= 0:
             break
 
-        if direction == "buy_dex_sell_cex":
-            marginal_buy, updated_pool = _marginal_dex_buy_price(
-                current_pool, base_token, quote_token, actual_step
-            )
-            marginal_sell = _marginal_cex_price(cex_levels, consumed_cex, actual_step)
-        elif direction == "buy_cex_sell_dex":
-            marginal_buy = _marginal_cex_price(cex_levels, consumed_cex, actual_step)
-            marginal_sell, updated_pool = _marginal_dex_sell_price(
-                current_pool, base_token, quote_token, actual_step
+        base_raw = _to_raw(actual_step, base_decimals)
+        if base_raw > 0:
+            quote_raw, next_base, next_quote = _dex_slice(
+                reserve_base, reserve_quote, base_raw, fee_mult, buy_on_dex
             )
+            marginal_dex = _from_raw(quote_raw, quote_decimals) / actual_step
         else:
-            raise ValueError(f"Unknown direction: {direction}")
+            marginal_dex = _ZERO
+        marginal_cex = _marginal_cex_price_prefixed(cex_book, consumed_cex, actual_step)
+        if buy_on_dex:
+            marginal_buy, marginal_sell = marginal_dex, marginal_cex
+        else:
+            marginal_buy, marginal_sell = marginal_cex, marginal_dex
 
         if marginal_buy <= 0 or marginal_sell <= 0:
             break  # no more liquidity
 
-        # Marginal gap for this slice
+        # Marginal gap for this slice (marginal_buy > 0 from here on)
         marginal_gap = marginal_sell - marginal_buy
-        marginal_gap_bps = (
-            marginal_gap / marginal_buy * Decimal("10000")
-            if marginal_buy > 0
-            else Decimal("0")
-        )
-
-        # Marginal costs: only CEX fee.
-        # DEX fee is already baked into the AMM price.
-        # Gas is NOT per-slice — it is subtracted from cumulative total.
-        slice_cost_bps = cex_fee_bps
+        marginal_gap_bps = marginal_gap / marginal_buy * _BPS_MULT
         marginal_net_pnl_bps = marginal_gap_bps - slice_cost_bps
 
         # USD PnL for this slice (before gas)
         slice_pnl_usd = marginal_gap * actual_step - (
-            slice_cost_bps / Decimal("10000") * marginal_buy * actual_step
+            slice_cost_frac * marginal_buy * actual_step
         )
 
         cumulative_size += actual_step
@@ -561,6 +928,8 @@ def find_optimal_size(
 
         # A slice is "profitable" if its own marginal PnL > 0 (ignoring gas)
         is_profitable = marginal_net_pnl_bps > 0
+        if is_profitable:
+            profitable_count += 1
 
         # cumulative PnL AFTER gas
         cum_net_after_gas = cumulative_pnl_usd - gas_cost_usd
@@ -569,12 +938,8 @@ def find_optimal_size(
             slice_index=slice_index,
             slice_size=actual_step,
             cumulative_size=cumulative_size,
-            marginal_dex_price=(
-                marginal_buy if direction == "buy_dex_sell_cex" else marginal_sell
-            ),
-            marginal_cex_price=(
-                marginal_sell if direction == "buy_dex_sell_cex" else marginal_buy
-            ),
+            marginal_dex_price=marginal_dex,
+            marginal_cex_price=marginal_cex,
             marginal_gap_bps=marginal_gap_bps,
             marginal_costs_bps=slice_cost_bps,
             marginal_net_pnl_bps=marginal_net_pnl_bps,
@@ -591,23 +956,19 @@ def find_optimal_size(
             best_sell_revenue = total_sell_revenue
 
         # Update pool state for next iteration
-        current_pool = updated_pool
+        reserve_base, reserve_quote = next_base, next_quote
 
         slice_index += 1
 
-        # Early stop: if last N slices are all unprofitable, no point continuing
-        if len(slices) >= 3 and all(not s.profitable for s in slices[-3:]):
+        # Marginal prices only get worse as the order grows (the tests pin
+        # this) while the per-slice cost is fixed, so once a slice is
+        # unprofitable no later slice can add PnL; skip straight to the result.
+        if not is_profitable:
             break
 
-    profitable_count = sum(1 for s in slices if s.profitable)
-
-    avg_buy = best_buy_cost / best_size if best_size > 0 else Decimal("0")
-    avg_sell = best_sell_revenue / best_size if best_size > 0 else Decimal("0")
-    total_bps = (
-        (avg_sell - avg_buy) / avg_buy * Decimal("10000")
-        if avg_buy > 0
-        else Decimal("0")
-    )
+    avg_buy = best_buy_cost / best_size if best_size > 0 else _ZERO
+    avg_sell = best_sell_revenue / best_size if best_size > 0 else _ZERO
+    total_bps = (avg_sell - avg_buy) / avg_buy * _BPS_MULT if avg_buy > 0 else _ZERO
 
     return OptimalSizeResult(
         direction=direction,
@@ -623,12 +984,17 @@ def find_optimal_size(
     )
 
 
-def _cex_fee_bps(exchange: ExchangeClient, symbol: str) -> Decimal:
-    try:
-        fees = exchange.get_trading_fees(symbol)
-        return fees.get("taker", Decimal("0")) * Decimal("10000")
-    except Exception:
-        return Decimal("10")
+def _empty_optimal_size(direction: str, max_size: Decimal) -> OptimalSizeResult:
+    """Result of a direction the optimizer did not need to walk."""
+    return OptimalSizeResult(
+        direction=direction,
+        optimal_size=_ZERO,
+        max_size_requested=max_size,
+        total_net_pnl_usd=_ZERO,
+        total_net_pnl_bps=_ZERO,
+        avg_buy_price=_ZERO,
+        avg_sell_price=_ZERO,
+    )
 
 
 def _direction_metrics(
@@ -641,31 +1007,31 @@ def _direction_metrics(
     dex_fee_bps: Decimal,
     gas_cost_usd: Decimal,
     size: Decimal,
-) -> dict:
-    gap = sell_price - buy_price
-    gap_bps = gap / buy_price * Decimal("10000") if buy_price > 0 else Decimal("0")
-    gas_cost_bps = (
-        gas_cost_usd / (buy_price * size) * Decimal("10000")
-        if buy_price > 0
-        else Decimal("0")
-    )
+) -> DirectionMetrics:
+    if buy_price > 0:
+        # One division gives bps-per-quote-unit for both the gap and gas terms
+        bps_per_quote = _BPS_MULT / buy_price
+        gap_bps = (sell_price - buy_price) * bps_per_quote
+        gas_cost_bps = gas_cost_usd / size * bps_per_quote
+    else:
+        gap_bps = gas_cost_bps = _ZERO
     # NOTE: neither dex_fee_bps nor dex_impact_bps are added here because
     # the AMM formula (get_amount_in / get_amount_out) already incorporates
     # BOTH the 0.3% swap fee AND the price impact into the execution price.
     # Adding them would double-count.
     total_costs_bps = cex_fee_bps + cex_slippage_bps + gas_cost_bps
     net_pnl_bps = gap_bps - total_costs_bps
-    return {
-        "direction": direction,
-        "buy_price": buy_price,
-        "sell_price": sell_price,
-        "gap_bps": gap_bps,
-        "estimated_costs_bps": total_costs_bps,
-        "estimated_net_pnl_bps": net_pnl_bps,
-        "dex_impact_bps": dex_impact_bps,
-        "cex_slippage_bps": cex_slippage_bps,
-        "gas_cost_bps": gas_cost_bps,
-    }
+    return DirectionMetrics(
+        direction=direction,
+        buy_price=buy_price,
+        sell_price=sell_price,
+        gap_bps=gap_bps,
+        estimated_costs_bps=total_costs_bps,
+        estimated_net_pnl_bps=net_pnl_bps,
+        dex_impact_bps=dex_impact_bps,
+        cex_slippage_bps=cex_slippage_bps,
+        gas_cost_bps=gas_cost_bps,
+    )
 
 
 def _inventory_check(
@@ -728,10 +1094,14 @@ def _inventory_check(
     return False, details
 
 
+@lru_cache(maxsize=8)
+def _quantum(places: int) -> Decimal:
+    return Decimal(f"1e-{places}")
+
+
 def _format_decimal(value: Decimal, places: int = 2) -> str:
-    quantize_value = Decimal(f"1e-{places}")
     return format(
-        value.quantize(quantize_value, rounding=ROUND_HALF_UP), f",.{places}f"
+        value.quantize(_quantum(places), rounding=ROUND_HALF_UP), f",.{places}f"
     )
 
 
@@ -744,6 +1114,8 @@ def _load_balances(path: Path | None) -> dict:
                 "USDT": {"free": "0", "locked": "0"},
             },
         }
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
     return json.loads(path.read_text(encoding="utf-8"))
 
 
@@ -762,105 +1134,105 @@ def _dir_label(direction: str) -> str:
     return direction
 
 
-def _print_report(result: dict, size: Decimal) -> None:
-    base_symbol = result["pair"].split("/")[0]
-    quote_symbol = result["pair"].split("/")[1]
+def _print_report(result: dict, size: Decimal, out: TextIO | None = None) -> None:
+    """Write the human-readable report for `result` to `out` (stdout) in one go."""
+    lines: list[str] = []
+    emit = lines.append
+    base_symbol, _, quote_symbol = result["pair"].partition("/")
+    details = result["details"]
     effective_size = result.get("effective_size", size)
     requested_size = result.get("requested_size", size)
 
-    print("=" * 60)
-    print(
+    emit("=" * 60)
+    emit(
         f"  ARB CHECK: {result['pair']}  "
         f"size={_format_decimal(effective_size, 4)} {base_symbol}"
     )
     if effective_size != requested_size:
-        print(
+        emit(
             f"  (requested {_format_decimal(requested_size, 4)}, "
             f"optimized to {_format_decimal(effective_size, 4)})"
         )
-    print("=" * 60)
+    emit("=" * 60)
 
     # --- Market prices ---
-    print("")
-    print("Market prices (at requested size):")
-    print(f"  DEX buy  (Uniswap): ${_format_decimal(result['dex_buy_price'])}")
-    print(f"  DEX sell (Uniswap): ${_format_decimal(result['dex_sell_price'])}")
-    print(f"  CEX bid  (Binance): ${_format_decimal(result['cex_bid'])}")
-    print(f"  CEX ask  (Binance): ${_format_decimal(result['cex_ask'])}")
+    emit("")
+    emit("Market prices (at requested size):")
+    emit(f"  DEX buy  (Uniswap): ${_format_decimal(result['dex_buy_price'])}")
+    emit(f"  DEX sell (Uniswap): ${_format_decimal(result['dex_sell_price'])}")
+    emit(f"  CEX bid  (Binance): ${_format_decimal(result['cex_bid'])}")
+    emit(f"  CEX ask  (Binance): ${_format_decimal(result['cex_ask'])}")
 
     # --- Both directions summary ---
     dirs = result.get("directions")
     if dirs:
-        print("")
-        print("Direction comparison (flat, before optimization):")
+        emit("")
+        emit("Direction comparison (flat, before optimization):")
         for key in ("buy_dex_sell_cex", "buy_cex_sell_dex"):
             d = dirs.get(key)
             if d is None:
                 continue
             label = _dir_label(key)
-            gap = _format_decimal(d["gap_bps"])
-            costs = _format_decimal(d["estimated_costs_bps"])
-            net = _format_decimal(d["estimated_net_pnl_bps"])
+            gap = _format_decimal(d.gap_bps)
+            costs = _format_decimal(d.estimated_costs_bps)
+            net = _format_decimal(d.estimated_net_pnl_bps)
             marker = " <-- best" if key == result["direction"] else ""
-            print(f"  {label}:")
-            print(
-                f"    buy=${_format_decimal(d['buy_price'])}  "
-                f"sell=${_format_decimal(d['sell_price'])}  "
+            emit(f"  {label}:")
+            emit(
+                f"    buy=${_format_decimal(d.buy_price)}  "
+                f"sell=${_format_decimal(d.sell_price)}  "
                 f"gap={gap} bps  costs={costs} bps  net={net} bps{marker}"
             )
 
     # --- Chosen direction details ---
-    print("")
+    emit("")
     chosen_dir = result["direction"]
-    print(f"Chosen direction: {_dir_label(chosen_dir)}")
-    print("")
-    print("Costs breakdown:")
-    print("  DEX fee + impact:  (included in AMM execution price)")
-    print(
-        f"  CEX fee:           {_format_decimal(result['details']['cex_fee_bps'])} bps"
-    )
-    cex_slippage = _format_decimal(result["details"]["cex_slippage_bps"])
-    print(f"  CEX slippage:      {cex_slippage} bps")
-    print(
-        f"  Gas:               ${_format_decimal(result['details']['gas_cost_usd'])} "
-        f"({_format_decimal(result['details']['gas_cost_bps'])} bps)"
+    emit(f"Chosen direction: {_dir_label(chosen_dir)}")
+    emit("")
+    emit("Costs breakdown:")
+    emit("  DEX fee + impact:  (included in AMM execution price)")
+    emit(f"  CEX fee:           {_format_decimal(details['cex_fee_bps'])} bps")
+    emit(f"  CEX slippage:      {_format_decimal(details['cex_slippage_bps'])} bps")
+    emit(
+        f"  Gas:               ${_format_decimal(details['gas_cost_usd'])} "
+        f"({_format_decimal(details['gas_cost_bps'])} bps)"
     )
-    print("  " + "-" * 30)
-    print(f"  Total costs:       {_format_decimal(result['estimated_costs_bps'])} bps")
-    print("")
+    emit("  " + "-" * 30)
+    emit(f"  Total costs:       {_format_decimal(result['estimated_costs_bps'])} bps")
+    emit("")
     gap_bps = _format_decimal(result["gap_bps"])
     net_pnl = _format_decimal(result["estimated_net_pnl_bps"])
     verdict = "PROFITABLE" if result["estimated_net_pnl_bps"] > 0 else "NOT PROFITABLE"
-    print(f"Gap: {gap_bps} bps   Net PnL: {net_pnl} bps   {verdict}")
+    emit(f"Gap: {gap_bps} bps   Net PnL: {net_pnl} bps   {verdict}")
 
     # --- Optimization details ---
     opt = result.get("optimization")
     if opt is not None:
-        print("")
-        print("-" * 60)
+        emit("")
+        emit("-" * 60)
         opt_dir = opt.get("direction", chosen_dir)
-        print(f"  Marginal-price optimization ({_dir_label(opt_dir)}):")
-        print(
+        emit(f"  Marginal-price optimization ({_dir_label(opt_dir)}):")
+        emit(
             f"  Optimal size:     "
             f"{_format_decimal(opt['optimal_size'], 4)} {base_symbol}"
         )
-        print(
+        emit(
             f"  Total PnL:        "
             f"${_format_decimal(opt['total_net_pnl_usd'])} "
             f"({_format_decimal(opt['total_net_pnl_bps'])} bps)  "
-            f"[gas ${_format_decimal(result['details']['gas_cost_usd'])} subtracted]"
+            f"[gas ${_format_decimal(details['gas_cost_usd'])} subtracted]"
         )
-        print(f"  Avg buy price:    ${_format_decimal(opt['avg_buy_price'])}")
-        print(f"  Avg sell price:   ${_format_decimal(opt['avg_sell_price'])}")
-        print(
+        emit(f"  Avg buy price:    ${_format_decimal(opt['avg_buy_price'])}")
+        emit(f"  Avg sell price:   ${_format_decimal(opt['avg_sell_price'])}")
+        emit(
             f"  Profitable slices: " f"{opt['profitable_slices']}/{opt['total_slices']}"
         )
 
         slices = opt.get("slices", [])
         if slices:
-            print("")
-            print(f"  Slice breakdown ({_dir_label(opt_dir)}):")
-            print(
+            emit("")
+            emit(f"  Slice breakdown ({_dir_label(opt_dir)}):")
+            emit(
                 f"  {'#':>3}  {'size':>8}  {'cum.size':>8}  "
                 f"{'m.buy':>10}  {'m.sell':>10}  "
                 f"{'gap_bps':>8}  {'net_bps':>8}  "
@@ -868,7 +1240,7 @@ def _print_report(result: dict, size: Decimal) -> None:
             )
             for s in slices:
                 mark = "+" if s.profitable else "-"
-                print(
+                emit(
                     f"  {s.slice_index:>3}  "
                     f"{_format_decimal(s.slice_size, 4):>8}  "
                     f"{_format_decimal(s.cumulative_size, 4):>8}  "
@@ -879,107 +1251,171 @@ def _print_report(result: dict, size: Decimal) -> None:
                     f"{_format_decimal(s.cumulative_net_pnl_usd):>10}  "
                     f"  {mark}"
                 )
-        print("-" * 60)
+        emit("-" * 60)
 
     # --- Inventory ---
-    print("")
-    print("Inventory:")
-    buy_asset = result["details"].get("buy_asset", quote_symbol)
-    sell_asset = result["details"].get("sell_asset", base_symbol)
-    buy_available = result["details"].get("buy_available", Decimal("0"))
-    sell_available = result["details"].get("sell_available", Decimal("0"))
-    buy_needed = result["details"].get("buy_needed", Decimal("0"))
-    sell_needed = result["details"].get("sell_needed", Decimal("0"))
+    emit("")
+    emit("Inventory:")
+    buy_asset = details.get("buy_asset", quote_symbol)
+    sell_asset = details.get("sell_asset", base_symbol)
+    buy_available = details.get("buy_available", Decimal("0"))
+    sell_available = details.get("sell_available", Decimal("0"))
+    buy_needed = details.get("buy_needed", Decimal("0"))
+    sell_needed = details.get("sell_needed", Decimal("0"))
     buy_ok = "OK" if buy_available >= buy_needed else "LOW"
     sell_ok = "OK" if sell_available >= sell_needed else "LOW"
-    buy_venue = result["details"].get("buy_venue", Venue.WALLET).value
-    sell_venue = result["details"].get("sell_venue", Venue.BINANCE).value
-    print(
+    buy_venue = details.get("buy_venue", Venue.WALLET).value
+    sell_venue = details.get("sell_venue", Venue.BINANCE).value
+    emit(
         f"  {buy_venue.title()} {buy_asset}:  "
         f"{_format_decimal(buy_available)} "
         f"(need ~{_format_decimal(buy_needed)}) {buy_ok}"
     )
-    print(
+    emit(
         f"  {sell_venue.title()} {sell_asset}:   "
         f"{_format_decimal(sell_available)} "
         f"(need {_format_decimal(sell_needed)}) {sell_ok}"
     )
-    print("")
+    emit("")
     verdict_line = (
         "EXECUTE" if result["executable"] else "SKIP - costs exceed gap or inventory"
     )
-    print(f"Verdict: {verdict_line}")
-    print("=" * 60)
-
-
-def _append_arb_log(
-    result: dict, filepath: Path, min_net_bps: Decimal, executable_only: bool
-) -> None:
-    if result["estimated_net_pnl_bps"] < min_net_bps:
-        return
-    if executable_only and not result["executable"]:
-        return
-    filepath.parent.mkdir(parents=True, exist_ok=True)
-    file_exists = filepath.exists()
-    fields = [
-        "timestamp",
-        "pair",
-        "direction",
-        "dex_buy_price",
-        "dex_sell_price",
-        "cex_bid",
-        "cex_ask",
-        "gap_bps",
-        "estimated_costs_bps",
-        "estimated_net_pnl_bps",
-        "inventory_ok",
-        "executable",
-        "dex_price_impact_bps",
-        "cex_slippage_bps",
-        "cex_fee_bps",
-        "dex_fee_bps",
-        "gas_cost_usd",
-        "gas_cost_bps",
-    ]
-    row = {
-        "timestamp": result["timestamp"].isoformat(),
-        "pair": result["pair"],
-        "direction": result["direction"],
-        "dex_buy_price": result["dex_buy_price"],
-        "dex_sell_price": result["dex_sell_price"],
-        "cex_bid": result["cex_bid"],
-        "cex_ask": result["cex_ask"],
-        "gap_bps": result["gap_bps"],
-        "estimated_costs_bps": result["estimated_costs_bps"],
-        "estimated_net_pnl_bps": result["estimated_net_pnl_bps"],
-        "inventory_ok": result["inventory_ok"],
-        "executable": result["executable"],
-        "dex_price_impact_bps": result["details"]["dex_price_impact_bps"],
-        "cex_slippage_bps": result["details"]["cex_slippage_bps"],
-        "cex_fee_bps": result["details"]["cex_fee_bps"],
-        "dex_fee_bps": result["details"]["dex_fee_bps"],
-        "gas_cost_usd": result["details"]["gas_cost_usd"],
-        "gas_cost_bps": result["details"]["gas_cost_bps"],
-    }
-    with filepath.open("a", newline="", encoding="utf-8") as handle:
-        writer = csv.DictWriter(handle, fieldnames=fields)
-        if not file_exists:
-            writer.writeheader()
-        writer.writerow(row)
+    emit(f"Verdict: {verdict_line}")
+    emit("=" * 60)
+    (out or sys.stdout).write("\n".join(lines) + "\n")
+
+
+# CSV log columns: timestamp, then _LOG_TOP_KEYS from the result, then
+# _LOG_DETAIL_KEYS from result["details"].
+_LOG_TOP_KEYS = (
+    "pair",
+    "direction",
+    "dex_buy_price",
+    "dex_sell_price",
+    "cex_bid",
+    "cex_ask",
+    "gap_bps",
+    "estimated_costs_bps",
+    "estimated_net_pnl_bps",
+    "inventory_ok",
+    "executable",
+)
+_LOG_DETAIL_KEYS = (
+    "dex_price_impact_bps",
+    "cex_slippage_bps",
+    "cex_fee_bps",
+    "dex_fee_bps",
+    "gas_cost_usd",
+    "gas_cost_bps",
+)
+_LOG_FIELDS = ("timestamp",) + _LOG_TOP_KEYS + _LOG_DETAIL_KEYS
+_log_top = itemgetter(*_LOG_TOP_KEYS)
+_log_details = itemgetter(*_LOG_DETAIL_KEYS)
+
+
+class ArbLogWriter:
+    """
+    Appends arb check results to a CSV file.
+
+    The file handle and writer are kept open across rows; the header is
+    written only when the file is empty, and the buffer is flushed every
+    FLUSH_EVERY rows and on close().
+    """
+
+    FLUSH_EVERY = 32
+
+    def __init__(
+        self,
+        filepath: Path,
+        min_net_bps: Decimal = Decimal("0"),
+        executable_only: bool = False,
+    ):
+        filepath.parent.mkdir(parents=True, exist_ok=True)
+        self._min_net_bps = min_net_bps
+        self._executable_only = executable_only
+        self._handle = filepath.open("a", newline="", encoding="utf-8")
+        self._writer = csv.writer(self._handle)
+        self._rows_since_flush = 0
+        # append mode opens at the end of the file, so 0 means it is empty
+        if self._handle.tell() == 0:
+            self._writer.writerow(_LOG_FIELDS)
+
+    def append(self, result: dict) -> bool:
+        """Write `result` if it passes the filters; returns True if written."""
+        if result["estimated_net_pnl_bps"] < self._min_net_bps:
+            return False
+        if self._executable_only and not result["executable"]:
+            return False
+        self._writer.writerow(
+            (result["timestamp"].isoformat(),)
+            + _log_top(result)
+            + _log_details(result["details"])
+        )
+        self._rows_since_flush += 1
+        if self._rows_since_flush >= self.FLUSH_EVERY:
+            self.flush()
+        return True
+
+    def flush(self) -> None:
+        self._handle.flush()
+        self._rows_since_flush = 0
+
+    def close(self) -> None:
+        if not self._handle.closed:
+            self.flush()
+            self._handle.close()
+
+    def __enter__(self) -> ArbLogWriter:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def _decimal_arg(value: str) -> Decimal:
+    try:
+        return Decimal(value)
+    except InvalidOperation as exc:
+        raise argparse.ArgumentTypeError(f"invalid decimal value: {value!r}") from exc
+
+
+class _ChainPools:
+    """
+    Minimal pricing-engine stand-in for the CLI: the pools for the scanned
+    pairs, keyed by address and re-read from chain on refresh().
+    """
+
+    def __init__(self, addresses: list[Address], chain_client: ChainClient):
+        self._addresses = addresses
+        self._chain_client = chain_client
+        self.pools: dict[Address, UniswapV2Pair] = {}
+        self.refresh()
+
+    def refresh(self) -> None:
+        for address in self._addresses:
+            self.pools[address] = UniswapV2Pair.from_chain(address, self._chain_client)
 
 
 def main() -> None:
     parser = argparse.ArgumentParser(description="Arbitrage checker")
-    parser.add_argument("pair", help="Pair like ETH/USDT")
-    parser.add_argument("--size", type=float, default=1.0, help="Base size")
-    parser.add_argument("--gas-usd", type=float, default=5.0, help="Gas cost estimate")
+    parser.add_argument("pair", nargs="?", help="Pair like ETH/USDT")
+    parser.add_argument(
+        "--pairs", help="Comma-separated pairs to scan, e.g. ETH/USDT,ETH/USDC"
+    )
+    # Numeric options parse straight to Decimal, the type check() works in.
+    parser.add_argument(
+        "--size", type=_decimal_arg, default=Decimal("1"), help="Base size"
+    )
+    parser.add_argument(
+        "--gas-usd", type=_decimal_arg, default=Decimal("5"), help="Gas cost estimate"
+    )
     parser.add_argument("--balances", help="Path to balances JSON")
     parser.add_argument("--pool", help="Override DEX pool address")
     parser.add_argument("--log-csv", help="Path to CSV log file")
     parser.add_argument(
         "--log-min-bps",
-        type=float,
-        default=0.0,
+        type=_decimal_arg,
+        default=Decimal("0"),
         help="Only log if estimated net PnL bps >= this value",
     )
     parser.add_argument(
@@ -994,48 +1430,74 @@ def main() -> None:
     )
     parser.add_argument(
         "--step",
-        type=float,
+        type=_decimal_arg,
         default=None,
         help="Slice step size for optimization (default: size/20)",
     )
+    parser.add_argument(
+        "--loop-interval",
+        type=float,
+        default=None,
+        help="Re-run the scan every N seconds until interrupted",
+    )
     args = parser.parse_args()
 
+    pairs = [p.strip() for p in args.pairs.split(",")] if args.pairs else []
+    if args.pair:
+        pairs.insert(0, args.pair)
+    if not pairs:
+        parser.error("give a pair or --pairs")
+    if args.pool and len(pairs) > 1:
+        parser.error("--pool only applies to a single pair")
+
     rpc_url = config.get_env("RPC_URL", required=True)
     if rpc_url is None:
         raise SystemExit("RPC_URL is required")
     chain_client = ChainClient([rpc_url])
-    pool_address = args.pool or PAIR_POOLS.get(args.pair.upper())
-    if not pool_address:
-        raise SystemExit("No pool address provided for pair; use --pool")
-    dex_pool = UniswapV2Pair.from_chain(Address.from_string(pool_address), chain_client)
+    pool_addresses = []
+    for pair in pairs:
+        if args.pool:
+            pool_address = Address.from_string(args.pool)
+        else:
+            pool_address = PAIR_POOLS.get(pair.upper())
+        if pool_address is None:
+            raise SystemExit(f"No pool address provided for {pair}; use --pool")
+        pool_addresses.append(pool_address)
+    dex_pools = _ChainPools(pool_addresses, chain_client)
 
     exchange_client = ExchangeClient(config.BINANCE_CONFIG)
     inventory = _build_tracker(
         _load_balances(Path(args.balances) if args.balances else None)
     )
     checker = ArbChecker(
-        dex_pool,
+        dex_pools,
         exchange_client,
         inventory,
         PnLEngine(),
-        gas_cost_usd=Decimal(str(args.gas_usd)),
+        gas_cost_usd=args.gas_usd,
     )
     optimize = not args.no_optimize
-    step = Decimal(str(args.step)) if args.step is not None else None
-    result = checker.check(
-        args.pair,
-        Decimal(str(args.size)),
-        optimize=optimize,
-        step=step,
+    requests = [(pair, args.size) for pair in pairs]
+    arb_log = (
+        ArbLogWriter(Path(args.log_csv), args.log_min_bps, args.log_executable_only)
+        if args.log_csv
+        else None
     )
-    _print_report(result, Decimal(str(args.size)))
-    if args.log_csv:
-        _append_arb_log(
-            result,
-            Path(args.log_csv),
-            Decimal(str(args.log_min_bps)),
-            args.log_executable_only,
-        )
+    try:
+        while True:
+            for result in checker.scan(requests, optimize=optimize, step=args.step):
+                _print_report(result, args.size)
+                if arb_log is not None:
+                    arb_log.append(result)
+            if args.loop_interval is None:
+                break
+            time.sleep(args.loop_interval)
+            dex_pools.refresh()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if arb_log is not None:
+            arb_log.close()
 
 
 if __name__ == "__main__":
@@ -21,6 +21,9 @@ from core.base_types import Address, TokenAmount, TransactionRequest
 
 logger = logging.getLogger(__name__)
 
+# 4-byte selector, hashed once at import: getReserves() is read on every refresh.
+_GET_RESERVES_SELECTOR = keccak(text="getReserves()")[:4]
+
 
 @dataclass
 class DexQuote:
@@ -184,8 +187,7 @@ class DexPricer:
         if self._cached_reserves and (now - self._cache_ts) < self._CACHE_TTL:
             return self._cached_reserves
 
-        selector = keccak(text="getReserves()")[:4].hex()
-        raw = self._eth_call(self._pool.checksum, selector)
+        raw = self._eth_call(self._pool.checksum, _GET_RESERVES_SELECTOR)
         r0, r1, _ = decode(["uint112", "uint112", "uint32"], raw)
 
         # Order: (base_reserve, quote_reserve)
@@ -210,34 +212,33 @@ class DexPricer:
 
     # ── low-level RPC helpers ─────────────────────────────────
 
-    def _eth_call(self, to: str, selector_hex: str, data_hex: str = "") -> bytes:
+    def _eth_call(self, to: str, data: bytes) -> bytes:
         """Execute eth_call to a contract."""
-        calldata = bytes.fromhex(selector_hex + data_hex)
         tx = TransactionRequest(
             to=Address.from_string(to),
             value=TokenAmount(raw=0, decimals=18, symbol="ETH"),
-            data=calldata,
+            data=data,
             chain_id=0,
         )
         return self._client.call(tx)
 
     def _call_address(self, signature: str) -> str:
         """Call a view function on the pool that returns an address."""
-        selector = keccak(text=signature)[:4].hex()
+        selector = keccak(text=signature)[:4]
         raw = self._eth_call(self._pool.checksum, selector)
         (addr,) = decode(["address"], raw)
         return addr
 
     def _call_uint(self, signature: str, token_addr: str) -> int:
         """Call decimals() on a token contract."""
-        selector = keccak(text=signature)[:4].hex()
+        selector = keccak(text=signature)[:4]
         raw = self._eth_call(token_addr, selector)
         (val,) = decode(["uint8"], raw)
         return int(val)
 
     def _call_string(self, signature: str, token_addr: str) -> str:
         """Call symbol() on a token contract."""
-        selector = keccak(text=signature)[:4].hex()
+        selector = keccak(text=signature)[:4]
         raw = self._eth_call(token_addr, selector)
         if len(raw) == 32:
             return raw.rstrip(b"\x00").decode("utf-8", errors="ignore")
@@ -143,21 +143,52 @@ class UniswapV2Pair:
         Returns a NEW pair with updated reserves after the swap.
         (Useful for multi-hop simulation)
         """
+        return self.quote_and_swap_out(amount_in, token_in)[1]
+
+    def quote_and_swap_out(
+        self, amount_in: int, token_in: Token
+    ) -> tuple[int, "UniswapV2Pair"]:
+        """
+        get_amount_out + simulate_swap in one pass.
+        Returns (amount_out, pair after the swap).
+        """
         amount_out = self.get_amount_out(amount_in, token_in)
-        reserve_in, reserve_out, token_in_is_token0 = self._select_reserves_for_input(
-            token_in
-        )
-        if reserve_in <= 0 or reserve_out <= 0:
-            raise ValueError("reserves must be positive")
+        _, reserve_out, token_in_is_token0 = self._select_reserves_for_input(token_in)
         if amount_out > reserve_out:
             raise ValueError("insufficient liquidity for this trade")
+        return amount_out, self._after_swap(amount_in, amount_out, token_in_is_token0)
+
+    def quote_and_swap_in(
+        self, amount_out: int, token_out: Token
+    ) -> tuple[int, "UniswapV2Pair"]:
+        """
+        get_amount_in + simulate_swap of that input in one pass.
+        Returns (amount_in, pair after the swap).
+
+        The swap is simulated from the input side exactly like simulate_swap,
+        so the pool may release slightly more than `amount_out` because of
+        get_amount_in's round-up.
+        """
+        amount_in = self.get_amount_in(amount_out, token_out)
+        reserve_in, reserve_out = self._select_reserves_for_output(token_out)
+        amount_in_with_fee = amount_in * (10000 - self.fee_bps)
+        released = (
+            amount_in_with_fee
+            * reserve_out
+            // (reserve_in * 10000 + amount_in_with_fee)
+        )
+        token_in_is_token0 = token_out.address == self.token1.address
+        return amount_in, self._after_swap(amount_in, released, token_in_is_token0)
 
+    def _after_swap(
+        self, amount_in: int, amount_out: int, token_in_is_token0: bool
+    ) -> "UniswapV2Pair":
         if token_in_is_token0:
-            new_reserve0 = reserve_in + amount_in
-            new_reserve1 = reserve_out - amount_out
+            new_reserve0 = self.reserve0 + amount_in
+            new_reserve1 = self.reserve1 - amount_out
         else:
-            new_reserve0 = reserve_out - amount_out
-            new_reserve1 = reserve_in + amount_in
+            new_reserve0 = self.reserve0 - amount_out
+            new_reserve1 = self.reserve1 + amount_in
 
         return UniswapV2Pair(
             address=self.address,
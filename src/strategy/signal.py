@@ -1,5 +1,6 @@
 """Arbitrage signal dataclass and direction enum."""
 
+import sys
 import time
 import uuid
 from dataclasses import dataclass, field
@@ -43,7 +44,7 @@ class Signal:
     def create(cls, pair: str, direction: Direction, **kwargs) -> "Signal":
         return cls(
             signal_id=f"{pair.replace('/', '')}_{uuid.uuid4().hex[:8]}",
-            pair=pair,
+            pair=sys.intern(pair),
             direction=direction,
             timestamp=time.time(),
             **kwargs,
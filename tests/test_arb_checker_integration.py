@@ -6,11 +6,27 @@ for ExchangeClient / InventoryTracker so we can exercise the full
 check() pipeline without network calls.
 """
 
+import csv
+import io
+import json
 from decimal import Decimal
 from unittest.mock import MagicMock
 
+import pytest
+
 from core.base_types import Address
-from integration.arb_checker import ArbChecker
+from exchange.client import RateLimiter
+from exchange.orderbook import OrderBookAnalyzer
+from integration.arb_checker import (
+    _LOG_FIELDS,
+    ArbChecker,
+    ArbLogWriter,
+    DirectionMetrics,
+    _dex_prices,
+    _load_balances,
+    _print_report,
+    _walk_slippage_bps,
+)
 from inventory.pnl import PnLEngine
 from inventory.tracker import InventoryTracker, Venue
 from pricing.uniswap_v2_pair import Token, UniswapV2Pair
@@ -168,6 +184,31 @@ class TestArbCheckerCheckProfitable:
         assert result["direction"] == "buy_cex_sell_dex"
         assert result["optimization"]["total_net_pnl_usd"] > 0
 
+    def test_only_the_winning_direction_is_optimized(self, monkeypatch):
+        from integration import arb_checker
+
+        directions = []
+        real = arb_checker.find_optimal_size
+
+        def spy(**kwargs):
+            directions.append(kwargs["direction"])
+            return real(**kwargs)
+
+        monkeypatch.setattr(arb_checker, "find_optimal_size", spy)
+        pool = _make_pool(eth_reserve=10000, usdt_reserve=20_000_000)
+        orderbook = _make_orderbook(
+            bid_price=Decimal("2100"),
+            ask_price=Decimal("2102"),
+        )
+        checker = ArbChecker(
+            pool, _make_exchange_client(orderbook), _make_tracker(), PnLEngine()
+        )
+        result = checker.check("ETH/USDT", Decimal("2"), optimize=True)
+
+        assert directions == ["buy_dex_sell_cex"]
+        assert result["optimization"]["direction"] == "buy_dex_sell_cex"
+        assert result["optimization"]["optimal_size"] > 0
+
 
 class TestArbCheckerCheckNotProfitable:
     """Scenarios where the arb should NOT be executable."""
@@ -213,6 +254,30 @@ class TestArbCheckerCheckNotProfitable:
 
         assert result["executable"] is False
 
+    def test_no_gap_skips_optimizer(self, monkeypatch):
+        """
+        When even the touch vs DEX spot can't clear the CEX fee, the
+        optimizer is not run and the result reports a zero-size optimum.
+        """
+        monkeypatch.setattr(
+            "integration.arb_checker.find_optimal_size",
+            MagicMock(side_effect=AssertionError("optimizer should not run")),
+        )
+        pool = _make_pool(eth_reserve=1000, usdt_reserve=2_000_000)
+        orderbook = _make_orderbook(
+            bid_price=Decimal("2000"),
+            ask_price=Decimal("2001"),
+        )
+        checker = ArbChecker(
+            pool, _make_exchange_client(orderbook), _make_tracker(), PnLEngine()
+        )
+        result = checker.check("ETH/USDT", Decimal("2"), optimize=True)
+
+        assert result["executable"] is False
+        assert result["effective_size"] == Decimal("0")
+        assert result["optimization"]["optimal_size"] == Decimal("0")
+        assert result["optimization"]["total_slices"] == 0
+
     def test_insufficient_inventory_not_executable(self):
         """
         Even with a profitable gap, missing inventory → executable=False.
@@ -350,6 +415,11 @@ class TestArbCheckerResultStructure:
         # Directions sub-keys
         assert "buy_dex_sell_cex" in result["directions"]
         assert "buy_cex_sell_dex" in result["directions"]
+        for metrics in result["directions"].values():
+            assert isinstance(metrics, DirectionMetrics)
+        chosen = result["directions"][result["direction"]]
+        expected_net = chosen.gap_bps - chosen.estimated_costs_bps
+        assert chosen.estimated_net_pnl_bps == expected_net
 
         # Optimization sub-keys (optimize=True)
         assert "optimization" in result
@@ -366,3 +436,323 @@ class TestArbCheckerResultStructure:
             "slices",
         ):
             assert key in opt, f"Missing optimization key: {key}"
+
+
+class TestArbCheckerResolution:
+    """Pair → pool/token resolution is cached without pinning stale pools."""
+
+    def test_refreshed_pool_is_picked_up(self):
+        class _Engine:
+            def __init__(self, pool):
+                self.pools = {pool.address: pool}
+
+        engine = _Engine(_make_pool(eth_reserve=10000, usdt_reserve=20_000_000))
+        orderbook = _make_orderbook(
+            bid_price=Decimal("2100"),
+            ask_price=Decimal("2102"),
+        )
+        checker = ArbChecker(
+            engine,
+            _make_exchange_client(orderbook),
+            _make_tracker(),
+            PnLEngine(),
+            gas_cost_usd=Decimal("5"),
+        )
+        first = checker.check("ETH/USDT", Decimal("1"), optimize=False)
+
+        # Same pool address, new reserves (as PricingEngine.refresh_pool does)
+        engine.pools[PAIR_ADDR] = _make_pool(eth_reserve=10000, usdt_reserve=21_000_000)
+        second = checker.check("eth/usdt", Decimal("1"), optimize=False)
+
+        assert second["dex_buy_price"] > first["dex_buy_price"]
+        assert list(checker._resolution_cache) == ["ETH/USDT"]
+
+    def test_pool_loaded_later_is_indexed(self):
+        class _Engine:
+            def __init__(self, pools):
+                self.pools = pools
+
+        usdc = Token(Address("0x0000000000000000000000000000000000000003"), "USDC", 6)
+        usdc_pool = UniswapV2Pair(
+            address=Address("0x0000000000000000000000000000000000000098"),
+            token0=WETH,
+            token1=usdc,
+            reserve0=10000 * 10**18,
+            reserve1=20_000_000 * 10**6,
+        )
+        engine = _Engine({PAIR_ADDR: _make_pool()})
+        checker = ArbChecker(
+            engine,
+            _make_exchange_client(_make_orderbook(Decimal("2100"), Decimal("2102"))),
+            _make_tracker(),
+            PnLEngine(),
+        )
+
+        assert checker._resolve("ETH/USDT")[0] is engine.pools[PAIR_ADDR]
+        with pytest.raises(ValueError, match="No matching DEX pool"):
+            checker._resolve("ETH/USDC")
+
+        engine.pools[usdc_pool.address] = usdc_pool
+        pool, base, quote, _, _ = checker._resolve("ETH/USDC")
+        assert pool is usdc_pool
+        assert (base, quote) == (WETH, usdc)
+
+
+class TestArbCheckerFeeCache:
+    """Trading fees are fetched once per TTL; failures are retried."""
+
+    def _checker(self, client):
+        return ArbChecker(
+            _make_pool(eth_reserve=10000, usdt_reserve=20_000_000),
+            client,
+            _make_tracker(),
+            PnLEngine(),
+        )
+
+    def test_fee_fetched_once(self):
+        orderbook = _make_orderbook(
+            bid_price=Decimal("2100"), ask_price=Decimal("2102")
+        )
+        client = _make_exchange_client(orderbook, fee_taker=Decimal("0.00075"))
+        checker = self._checker(client)
+
+        first = checker.check("ETH/USDT", Decimal("1"), optimize=False)
+        second = checker.check("eth/usdt", Decimal("1"), optimize=False)
+
+        assert client.get_trading_fees.call_count == 1
+        assert first["details"]["cex_fee_bps"] == Decimal("7.5")
+        assert second["details"]["cex_fee_bps"] == Decimal("7.5")
+
+    def test_fallback_fee_not_cached(self):
+        orderbook = _make_orderbook(
+            bid_price=Decimal("2100"), ask_price=Decimal("2102")
+        )
+        client = _make_exchange_client(orderbook)
+        client.get_trading_fees.side_effect = RuntimeError("fee endpoint down")
+        checker = self._checker(client)
+
+        result = checker.check("ETH/USDT", Decimal("1"), optimize=False)
+        checker.check("ETH/USDT", Decimal("1"), optimize=False)
+
+        assert result["details"]["cex_fee_bps"] == Decimal("10")
+        assert client.get_trading_fees.call_count == 2
+
+
+class TestArbCheckerBookCache:
+    """Order books are reused only within an opt-in TTL."""
+
+    def _checker(self, client, **kwargs):
+        return ArbChecker(
+            _make_pool(eth_reserve=10000, usdt_reserve=20_000_000),
+            client,
+            _make_tracker(),
+            PnLEngine(),
+            **kwargs,
+        )
+
+    def test_book_fetched_every_check_by_default(self):
+        client = _make_exchange_client(
+            _make_orderbook(bid_price=Decimal("2100"), ask_price=Decimal("2102"))
+        )
+        checker = self._checker(client)
+
+        checker.check("ETH/USDT", Decimal("1"), optimize=False)
+        checker.check("ETH/USDT", Decimal("1"), optimize=False)
+
+        assert client.fetch_order_book.call_count == 2
+
+    def test_book_reused_within_ttl(self):
+        client = _make_exchange_client(
+            _make_orderbook(bid_price=Decimal("2100"), ask_price=Decimal("2102"))
+        )
+        checker = self._checker(client, book_ttl_s=60)
+
+        first = checker.check("ETH/USDT", Decimal("1"), optimize=False)
+        second = checker.check("eth/usdt", Decimal("1"), optimize=False)
+
+        assert client.fetch_order_book.call_count == 1
+        assert second["cex_bid"] == first["cex_bid"]
+
+
+class TestArbCheckerScan:
+    """scan() runs several checks concurrently and keeps request order."""
+
+    def test_scan_matches_individual_checks(self):
+        orderbook = _make_orderbook(
+            bid_price=Decimal("2100"),
+            ask_price=Decimal("2102"),
+        )
+        checker = ArbChecker(
+            _make_pool(eth_reserve=10000, usdt_reserve=20_000_000),
+            _make_exchange_client(orderbook),
+            _make_tracker(),
+            PnLEngine(),
+            gas_cost_usd=Decimal("5"),
+        )
+        sizes = [Decimal("0.5"), Decimal("1"), Decimal("2")]
+
+        results = checker.scan([("ETH/USDT", size) for size in sizes])
+
+        assert [r["requested_size"] for r in results] == sizes
+        for size, result in zip(sizes, results):
+            expected = checker.check("ETH/USDT", size)
+            assert result["effective_size"] == expected["effective_size"]
+            assert result["dex_buy_price"] == expected["dex_buy_price"]
+
+    def test_scan_shares_a_rate_limited_client(self):
+        orderbook = _make_orderbook(
+            bid_price=Decimal("2100"),
+            ask_price=Decimal("2102"),
+        )
+
+        class _LimitedClient:
+            """Goes through a real RateLimiter, like ExchangeClient does."""
+
+            def __init__(self):
+                self.limiter = RateLimiter(max_weight=1_000_000, window_seconds=0.001)
+
+            def fetch_order_book(self, pair, limit=50):
+                self.limiter.acquire(5)
+                return orderbook
+
+            def get_trading_fees(self, pair):
+                self.limiter.acquire(1)
+                return {"maker": Decimal("0.001"), "taker": Decimal("0.001")}
+
+        checker = ArbChecker(
+            _make_pool(eth_reserve=10000, usdt_reserve=20_000_000),
+            _LimitedClient(),
+            _make_tracker(),
+            PnLEngine(),
+        )
+        sizes = [Decimal(n) / 4 for n in range(1, 33)]
+
+        results = checker.scan([("ETH/USDT", size) for size in sizes])
+
+        assert [r["requested_size"] for r in results] == sizes
+
+    def test_scan_empty(self):
+        checker = ArbChecker(
+            _make_pool(),
+            _make_exchange_client(
+                _make_orderbook(bid_price=Decimal("2000"), ask_price=Decimal("2001"))
+            ),
+            _make_tracker(),
+            PnLEngine(),
+        )
+        assert checker.scan([]) == []
+
+
+def test_print_report_writes_to_stream(capsys):
+    orderbook = _make_orderbook(bid_price=Decimal("2100"), ask_price=Decimal("2102"))
+    checker = ArbChecker(
+        _make_pool(eth_reserve=10000, usdt_reserve=20_000_000),
+        _make_exchange_client(orderbook),
+        _make_tracker(),
+        PnLEngine(),
+    )
+    result = checker.check("ETH/USDT", Decimal("2"))
+    out = io.StringIO()
+
+    _print_report(result, Decimal("2"), out=out)
+    _print_report(result, Decimal("2"))
+
+    report = out.getvalue()
+    assert "ARB CHECK: ETH/USDT" in report
+    assert report.rstrip("\n").endswith("=" * 60)
+    assert capsys.readouterr().out == report
+
+
+class TestDexPrices:
+    """Single-read DEX pricing agrees with the pool's own swap math."""
+
+    def test_matches_pool_methods(self):
+        for pool in (
+            _make_pool(),
+            UniswapV2Pair(PAIR_ADDR, USDT, WETH, 2_000_000 * 10**6, 1000 * 10**18),
+        ):
+            for size in (Decimal("0.001"), Decimal("1"), Decimal("37.5")):
+                base_raw = int(size * Decimal(10) ** WETH.decimals)
+                quote_in = pool.get_amount_in(base_raw, token_out=WETH)
+                quote_out = pool.get_amount_out(base_raw, token_in=WETH)
+                expected = (
+                    Decimal(quote_in) / Decimal(10) ** USDT.decimals / size,
+                    pool.get_price_impact(quote_in, token_in=USDT) * Decimal("10000"),
+                    Decimal(quote_out) / Decimal(10) ** USDT.decimals / size,
+                    pool.get_price_impact(base_raw, token_in=WETH) * Decimal("10000"),
+                )
+
+                assert _dex_prices(pool, WETH, USDT, size) == expected
+
+
+class TestWalkSlippage:
+    """The lean slippage walk agrees with OrderBookAnalyzer.walk_the_book."""
+
+    def test_matches_analyzer(self):
+        orderbook = _make_orderbook(
+            bid_price=Decimal("2000"),
+            ask_price=Decimal("2001"),
+            depth_per_level=Decimal("2.5"),
+            num_levels=5,
+        )
+        analyzer = OrderBookAnalyzer(orderbook)
+        # within the first level, across several, exactly a level, past the book
+        for size in (Decimal("1"), Decimal("6.3"), Decimal("5"), Decimal("40")):
+            for side, levels, best in (
+                ("sell", orderbook["bids"], orderbook["best_bid"][0]),
+                ("buy", orderbook["asks"], orderbook["best_ask"][0]),
+            ):
+                expected = analyzer.walk_the_book(side, size)["slippage_bps"]
+                got = _walk_slippage_bps(levels, best, size, buy=side == "buy")
+                assert got == expected
+
+
+class TestArbLogWriter:
+    """CSV log keeps one handle open and writes the header once."""
+
+    def _result(self):
+        orderbook = _make_orderbook(
+            bid_price=Decimal("2100"),
+            ask_price=Decimal("2102"),
+        )
+        checker = ArbChecker(
+            _make_pool(eth_reserve=10000, usdt_reserve=20_000_000),
+            _make_exchange_client(orderbook),
+            _make_tracker(),
+            PnLEngine(),
+            gas_cost_usd=Decimal("5"),
+        )
+        return checker.check("ETH/USDT", Decimal("1"), optimize=False)
+
+    def test_header_written_once_across_reopens(self, tmp_path):
+        path = tmp_path / "logs" / "arb.csv"
+        result = self._result()
+
+        with ArbLogWriter(path, min_net_bps=Decimal("-1000000")) as arb_log:
+            assert arb_log.append(result)
+            assert arb_log.append(result)
+        with ArbLogWriter(path, min_net_bps=Decimal("-1000000")) as arb_log:
+            assert arb_log.append(result)
+
+        with path.open(newline="", encoding="utf-8") as handle:
+            rows = list(csv.reader(handle))
+        assert rows[0] == list(_LOG_FIELDS)
+        assert len(rows) == 4
+        assert rows[1][1] == "ETH/USDT"
+
+    def test_filters_skip_rows(self, tmp_path):
+        path = tmp_path / "arb.csv"
+        result = self._result()
+
+        with ArbLogWriter(path, min_net_bps=Decimal("1000000")) as arb_log:
+            assert not arb_log.append(result)
+
+        assert path.read_text(encoding="utf-8").splitlines() == [",".join(_LOG_FIELDS)]
+
+
+def test_load_balances_reads_json(tmp_path):
+    data = {"wallet": {"USDT": "100"}, "binance": {"ETH": {"free": "1.5"}}}
+    path = tmp_path / "balances.json"
+    path.write_text(json.dumps(data), encoding="utf-8")
+
+    assert _load_balances(path) == data
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import threading
 from decimal import Decimal
 
 import ccxt
@@ -157,3 +158,45 @@ def test_rate_limiter_blocks_when_exhausted() -> None:
     limiter.acquire(2)
     limiter.acquire(2)
     assert sleeps and sleeps[0] >= 1.0
+
+
+def test_rate_limiter_is_thread_safe() -> None:
+    # A tiny window keeps events expiring (popleft) while other threads sum
+    # and append, which used to raise "deque mutated during iteration".
+    limiter = RateLimiter(max_weight=1_000_000, window_seconds=0.001)
+    barrier = threading.Barrier(8)
+    errors: list[BaseException] = []
+
+    def worker() -> None:
+        barrier.wait()
+        try:
+            for _ in range(2000):
+                limiter.acquire(1)
+        except BaseException as exc:
+            errors.append(exc)
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+
+
+def test_rate_limiter_budget_not_overrun_across_threads() -> None:
+    limiter = RateLimiter(max_weight=100, window_seconds=60.0, sleep_fn=lambda _: None)
+    barrier = threading.Barrier(4)
+
+    def worker() -> None:
+        barrier.wait()
+        for _ in range(25):
+            limiter.acquire(1)
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sum(weight for _, weight in limiter._events) == 100
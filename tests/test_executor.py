@@ -2,10 +2,16 @@
 
 import asyncio
 import time
+from dataclasses import fields
+from types import SimpleNamespace
 
 import pytest
+from eth_utils import keccak
 
+from core.base_types import MAX_UINT256, Address
 from executor.engine import (
+    _SELECTORS,
+    _FLOAT_EXACT_LIMIT,
     _VALID_TRANSITIONS,
     ExecutionContext,
     ExecutionMetrics,
@@ -14,6 +20,10 @@ from executor.engine import (
     ExecutorState,
     InvalidTransition,
     StateEvent,
+    _allowance_calldata,
+    _approve_calldata,
+    _decode_uint256,
+    _scale_float,
 )
 from strategy.signal import Direction, Signal
 
@@ -58,6 +68,11 @@ class TestTransitionGuards:
         for state in ExecutorState:
             assert state in _VALID_TRANSITIONS
 
+    def test_state_values_are_stable_ints(self):
+        assert ExecutorState.IDLE == 0
+        assert ExecutorState.DONE == 8
+        assert ExecutorState.UNWINDING == 10
+
     def test_terminal_states_have_no_exits(self):
         assert _VALID_TRANSITIONS[ExecutorState.DONE] == set()
         assert _VALID_TRANSITIONS[ExecutorState.FAILED] == set()
@@ -133,6 +148,33 @@ class TestEventLog:
         assert ctx.events[1].from_state == ExecutorState.VALIDATING
         assert ctx.events[1].to_state == ExecutorState.FAILED
 
+    def test_transition_uses_explicit_timestamp(self):
+        ctx = ExecutionContext(signal=_make_signal())
+        ctx.transition(ExecutorState.VALIDATING, "check", ts=123.0)
+        assert ctx.events[0].timestamp == 123.0
+
+    def test_errors_only_audit_keeps_failures(self):
+        ctx = ExecutionContext(signal=_make_signal(), audit_level="errors_only")
+        ctx.transition(ExecutorState.VALIDATING, "check")
+        ctx.transition(ExecutorState.FAILED, "invalid")
+
+        assert ctx.state == ExecutorState.FAILED
+        assert [e.to_state for e in ctx.events] == [ExecutorState.FAILED]
+        assert ctx.events[0].from_state == ExecutorState.VALIDATING
+
+    def test_audit_off_still_guards_edges(self):
+        ctx = ExecutionContext(signal=_make_signal(), audit_level="off")
+        ctx.transition(ExecutorState.FAILED, "boom")
+        assert ctx.events == []
+        with pytest.raises(InvalidTransition):
+            ctx.transition(ExecutorState.IDLE)
+
+    def test_unknown_audit_level_rejected(self):
+        with pytest.raises(ValueError, match="audit_level"):
+            ExecutionContext(signal=_make_signal(), audit_level="error_only")
+        with pytest.raises(ValueError, match="audit_level"):
+            ExecutorConfig(audit_level="none")
+
     def test_state_event_to_dict(self):
         ev = StateEvent(
             from_state=ExecutorState.IDLE,
@@ -179,6 +221,29 @@ class TestExecutionContext:
         ctx.finished_at = ctx.started_at + 1.5
         assert abs(ctx.duration_ms - 1500.0) < 1.0
 
+    def test_wall_time_anchored_to_start(self):
+        ctx = ExecutionContext(
+            signal=_make_signal(), started_at=1000.0, started_ns=5_000_000_000
+        )
+        assert ctx.wall_time(6_500_000_000) == 1001.5
+
+    def test_record_fill_sets_leg_fields_and_metrics(self):
+        ctx = ExecutionContext(signal=_make_signal())
+        ctx.leg1_started_ns = 100_000_000_000
+        leg1 = {"price": 2002.0, "filled": 1.0, "order_id": "o1"}
+        ctx.record_fill(1, leg1, 2000.0, 100_500_000_000)
+        ctx.leg2_started_ns = 100_500_000_000
+        leg2 = {"price": 2010.0, "filled": 0.9, "tx_hash": "0xabc"}
+        ctx.record_fill(2, leg2, 2010.0, 101_000_000_000)
+
+        assert ctx.leg1_fill_price == 2002.0
+        assert ctx.leg1_order_id == "o1"
+        assert ctx.metrics.leg1_latency_ms == 500.0
+        assert ctx.metrics.leg1_slippage_bps == 10.0
+        assert ctx.leg2_tx_hash == "0xabc"
+        assert ctx.metrics.leg2_fill_ratio == 0.9
+        assert ctx.metrics.leg2_slippage_bps == 0.0
+
     def test_summary_keys(self):
         ctx = ExecutionContext(signal=_make_signal())
         s = ctx.summary()
@@ -215,6 +280,14 @@ class TestExecutionMetrics:
         assert m.leg2_retries == 0
         assert m.unwind_attempted is False
 
+    def test_slotted(self):
+        assert not hasattr(ExecutionMetrics(), "__dict__")
+        assert not hasattr(ExecutionContext(signal=_make_signal()), "__dict__")
+        assert not hasattr(
+            StateEvent(ExecutorState.IDLE, ExecutorState.VALIDATING), "__dict__"
+        )
+        assert not hasattr(ExecutorConfig(), "__dict__")
+
     def test_to_dict_filters_none(self):
         m = ExecutionMetrics(leg1_latency_ms=42.0)
         d = m.to_dict()
@@ -237,6 +310,7 @@ class TestExecutionMetrics:
         )
         d = m.to_dict()
         assert len(d) == 11
+        assert list(d) == [f.name for f in fields(ExecutionMetrics)]
 
 
 # ══════════════════════════════════════════════════════════════════
@@ -310,6 +384,33 @@ class TestExecutorSimulation:
         assert ExecutorState.LEG2_PENDING in states_visited
         assert ExecutorState.DONE in states_visited
 
+    @pytest.mark.asyncio
+    async def test_fast_simulation_skips_latency(self):
+        executor = _make_executor(fast_simulation=True)
+        t0 = time.monotonic()
+        ctx = await executor.execute(_make_signal())
+
+        assert ctx.state == ExecutorState.DONE
+        assert time.monotonic() - t0 < 0.3  # normal sim sleeps 0.6s
+
+    @pytest.mark.asyncio
+    async def test_fast_simulation_skips_timeout_scope(self, monkeypatch):
+        def no_timeout(delay):
+            raise AssertionError("fast simulation should not arm a timeout")
+
+        monkeypatch.setattr("executor.engine.asyncio.timeout", no_timeout)
+        ctx = await _make_executor(fast_simulation=True).execute(_make_signal())
+
+        assert ctx.state == ExecutorState.DONE
+
+    @pytest.mark.asyncio
+    async def test_audit_level_from_config(self):
+        executor = _make_executor(audit_level="errors_only")
+        ctx = await executor.execute(_make_signal())
+
+        assert ctx.state == ExecutorState.DONE
+        assert ctx.events == []
+
     @pytest.mark.asyncio
     async def test_metrics_populated(self):
         executor = _make_executor()
@@ -557,6 +658,92 @@ class TestUnwind:
         assert ExecutorState.UNWINDING in states
         assert ExecutorState.FAILED in states
 
+    @pytest.mark.asyncio
+    async def test_real_dex_unwind_reverses_direction(self):
+        """DEX unwind swaps the opposite way without building a new Signal."""
+        executor = Executor(None, None, None, ExecutorConfig(simulation_mode=False))
+        calls = []
+
+        def fake_swap(direction, dex_price, size):
+            calls.append((direction, dex_price, size))
+            return {"success": True}
+
+        executor._execute_dex_swap = fake_swap
+        ctx = ExecutionContext(signal=_make_signal())
+        ctx.leg1_venue = "dex"
+        ctx.leg1_fill_size = 0.5
+        await executor._unwind(ctx)
+
+        assert calls == [(Direction.BUY_DEX_SELL_CEX, 2010.0, 0.5)]
+        assert ctx.metrics.unwind_success is True
+
+
+# ══════════════════════════════════════════════════════════════════
+#  Warmup
+# ══════════════════════════════════════════════════════════════════
+
+
+class TestInflightDedup:
+    @pytest.mark.asyncio
+    async def test_concurrent_same_signal_executes_once(self):
+        executor = _make_executor()
+        sig = _make_signal()
+        first, second = await asyncio.gather(
+            executor.execute(sig), executor.execute(sig)
+        )
+        assert first is second
+        assert executor.stats["total"] == 1
+        assert executor._inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_waiter_sees_leader_exception(self):
+        executor = _make_executor()
+
+        async def boom(signal):
+            await asyncio.sleep(0)
+            raise RuntimeError("boom")
+
+        executor._execute_signal = boom
+        sig = _make_signal()
+        results = await asyncio.gather(
+            executor.execute(sig), executor.execute(sig), return_exceptions=True
+        )
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert executor._inflight == {}
+
+
+class TestWarmup:
+    @pytest.mark.asyncio
+    async def test_warmup_noop_in_simulation(self):
+        executor = _make_executor()
+        await executor.warmup()
+        assert executor._dex_client is None
+
+    @pytest.mark.asyncio
+    async def test_warmup_touches_rpc(self):
+        calls = []
+
+        class FakeClient:
+            def get_chain_id(self):
+                calls.append("chain_id")
+                return 11155111
+
+            def get_nonce(self, address):
+                calls.append("nonce")
+                return 0
+
+        executor = Executor(None, None, None, ExecutorConfig(simulation_mode=False))
+        addr = Address.from_string("0x" + "11" * 20)
+        executor._dex_client = FakeClient()
+        executor._dex_wallet = object()
+        executor._wallet_addr = addr
+        executor._router_addr = addr
+        executor._sell_path = (addr.checksum, addr.checksum)
+        executor._buy_path = (addr.checksum, addr.checksum)
+        await executor.warmup()
+
+        assert calls == ["chain_id", "nonce"]
+
 
 # ══════════════════════════════════════════════════════════════════
 #  Aggregate stats
@@ -630,6 +817,270 @@ class TestSlippage:
         assert abs(bps - 100.0) < 0.1
 
 
+# ══════════════════════════════════════════════════════════════════
+#  ABI encoding
+# ══════════════════════════════════════════════════════════════════
+
+
+class TestEncodeCall:
+    def test_known_selector_prefix(self):
+        data = Executor._encode_call(
+            "approve(address,uint256)", ("address", "uint256"), ["0x" + "22" * 20, 1]
+        )
+        assert data[:4] == keccak(text="approve(address,uint256)")[:4]
+        assert len(data) == 4 + 64
+
+    def test_unknown_signature_cached(self):
+        sig = "balanceOf(address)"
+        data = Executor._encode_call(sig, ("address",), ["0x" + "22" * 20])
+        assert data[:4] == keccak(text=sig)[:4]
+        assert _SELECTORS[sig] == data[:4]
+
+    def test_approve_calldata_matches_encode_call(self):
+        spender = "0x" + "22" * 20
+        expected = Executor._encode_call(
+            "approve(address,uint256)", ("address", "uint256"), [spender, 2**256 - 1]
+        )
+        assert _approve_calldata(spender) == expected
+        assert _approve_calldata(spender) is _approve_calldata(spender)
+
+    def test_allowance_calldata_matches_encode_call(self):
+        owner, spender = "0x" + "11" * 20, "0x" + "22" * 20
+        expected = Executor._encode_call(
+            "allowance(address,address)", ("address", "address"), [owner, spender]
+        )
+        assert _allowance_calldata(owner, spender) == expected
+
+
+class TestAllowanceCache:
+    def _executor(self, allowance):
+        calls = []
+
+        class FakeClient:
+            def call(self, request):
+                calls.append(request)
+                return allowance.to_bytes(32, "big")
+
+        executor = Executor(None, None, None, ExecutorConfig(simulation_mode=False))
+        executor._dex_client = FakeClient()
+        executor._dex_wallet = object()
+        return executor, calls
+
+    def test_second_check_skips_rpc(self):
+        executor, calls = self._executor(1_000)
+        token = Address.from_string("0x" + "33" * 20)
+        owner = Address.from_string("0x" + "11" * 20)
+        spender = Address.from_string("0x" + "22" * 20)
+
+        executor._ensure_allowance(token, owner, spender, 400)
+        executor._ensure_allowance(token, owner, spender, 400)
+        assert len(calls) == 1
+
+    def test_spend_forces_reread_when_insufficient(self):
+        executor, calls = self._executor(1_000)
+        token = Address.from_string("0x" + "33" * 20)
+        owner = Address.from_string("0x" + "11" * 20)
+        spender = Address.from_string("0x" + "22" * 20)
+
+        executor._ensure_allowance(token, owner, spender, 400)
+        executor._spend_allowance(token, owner, spender, 700)
+        executor._ensure_allowance(token, owner, spender, 400)
+        assert len(calls) == 2
+
+    def _ready_for_buy(self, executor, send_swap):
+        executor._wallet_addr = Address.from_string("0x" + "11" * 20)
+        executor._router_addr = Address.from_string("0x" + "22" * 20)
+        executor._quote_token_addr = Address.from_string("0x" + "33" * 20)
+        executor._buy_path = ("0x" + "33" * 20, "0x" + "44" * 20)
+        executor._deadline_secs = 60
+        executor._buy_pay_bps = 10_050
+        executor._swap_tx = lambda router, value_wei, data: None
+        executor._send_swap = send_swap
+        key = (
+            executor._quote_token_addr.checksum,
+            executor._wallet_addr.checksum,
+            executor._router_addr.checksum,
+        )
+        executor._allowance_cache[key] = MAX_UINT256
+        return key
+
+    def test_failed_send_drops_cached_allowance(self):
+        executor, calls = self._executor(0)
+
+        def send_swap(builder):
+            raise RuntimeError("sim revert: TRANSFER_FROM_FAILED")
+
+        key = self._ready_for_buy(executor, send_swap)
+        with pytest.raises(RuntimeError):
+            executor._execute_dex_swap(Direction.BUY_DEX_SELL_CEX, 2000.0, 0.1)
+        assert key not in executor._allowance_cache
+        assert calls == []
+
+    def test_reverted_swap_drops_cached_allowance(self):
+        executor, _ = self._executor(0)
+        receipt = SimpleNamespace(status=False, tx_hash="0x" + "ab" * 32)
+        key = self._ready_for_buy(executor, lambda builder: receipt)
+
+        result = executor._execute_dex_swap(Direction.BUY_DEX_SELL_CEX, 2000.0, 0.1)
+        assert result["success"] is False
+        assert key not in executor._allowance_cache
+
+
+class TestFlashbotsSubmission:
+    class _Signed:
+        raw_transaction = b"\x01"
+        hash = b"\xaa" * 32
+
+    class _Builder:
+        def build_and_sign(self):
+            return TestFlashbotsSubmission._Signed()
+
+    class _Client:
+        def get_block(self, block, full=False):
+            return {"number": "0x64"}
+
+    def _executor(self, relay):
+        executor = Executor(None, None, None, ExecutorConfig(simulation_mode=False))
+        executor._dex_client = self._Client()
+        executor._flashbots = relay
+        return executor
+
+    def test_bundle_targets_next_block(self):
+        sent = []
+
+        class Relay:
+            def call_bundle(self, txs, target):
+                return {"results": [{"txHash": "0x01", "gasUsed": 1}]}
+
+            def send_bundle(self, txs, target):
+                sent.append((txs, target))
+
+            def wait_for_inclusion(self, client, tx_hash, target, timeout):
+                sent.append(tx_hash)
+                return "receipt"
+
+        executor = self._executor(Relay())
+
+        assert executor._send_swap(self._Builder()) == "receipt"
+        assert sent == [([b"\x01"], 101), "0x" + "aa" * 32]
+
+    def test_missed_bundle_raises(self):
+        class Relay:
+            def call_bundle(self, txs, target):
+                return {"results": []}
+
+            def send_bundle(self, txs, target):
+                pass
+
+            def wait_for_inclusion(self, client, tx_hash, target, timeout):
+                return None
+
+        executor = self._executor(Relay())
+
+        with pytest.raises(RuntimeError, match="not included in block 101"):
+            executor._send_swap(self._Builder())
+
+    def test_simulated_revert_skips_submission(self):
+        sent = []
+
+        class Relay:
+            def call_bundle(self, txs, target):
+                return {"results": [{"error": "execution reverted", "revert": "K"}]}
+
+            def send_bundle(self, txs, target):
+                sent.append(txs)
+
+        executor = self._executor(Relay())
+
+        with pytest.raises(RuntimeError, match="sim revert: K"):
+            executor._send_swap(self._Builder())
+        assert sent == []
+
+
+class TestDecodeUint256:
+    def test_small_and_large_values(self):
+        for value in (0, 1, 2**64 - 1, 2**64, 2**256 - 1):
+            assert _decode_uint256(value.to_bytes(32, "big")) == value
+
+    def test_empty_and_short_returns(self):
+        assert _decode_uint256(b"") == 0
+        assert _decode_uint256(b"\x01\x00") == 256
+
+
+class TestDexConfigCache:
+    def test_ensure_dex_ready_resolves_once(self, monkeypatch):
+        class FakeWallet:
+            address = "0x" + "11" * 20
+
+            def __init__(self, private_key):
+                pass
+
+        monkeypatch.setattr("executor.engine.WalletManager", FakeWallet)
+        cfg = ExecutorConfig(
+            simulation_mode=False,
+            use_flashbots=False,
+            dex_rpc_url="https://rpc.example",
+            dex_private_key="0x" + "01" * 32,
+            dex_router_address="0x" + "22" * 20,
+            dex_weth_address="0x" + "33" * 20,
+            dex_quote_token_address="0x" + "44" * 20,
+            dex_slippage_bps=150,
+            dex_deadline_seconds=90,
+        )
+        executor = Executor(None, None, None, cfg)
+        executor._ensure_dex_ready()
+
+        assert executor._router_addr == Address.from_string("0x" + "22" * 20)
+        assert executor._deadline_secs == 90
+        assert executor._sell_path == ("0x" + "33" * 20, "0x" + "44" * 20)
+        assert executor._buy_path == ("0x" + "44" * 20, "0x" + "33" * 20)
+        assert executor._sell_keep_bps == 9_850
+        assert executor._buy_pay_bps == 10_150
+
+
+class TestGasPriceCache:
+    def test_gas_price_reused_within_ttl(self):
+        calls = []
+
+        class Client:
+            def get_gas_price(self):
+                calls.append(1)
+                return object()
+
+        executor = Executor(None, None, None, ExecutorConfig(simulation_mode=False))
+        executor._dex_client = Client()
+
+        first = executor._cached_gas_price()
+        assert executor._cached_gas_price() is first
+        assert len(calls) == 1
+
+        executor._gas_price_ns -= 10_000_000_000
+        assert executor._cached_gas_price() is not first
+        assert len(calls) == 2
+
+
+class TestUnitScaling:
+    def test_token_units_match_decimal(self):
+        assert Executor._to_token_units(0.29, 6) == 290_000
+        assert Executor._to_token_units(2000.123456, 6) == 2_000_123_456
+
+    def test_wei_large_amount_exact(self):
+        assert Executor._to_wei(1.1) == 1_100_000_000_000_000_000
+        assert Executor._to_wei(0.001) == 10**15
+
+    def test_float_and_decimal_paths_round_alike(self):
+        # scaled values just below / above 2**53 take different paths
+        below = (_FLOAT_EXACT_LIMIT - 2) / 10
+        above = (_FLOAT_EXACT_LIMIT + 2) / 10
+        assert _scale_float(below, 1) == 9_007_199_254_740_990
+        assert _scale_float(above, 1) == 9_007_199_254_740_994
+        # sub-unit remainders round the same way on both paths
+        assert _scale_float(0.1234567, 6) == 123_457
+        assert _scale_float(0.1234567, 25) == 1_234_567 * 10**18
+        assert _scale_float(1.2345678e-12, 18) == 1_234_568
+        assert _scale_float(1.2345678e-12, 30) == 1_234_567_800_000_000_000
+
+
 # ══════════════════════════════════════════════════════════════════
 #  PnL calculation
 # ══════════════════════════════════════════════════════════════════
@@ -0,0 +1,109 @@
+import json
+from dataclasses import dataclass
+
+import pytest
+from eth_utils import keccak
+
+from chain.errors import RPCError
+from chain.flashbots import FlashbotsRelay
+
+
+class _Response:
+    def __init__(self, payload, status_code=200):
+        self._payload = payload
+        self.status_code = status_code
+
+    def json(self):
+        return self._payload
+
+
+@dataclass
+class _Signed:
+    signature: bytes
+
+
+class _FakeSigner:
+    address = "0x" + "11" * 20
+
+    def __init__(self):
+        self.messages = []
+
+    def sign_message(self, message):
+        self.messages.append(message)
+        return _Signed(b"\xab" * 65)
+
+
+class _FakeClient:
+    def __init__(self, receipts, heads):
+        self._receipts = list(receipts)
+        self._heads = list(heads)
+
+    def get_receipt(self, tx_hash):
+        return self._receipts.pop(0)
+
+    def get_block(self, block, full=False):
+        return {"number": hex(self._heads.pop(0))}
+
+
+def test_send_bundle_signs_body(monkeypatch):
+    seen = {}
+
+    def fake_post(url, data, headers, timeout):
+        seen.update(url=url, data=data, headers=headers)
+        return _Response({"result": {"bundleHash": "0xbundle"}})
+
+    signer = _FakeSigner()
+    relay = FlashbotsRelay("https://relay.example", signer)
+    monkeypatch.setattr(relay._session, "post", fake_post)
+
+    assert relay.send_bundle([b"\x01\x02"], 100) == "0xbundle"
+
+    payload = json.loads(seen["data"])
+    assert payload["method"] == "eth_sendBundle"
+    assert payload["params"] == [{"txs": ["0x0102"], "blockNumber": "0x64"}]
+    assert signer.messages == ["0x" + keccak(text=seen["data"]).hex()]
+    signature = seen["headers"]["X-Flashbots-Signature"]
+    assert signature == f"{signer.address}:0x{'ab' * 65}"
+
+
+def test_call_bundle_simulates_at_latest_state(monkeypatch):
+    seen = {}
+
+    def fake_post(url, data, headers, timeout):
+        seen["payload"] = json.loads(data)
+        return _Response({"result": {"results": [{"gasUsed": 21000}]}})
+
+    relay = FlashbotsRelay("https://relay.example", _FakeSigner())
+    monkeypatch.setattr(relay._session, "post", fake_post)
+
+    assert relay.call_bundle([b"\x01"], 5) == {"results": [{"gasUsed": 21000}]}
+    assert seen["payload"]["method"] == "eth_callBundle"
+    assert seen["payload"]["params"][0]["stateBlockNumber"] == "latest"
+
+
+def test_relay_error_raises(monkeypatch):
+    relay = FlashbotsRelay("https://relay.example", _FakeSigner())
+    monkeypatch.setattr(
+        relay._session,
+        "post",
+        lambda *a, **k: _Response({"error": {"message": "bad bundle", "code": -1}}),
+    )
+
+    with pytest.raises(RPCError, match="bad bundle"):
+        relay.send_bundle([b"\x01"], 1)
+
+
+def test_wait_for_inclusion_returns_receipt(monkeypatch):
+    monkeypatch.setattr("chain.flashbots.time.sleep", lambda *_: None)
+    relay = FlashbotsRelay("https://relay.example", _FakeSigner())
+    client = _FakeClient(receipts=[None, "receipt"], heads=[100])
+
+    assert relay.wait_for_inclusion(client, "0xabc", target_block=101) == "receipt"
+
+
+def test_wait_for_inclusion_gives_up_after_target(monkeypatch):
+    monkeypatch.setattr("chain.flashbots.time.sleep", lambda *_: None)
+    relay = FlashbotsRelay("https://relay.example", _FakeSigner())
+    client = _FakeClient(receipts=[None, None], heads=[101, 102])
+
+    assert relay.wait_for_inclusion(client, "0xabc", target_block=101) is None
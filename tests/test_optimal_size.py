@@ -15,8 +15,11 @@ from core.base_types import Address
 from integration.arb_checker import (
     OptimalSizeResult,
     _marginal_cex_price,
+    _marginal_cex_price_prefixed,
     _marginal_dex_buy_price,
     _marginal_dex_sell_price,
+    _prepare_book,
+    _trim_book,
     find_optimal_size,
 )
 from pricing.uniswap_v2_pair import Token, UniswapV2Pair
@@ -105,6 +108,24 @@ class TestMarginalCexPrice:
         )
         assert price == Decimal("0")
 
+    def test_prefixed_book_walks_across_levels(self):
+        book = _prepare_book(
+            [
+                (Decimal("2000"), Decimal("1")),
+                (Decimal("1999.5"), Decimal("0")),
+                (Decimal("1999"), Decimal("2")),
+                (Decimal("1998"), Decimal("3")),
+            ]
+        )
+        price = _marginal_cex_price_prefixed
+        # 0.5 @ 2000 + 1.5 @ 1999 (the empty level is skipped)
+        assert price(book, Decimal("0.5"), Decimal("2")) == Decimal("1999.25")
+        # Exactly on a level boundary
+        assert price(book, Decimal("1"), Decimal("2")) == Decimal("1999")
+        # Runs off the end: only the last 1 base is left
+        assert price(book, Decimal("5"), Decimal("3")) == Decimal("1998")
+        assert price(book, Decimal("6"), Decimal("1")) == Decimal("0")
+
 
 # ---- Tests for _marginal_dex_buy_price ----
 
@@ -233,6 +254,68 @@ class TestFindOptimalSize:
         assert result.optimal_size == Decimal("0")
         assert result.total_net_pnl_usd == Decimal("0")
 
+    def test_negative_gap_stops_after_first_slice(self):
+        """No gross gap on the first slice means no later slice can pay."""
+        pool = _make_pool(eth_reserve=1000, usdc_reserve=2_000_000)
+        bid_levels = _make_bid_levels(
+            Decimal("1950"), Decimal("10"), num_levels=10, step_bps=Decimal("5")
+        )
+        result = find_optimal_size(
+            pool=pool,
+            base_token=WETH,
+            quote_token=USDC,
+            direction="buy_dex_sell_cex",
+            cex_levels=bid_levels,
+            max_size=Decimal("5"),
+            step=Decimal("1"),
+        )
+        assert result.total_slices == 1
+        assert result.slices[0].marginal_gap_bps < 0
+        assert result.optimal_size == Decimal("0")
+
+    def test_stops_at_first_unprofitable_slice(self):
+        """Once the fee outweighs the gap, the walk ends on that slice."""
+        pool = _make_pool(eth_reserve=2000, usdc_reserve=4_000_000)
+        bid_levels = _make_bid_levels(
+            Decimal("2030"), Decimal("5"), num_levels=40, step_bps=Decimal("2")
+        )
+        result = find_optimal_size(
+            pool=pool,
+            base_token=WETH,
+            quote_token=USDC,
+            direction="buy_dex_sell_cex",
+            cex_levels=bid_levels,
+            max_size=Decimal("50"),
+            step=Decimal("1"),
+        )
+        assert result.total_slices == result.profitable_slices + 1
+        assert result.slices[-1].profitable is False
+        assert all(s.profitable for s in result.slices[:-1])
+
+    def test_trimmed_book_gives_same_result(self):
+        """Levels past max_size never reach the optimizer's slices."""
+        pool = _make_pool(eth_reserve=2000, usdc_reserve=4_000_000)
+        bid_levels = _make_bid_levels(
+            Decimal("2030"), Decimal("2.5"), num_levels=40, step_bps=Decimal("2")
+        )
+        trimmed = _trim_book(bid_levels, Decimal("6"))
+        assert trimmed == bid_levels[:3]
+        assert _trim_book(bid_levels, Decimal("500")) == bid_levels
+
+        full, short = (
+            find_optimal_size(
+                pool=pool,
+                base_token=WETH,
+                quote_token=USDC,
+                direction="buy_dex_sell_cex",
+                cex_levels=levels,
+                max_size=Decimal("6"),
+                step=Decimal("0.5"),
+            )
+            for levels in (bid_levels, trimmed)
+        )
+        assert short == full
+
     def test_buy_cex_sell_dex_direction(self):
         """Test the reverse direction: buy on CEX, sell on DEX."""
         pool = _make_pool(eth_reserve=10000, usdc_reserve=20_000_000)
@@ -334,3 +417,47 @@ class TestFindOptimalSize:
                 s for s in result.slices if s.cumulative_size == result.optimal_size
             )
             assert optimal_slice.cumulative_net_pnl_usd == best_cum_pnl
+
+    def test_dex_prices_match_chained_pool_simulation(self):
+        """The optimizer's reserve series matches chained pool swaps."""
+        pool = _make_pool(eth_reserve=1000, usdc_reserve=2_000_000)
+        ask_levels = _make_ask_levels(
+            Decimal("1800"), Decimal("5"), num_levels=10, step_bps=Decimal("1")
+        )
+        result = find_optimal_size(
+            pool=pool,
+            base_token=WETH,
+            quote_token=USDC,
+            direction="buy_cex_sell_dex",
+            cex_levels=ask_levels,
+            max_size=Decimal("4"),
+            step=Decimal("1"),
+            gas_cost_usd=Decimal("0"),
+        )
+        assert result.total_slices == 4
+        current = pool
+        for s in result.slices:
+            price, current = _marginal_dex_sell_price(current, WETH, USDC, s.slice_size)
+            assert s.marginal_dex_price == price
+
+    def test_dex_buy_prices_match_chained_pool_simulation(self):
+        """Same check for the buy side against _marginal_dex_buy_price."""
+        pool = _make_pool(eth_reserve=1000, usdc_reserve=2_000_000)
+        bid_levels = _make_bid_levels(
+            Decimal("2200"), Decimal("5"), num_levels=10, step_bps=Decimal("1")
+        )
+        result = find_optimal_size(
+            pool=pool,
+            base_token=WETH,
+            quote_token=USDC,
+            direction="buy_dex_sell_cex",
+            cex_levels=bid_levels,
+            max_size=Decimal("4"),
+            step=Decimal("1"),
+            gas_cost_usd=Decimal("0"),
+        )
+        assert result.total_slices == 4
+        current = pool
+        for s in result.slices:
+            price, current = _marginal_dex_buy_price(current, WETH, USDC, s.slice_size)
+            assert s.marginal_dex_price == price
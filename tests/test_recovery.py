@@ -1,8 +1,13 @@
 """Tests for executor.recovery — CircuitBreaker, ReplayProtection,
 FailureClassifier, RecoveryManager."""
 
+import dataclasses
+import re
+import threading
 import time
 
+import pytest
+
 from executor.recovery import (
     CircuitBreaker,
     CircuitBreakerConfig,
@@ -108,6 +113,37 @@ class TestFailureClassifier:
             == FailureCategory.RATE_LIMIT
         )
 
+    def test_pattern_order_beats_text_position(self):
+        # "invalid" appears first in the text, but timeout is listed first.
+        assert (
+            FailureClassifier.classify("invalid response after timeout")
+            == FailureCategory.TRANSIENT
+        )
+
+    def test_multiline_error(self):
+        assert (
+            FailureClassifier.classify("request failed\nConnectionReset by peer")
+            == FailureCategory.NETWORK
+        )
+
+    def test_per_pattern_path_keeps_priority(self, monkeypatch):
+        # Exercise the RE2 code path with stdlib patterns standing in.
+        from executor import recovery
+
+        patterns = tuple(
+            (re.compile(f"(?is){p.pattern}"), c) for p, c in recovery._PATTERNS
+        )
+        monkeypatch.setattr(recovery, "_RE2_PATTERNS", patterns)
+        recovery._classify_cached.cache_clear()
+        try:
+            assert (
+                FailureClassifier.classify("invalid response after timeout")
+                == FailureCategory.TRANSIENT
+            )
+            assert FailureClassifier.classify("gibberish") == FailureCategory.UNKNOWN
+        finally:
+            recovery._classify_cached.cache_clear()
+
 
 # ╔══════════════════════════════════════════════════════════════════╗
 # ║  Circuit Breaker — Single Breaker                               ║
@@ -125,6 +161,11 @@ class TestCircuitBreakerConfig:
         assert cfg.success_decay == 1
         assert cfg.per_pair is True
 
+    def test_frozen(self):
+        cfg = CircuitBreakerConfig()
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            cfg.failure_threshold = 5
+
 
 class TestCircuitBreaker:
     def test_starts_closed(self):
@@ -148,6 +189,23 @@ class TestCircuitBreaker:
         time.sleep(0.15)
         assert not cb.is_open()
 
+    def test_failures_outside_window_expire(self):
+        cfg = CircuitBreakerConfig(failure_threshold=2, window_seconds=0.1)
+        cb = CircuitBreaker(cfg)
+        cb.record_failure()
+        time.sleep(0.15)
+        cb.record_failure()
+        assert not cb.is_open()
+        assert cb.snapshot()["global"]["failures"] == 1
+
+    def test_failure_count_bounded_by_window_buckets(self):
+        cfg = CircuitBreakerConfig(failure_threshold=1000, window_seconds=60)
+        cb = CircuitBreaker(cfg)
+        for _ in range(500):
+            cb.record_failure()
+        assert cb.snapshot()["global"]["failures"] == 500
+        assert len(cb._global._buckets) == 10
+
     def test_time_until_reset_zero_when_closed(self):
         cb = CircuitBreaker()
         assert cb.time_until_reset() == 0.0
@@ -158,6 +216,13 @@ class TestCircuitBreaker:
         cb.record_failure()
         assert cb.time_until_reset() > 0
 
+    def test_snapshot_reports_wall_clock_trip_time(self):
+        cfg = CircuitBreakerConfig(failure_threshold=1)
+        cb = CircuitBreaker(cfg)
+        cb.record_failure()
+        tripped_at = cb.snapshot()["global"]["tripped_at"]
+        assert tripped_at == pytest.approx(time.time(), abs=1.0)
+
     def test_manual_trip(self):
         cb = CircuitBreaker()
         cb.trip()
@@ -241,6 +306,25 @@ class TestCircuitBreaker:
 
     # ── half-open probe ───────────────────────────────────────
 
+    def test_concurrent_recording_across_pairs(self):
+        cfg = CircuitBreakerConfig(failure_threshold=10_000, max_drawdown_usd=1e9)
+        cb = CircuitBreaker(cfg)
+        pairs = [f"P{i}/USDT" for i in range(8)]
+
+        def worker(pair):
+            for _ in range(200):
+                cb.record_failure(pair)
+
+        threads = [threading.Thread(target=worker, args=(p,)) for p in pairs]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert cb.snapshot()["global"]["failures"] == 1600
+        for pair in pairs:
+            assert cb.snapshot(pair)["pair"]["failures"] == 200
+
     def test_half_open_transition(self):
         cfg = CircuitBreakerConfig(
             failure_threshold=1,
@@ -335,6 +419,38 @@ class TestReplayProtection:
         time.sleep(0.15)
         assert not rp.is_duplicate(sig)
 
+    def test_expired_entry_ignored_between_sweeps(self):
+        rp = ReplayProtection(
+            ReplayConfig(ttl_seconds=60, max_age_seconds=999, nonce_check=False)
+        )
+        sig = _make_signal()
+        rp.mark_executed(sig)
+        executed_at, hits = rp._executed[sig.signal_id]
+        # expired, but sweep not due yet
+        rp._executed[sig.signal_id] = (executed_at - 61 * 10**9, hits)
+        rp._last_cleanup = time.monotonic_ns()
+        assert not rp.is_duplicate(sig)
+        assert rp.stats["tracked_ids"] == 1
+
+    def test_re_executing_expired_entry_restarts_ttl(self):
+        rp = ReplayProtection(
+            ReplayConfig(ttl_seconds=60, max_age_seconds=999, nonce_check=False)
+        )
+        sig = _make_signal()
+        other = _make_signal()
+        rp.mark_executed(sig)
+        rp.mark_executed(other)
+        executed_at, hits = rp._executed[sig.signal_id]
+        # expired, but sweep not due yet
+        rp._executed[sig.signal_id] = (executed_at - 61 * 10**9, hits)
+        rp._last_cleanup = time.monotonic_ns()
+
+        rp.mark_executed(sig)
+
+        assert rp._executed[sig.signal_id][1] == 0
+        assert list(rp._executed) == [other.signal_id, sig.signal_id]
+        assert rp.is_duplicate(sig)
+
     # ── max-age check ─────────────────────────────────────────
 
     def test_stale_signal_rejected(self):
@@ -404,6 +520,19 @@ class TestReplayProtection:
         assert signals[1].signal_id not in rp._executed
         assert signals[4].signal_id in rp._executed
 
+    def test_eviction_keeps_frequently_hit_entries(self):
+        rp = ReplayProtection(
+            ReplayConfig(max_entries=3, ttl_seconds=999, max_age_seconds=999)
+        )
+        signals = [_make_signal() for _ in range(4)]
+        for sig in signals[:3]:
+            rp.mark_executed(sig)
+        rp.check(signals[0])  # duplicate hit on the oldest entry
+        rp.mark_executed(signals[3])
+
+        assert signals[0].signal_id in rp._executed
+        assert signals[1].signal_id not in rp._executed
+
     # ── audit log ─────────────────────────────────────────────
 
     def test_audit_log_records_checks(self):
@@ -442,6 +571,45 @@ class TestReplayProtection:
         assert stats["audit_accepted"] == 2
         assert stats["audit_rejected"] == 1
 
+    def test_stats_track_audit_window(self):
+        rp = ReplayProtection(ReplayConfig(audit_log_size=2, max_age_seconds=999))
+        sig = _make_signal()
+        rp.check(sig)  # accepted
+        rp.mark_executed(sig)
+        rp.check(sig)  # rejected
+        rp.check(sig)  # rejected; first accept falls out of the log
+        assert rp.stats["audit_accepted"] == 0
+        assert rp.stats["audit_rejected"] == 2
+
+    def test_save_load_roundtrip(self, tmp_path):
+        rp = ReplayProtection()
+        sig = _make_signal()
+        rp.mark_executed(sig)
+        path = tmp_path / "replay.bin"
+        rp.save(path)
+
+        restored = ReplayProtection()
+        assert restored.load(path) == 1
+        assert restored.is_duplicate(sig)
+        assert restored._pair_nonces == rp._pair_nonces
+
+    def test_load_drops_expired_entries(self, tmp_path):
+        rp = ReplayProtection()
+        sig = _make_signal()
+        rp.mark_executed(sig)
+        executed_at, hits = rp._executed[sig.signal_id]
+        rp._executed[sig.signal_id] = (executed_at - 3600 * 10**9, hits)
+        path = tmp_path / "replay.bin"
+        rp.save(path)
+
+        assert ReplayProtection().load(path) == 0
+
+    def test_load_rejects_foreign_file(self, tmp_path):
+        path = tmp_path / "replay.bin"
+        path.write_bytes(b"nope")
+        with pytest.raises(ValueError):
+            ReplayProtection().load(path)
+
 
 # ╔══════════════════════════════════════════════════════════════════╗
 # ║  Recovery Manager                                               ║
@@ -545,6 +713,7 @@ class TestRecoveryManager:
 
         snap = rm.snapshot()
         assert len(snap["recent_outcomes"]) <= 20
+        assert snap["recent_outcomes"][-1]["signal_id"] == sig.signal_id
 
     # ── integration: CB trips after classified failures ───────
 
@@ -562,6 +731,41 @@ class TestRecoveryManager:
         assert not allowed
         assert "circuit breaker" in reason
 
+    def test_pre_flight_batch_matches_single_checks(self):
+        cfg = RecoveryConfig(
+            circuit_breaker=CircuitBreakerConfig(failure_threshold=1),
+        )
+        rm = RecoveryManager(cfg)
+        rm.record_outcome(_make_signal(pair="BTC/USDT"), False, "timeout")
+        rm.circuit_breaker._global._reset()  # leave only the pair breaker open
+        executed = _make_signal()
+        rm.record_outcome(executed, True)
+
+        signals = [_make_signal(), _make_signal(pair="BTC/USDT"), executed]
+        results = rm.pre_flight_batch(signals)
+
+        assert results[0] == (True, "ok")
+        assert results[1] == (False, "circuit breaker open")
+        assert results[2] == (False, "duplicate signal_id")
+
+    def test_trip_alerts_once(self):
+        class _Alerter:
+            def __init__(self):
+                self.trips = []
+
+            def on_circuit_breaker_trip(self, pair, snap):
+                self.trips.append(pair)
+
+        alerter = _Alerter()
+        cfg = RecoveryConfig(
+            circuit_breaker=CircuitBreakerConfig(failure_threshold=2),
+        )
+        rm = RecoveryManager(cfg, alerter=alerter)
+        for _ in range(4):
+            rm.record_outcome(_make_signal(), False, "timeout")
+
+        assert alerter.trips == ["ETH/USDT"]
+
     def test_cb_trips_on_drawdown(self):
         cfg = RecoveryConfig(
             circuit_breaker=CircuitBreakerConfig(
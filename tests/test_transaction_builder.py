@@ -2,6 +2,7 @@ from dataclasses import dataclass
 
 import pytest
 
+from chain.client import GasPrice
 from chain.transaction_builder import TransactionBuilder
 from core.base_types import Address, TokenAmount, TransactionReceipt
 
@@ -94,3 +95,25 @@ def test_builder_gas_estimate_buffer():
 
     tx = builder.with_gas_price("medium").build()
     assert tx.gas_limit == 31500
+
+
+def test_builder_uses_supplied_gas_snapshot():
+    class _NoGasClient(_FakeClient):
+        def get_gas_price(self):
+            raise AssertionError("should not hit RPC")
+
+    gas = GasPrice(
+        base_fee=100, priority_fee_low=1, priority_fee_medium=2, priority_fee_high=3
+    )
+    tx = (
+        TransactionBuilder(
+            _NoGasClient(), _FakeWallet("0x000000000000000000000000000000000000dead")
+        )
+        .to(Address.from_string("0x000000000000000000000000000000000000dead"))
+        .value(TokenAmount.from_human("0.1", 18, "ETH"))
+        .gas_limit(21000)
+        .with_gas_price("high", gas=gas)
+        .build()
+    )
+    assert tx.max_priority_fee == 3
+    assert tx.max_fee_per_gas == gas.get_max_fee("high")
@@ -86,3 +86,30 @@ def test_swap_is_immutable():
 
     assert new_pair.reserve0 == original_reserve0 + amount_in
     assert new_pair.reserve1 == original_reserve1 - amount_out
+
+
+def test_quote_and_swap_out_matches_two_calls():
+    pair = _make_pair(reserve0=1000 * 10**18, reserve1=2_000_000 * 10**6)
+    amount_in = 2000 * 10**6
+
+    amount_out, new_pair = pair.quote_and_swap_out(amount_in, USDC)
+
+    assert amount_out == pair.get_amount_out(amount_in, USDC)
+    assert amount_out == 996006981039903216
+    assert new_pair.reserve0 == 1000 * 10**18 - 996006981039903216
+    assert new_pair.reserve1 == 2_000_000 * 10**6 + amount_in
+    assert (pair.reserve0, pair.reserve1) == (1000 * 10**18, 2_000_000 * 10**6)
+
+
+def test_quote_and_swap_in_matches_two_calls():
+    pair = _make_pair(reserve0=1000 * 10**18, reserve1=2_000_000 * 10**6)
+    amount_out = 1 * 10**18
+
+    amount_in, new_pair = pair.quote_and_swap_in(amount_out, ETH)
+
+    # get_amount_in rounds up, so the pool releases a little more than asked.
+    assert amount_in == pair.get_amount_in(amount_out, ETH)
+    assert amount_in == 2008026081
+    assert new_pair.reserve0 == 1000 * 10**18 - 1000000000376744378
+    assert new_pair.reserve1 == 2_000_000 * 10**6 + 2008026081
+    assert pair.reserve0 - new_pair.reserve0 >= amount_out